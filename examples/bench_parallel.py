@@ -0,0 +1,30 @@
+import argparse
+from os import cpu_count
+from time import perf_counter
+from x25519 import X25519, ParallelX25519
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel X25519 key agreement throughput (keys/second vs worker count)")
+    parser.add_argument('--keys', type=int, default=2048, help='Number of key agreements per run')
+    parser.add_argument('--chunk-size', type=int, default=256, help='Number of keys per task sent to a worker')
+    parser.add_argument('--max-workers', type=int, default=cpu_count() or 1, help='Largest worker count to measure')
+    args = parser.parse_args()
+
+    x25519_instance = X25519()
+    sks = [x25519_instance.generate_private_key() for _ in range(args.keys)]
+    pks = x25519_instance.x25519_base_batch([x25519_instance.generate_private_key() for _ in range(args.keys)])
+
+    workers = 1
+    baseline = None
+    print(f"{'workers':>8} {'keys/s':>12} {'speedup':>8}")
+    while workers <= args.max_workers:
+        with ParallelX25519(workers=workers, chunk_size=args.chunk_size) as parallel:
+            parallel.x25519_base_batch(sks[:workers]) # Warm up the workers (process start-up, fixed-base table)
+
+            start = perf_counter()
+            parallel.x25519_batch(sks, pks)
+            rate = args.keys / (perf_counter() - start)
+
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>12.1f} {rate / baseline:>7.2f}x")
+        workers *= 2
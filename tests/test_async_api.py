@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+from x25519 import X25519, AsyncX25519
+
+class TestAsyncX25519(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519()
+        self.sks = [self.x25519_ladder.generate_private_key() for _ in range(10)]
+        self.pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(10)]
+
+    def test_concurrent_requests_are_batched(self):
+        async def run():
+            async_x25519 = AsyncX25519(max_batch_size=4)
+            shared = asyncio.gather(*(async_x25519.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)))
+            public = asyncio.gather(*(async_x25519.x25519_base(sk) for sk in self.sks))
+            return await shared, await public, async_x25519.batches_run
+
+        shared, public, batches_run = asyncio.run(run())
+        self.assertEqual(shared, [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)])
+        self.assertEqual(public, [self.x25519_ladder.x25519_base(sk) for sk in self.sks])
+        # 10 requests of each kind with at most 4 per batch: 3 batches each
+        self.assertEqual(batches_run, 6)
+
+    def test_generate_keypair(self):
+        async def run():
+            return await AsyncX25519().generate_keypair()
+
+        sk, pk = asyncio.run(run())
+        self.assertEqual(pk, self.x25519_ladder.derive_public_key(sk))
+
+    def test_failures_are_isolated(self):
+        # A peer key that makes the ladder fail must only fail its own request, not the whole batch
+        async def run():
+            async_x25519 = AsyncX25519()
+            return await asyncio.gather(
+                async_x25519.x25519(self.sks[0], self.pks[0]),
+                async_x25519.x25519(self.sks[1], bytes(32)),
+                return_exceptions=True,
+            )
+
+        good, bad = asyncio.run(run())
+        self.assertEqual(good, self.x25519_ladder.x25519(self.sks[0], self.pks[0]))
+        self.assertIsInstance(bad, ValueError)
+
+    def test_invalid_input(self):
+        async def run():
+            await AsyncX25519().x25519(b'\x11' * 31, self.pks[0])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+        with self.assertRaises(ValueError):
+            AsyncX25519(max_in_flight=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from x25519 import X25519, X25519Algorithm
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.x25519_double_and_add = X25519(X25519Algorithm.DOUBLE_AND_ADD)
+        self.runs = 8 # Number of keys per batch
+
+    """
+    Batched calls must return exactly what the corresponding single calls return, in input order.
+    """
+    def test_x25519_base_batch_matches_single(self):
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(self.runs)]
+        expected = [self.x25519_ladder.x25519_base(sk) for sk in sks]
+        self.assertEqual(self.x25519_ladder.x25519_base_batch(sks), expected)
+        self.assertEqual(self.x25519_double_and_add.x25519_base_batch(sks[:2]), expected[:2])
+
+    def test_x25519_batch_matches_single(self):
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(self.runs)]
+        pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(self.runs)]
+        expected = [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(sks, pks)]
+        self.assertEqual(self.x25519_ladder.x25519_batch(sks, pks), expected)
+        self.assertEqual(self.x25519_double_and_add.x25519_batch(sks[:2], pks[:2]), expected[:2])
+
+    def test_rfc7748_vector_in_batch(self):
+        k = bytes.fromhex("a546e36bf0527c9d3b16154b82465edd62144c0ac1fc5a18506a2244ba449ac4")
+        u = bytes.fromhex("e6db6867583030db3594c1a424b15f7c726624ec26b3353b10a903a6d0ab1c4c")
+        expected = bytes.fromhex("c3da55379de9c6908e94ea4df28d084f32eccf03491c71f754b4075577a28552")
+        self.assertEqual(self.x25519_ladder.x25519_batch([k, k], [u, u]), [expected, expected])
+
+    def test_empty_batch(self):
+        self.assertEqual(self.x25519_ladder.x25519_batch([], []), [])
+        self.assertEqual(self.x25519_ladder.x25519_base_batch([]), [])
+
+    def test_invalid_batch(self):
+        # Mismatched batch sizes and wrongly sized keys raise ValueError like the single-key API
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_batch([b'\x11' * 32], [])
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_batch([b'\x11' * 32], [b'\x22' * 31])
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_base_batch([b'\x11' * 32, b'\x11' * 33])
+
+if __name__ == "__main__":
+    unittest.main()
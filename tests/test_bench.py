@@ -0,0 +1,37 @@
+import json
+import os
+import tempfile
+import unittest
+from x25519.bench import Benchmark, all_benchmarks, compare, load_report, run_benchmark, run_suite, save_report
+
+class TestBench(unittest.TestCase):
+    def _report(self, rates: dict) -> dict:
+        return {"results": {name: {"ops_per_sec": rate} for name, rate in rates.items()}}
+
+    def test_run_benchmark(self):
+        result = run_benchmark(Benchmark("noop", lambda: None, ops=4), repeat=3, min_time=0.001)
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertLessEqual(result["min_s"], result["sample_p50_s"])
+        self.assertLessEqual(result["sample_p50_s"], result["sample_p99_s"])
+        self.assertEqual(result["ops_per_call"], 4)
+
+    def test_report_round_trip(self):
+        report = run_suite([Benchmark("noop", lambda: None)], repeat=2, min_time=0.001)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            save_report(report, path)
+            self.assertEqual(load_report(path), json.loads(json.dumps(report)))
+
+    def test_compare(self):
+        baseline = self._report({"a": 100.0, "b": 100.0, "c": 100.0})
+        current = self._report({"a": 95.0, "b": 80.0, "d": 1.0})
+        # Only "b" dropped by more than 10%; "c" was not run and "d" has no baseline
+        self.assertEqual(compare(current, baseline, threshold=0.1), [("b", 100.0, 80.0)])
+        self.assertEqual(compare(current, baseline, threshold=0.25), [])
+
+    def test_benchmark_names_unique(self):
+        names = [bench.name for bench in all_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+if __name__ == "__main__":
+    unittest.main()
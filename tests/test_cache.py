@@ -0,0 +1,80 @@
+import unittest
+from x25519 import X25519, SharedSecretCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestSharedSecretCache(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519()
+        self.sk = self.x25519_ladder.generate_private_key()
+        self.pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(4)]
+
+    def test_hits_and_misses(self):
+        cache = SharedSecretCache()
+        for _ in range(3):
+            for pk in self.pks:
+                self.assertEqual(cache.x25519(self.sk, pk), self.x25519_ladder.x25519(self.sk, pk))
+        self.assertEqual((cache.hits, cache.misses), (8, 4))
+        # Another private key with the same peer is a different entry
+        cache.x25519(self.x25519_ladder.generate_private_key(), self.pks[0])
+        self.assertEqual(cache.misses, 5)
+        self.assertEqual(len(cache), 5)
+
+    def test_lru_eviction_wipes_secrets(self):
+        cache = SharedSecretCache(max_entries=2)
+        cache.x25519(self.sk, self.pks[0])
+        cache.x25519(self.sk, self.pks[1])
+        evicted = cache._entries[(cache.fingerprint(self.sk), self.pks[0])][0]
+        cache.x25519(self.sk, self.pks[2]) # pks[0] is the least recently used
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(evicted, bytearray(32)) # overwritten on eviction
+        cache.x25519(self.sk, self.pks[1])
+        self.assertEqual(cache.hits, 1)
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = SharedSecretCache(ttl=10, clock=clock)
+        cache.x25519(self.sk, self.pks[0])
+        clock.now = 9
+        cache.x25519(self.sk, self.pks[0])
+        clock.now = 11
+        cache.x25519(self.sk, self.pks[0])
+        self.assertEqual((cache.hits, cache.misses, cache.expirations), (1, 2, 1))
+
+    def test_size_cap_and_invalidation(self):
+        cache = SharedSecretCache()
+        cache.x25519(self.sk, self.pks[0])
+        entry_size = cache.size_bytes
+        capped = SharedSecretCache(max_bytes=2 * entry_size)
+        for pk in self.pks:
+            capped.x25519(self.sk, pk)
+        self.assertEqual(len(capped), 2)
+        self.assertLessEqual(capped.size_bytes, 2 * entry_size)
+
+        capped.invalidate(self.pks[3])
+        self.assertEqual(len(capped), 1)
+        capped.clear()
+        self.assertEqual(capped.stats()["entries"], 0)
+        self.assertEqual(capped.size_bytes, 0)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            SharedSecretCache(max_entries=0)
+        with self.assertRaises(ValueError):
+            SharedSecretCache(ttl=0)
+        with self.assertRaises(ValueError):
+            SharedSecretCache().x25519(self.sk, self.pks[0][:31])
+        # Errors of the underlying API are not cached
+        cache = SharedSecretCache(X25519(validate=True))
+        with self.assertRaises(ValueError):
+            cache.x25519(self.sk, bytes(32))
+        self.assertEqual(len(cache), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from x25519 import X25519
+from x25519.cli import RecordReader, main
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.x25519_ladder = X25519()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.tmp.name, name)
+
+    def _read(self, name: str) -> list[bytes]:
+        with open(self._path(name), "rb") as f:
+            data = f.read()
+        return [data[i:i + 32] for i in range(0, len(data), 32)]
+
+    def test_keygen_pubkey_agree(self):
+        self.assertEqual(main(["keygen", "--count", "5", "--chunk-size", "2", "-o", self._path("alice_sk")]), 0)
+        self.assertEqual(main(["keygen", "--count", "5", "-o", self._path("bob_sk")]), 0)
+        alice_sks = self._read("alice_sk")
+        self.assertEqual(len(alice_sks), 5)
+        self.assertEqual(len(set(alice_sks)), 5)
+
+        for name in ["alice", "bob"]:
+            self.assertEqual(main(["pubkey", self._path(f"{name}_sk"), "--chunk-size", "3", "-o", self._path(f"{name}_pk")]), 0)
+        self.assertEqual(self._read("alice_pk"), [self.x25519_ladder.derive_public_key(sk) for sk in alice_sks])
+
+        # Both sides of every pair derive the same shared secret, whatever the chunking
+        self.assertEqual(main(["agree", self._path("alice_sk"), self._path("bob_pk"), "--chunk-size", "2", "-o", self._path("alice_ss")]), 0)
+        self.assertEqual(main(["agree", self._path("bob_sk"), self._path("alice_pk"), "-o", self._path("bob_ss")]), 0)
+        self.assertEqual(self._read("alice_ss"), self._read("bob_ss"))
+
+    def test_record_reader_chunks(self):
+        with open(self._path("records"), "wb") as f:
+            f.write(bytes(range(32)) * 5)
+        with RecordReader(self._path("records")) as reader:
+            self.assertEqual([len(chunk) for chunk in reader.chunks(2)], [64, 64, 32])
+
+        open(self._path("empty"), "wb").close()
+        with RecordReader(self._path("empty")) as reader:
+            self.assertEqual(list(reader.chunks(2)), [])
+
+    def _feed_fifo(self, name: str, data: bytes) -> threading.Thread:
+        path = self._path(name)
+        os.mkfifo(path)
+
+        def feed():
+            with open(path, "wb") as f:
+                f.write(data)
+
+        writer = threading.Thread(target=feed)
+        writer.start()
+        return writer
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "FIFOs are not available")
+    def test_pipe_input(self):
+        # A pipe reports a size of 0: its records must be streamed, not skipped
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(5)]
+        writer = self._feed_fifo("sk_fifo", b"".join(sks))
+        self.assertEqual(main(["pubkey", self._path("sk_fifo"), "--chunk-size", "2", "-o", self._path("pk")]), 0)
+        writer.join()
+        self.assertEqual(self._read("pk"), [self.x25519_ladder.derive_public_key(sk) for sk in sks])
+
+        writer = self._feed_fifo("partial_fifo", bytes(33))
+        with redirect_stderr(StringIO()):
+            self.assertEqual(main(["pubkey", self._path("partial_fifo"), "-o", self._path("pk")]), 1)
+        writer.join()
+
+    def test_invalid_inputs(self):
+        with open(self._path("partial"), "wb") as f:
+            f.write(bytes(33))
+        with open(self._path("one"), "wb") as f:
+            f.write(bytes(32))
+        with open(self._path("two"), "wb") as f:
+            f.write(bytes(64))
+
+        with redirect_stderr(StringIO()):
+            self.assertEqual(main(["pubkey", self._path("partial"), "-o", self._path("out")]), 1)
+            self.assertEqual(main(["agree", self._path("one"), self._path("two"), "-o", self._path("out")]), 1)
+            self.assertEqual(main(["agree", self._path("two"), self._path("one"), "-o", self._path("out")]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
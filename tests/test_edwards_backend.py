@@ -0,0 +1,61 @@
+import os
+import unittest
+from x25519 import X25519, X25519Algorithm
+from x25519.defaults import D, p
+from x25519.edwards import TWIST_A, TWIST_D, montgomery_u_to_edwards
+from x25519.encoding import decode_scalar, decode_x_coordinate
+from x25519.field import fdiv
+from x25519.methods import edwards_mult, montgomery_ladder
+
+class TestEdwardsBackend(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.x25519_edwards = X25519(X25519Algorithm.EDWARDS)
+        self.runs = 10 # Number of iterations for random tests
+
+    def test_map_to_edwards(self):
+        # Random u-coordinates land on edwards25519 or, for points of the twist, on -2x^2 + y^2 = 1 + 2dx^2y^2
+        curves = set()
+        for _ in range(4 * self.runs):
+            u = decode_x_coordinate(os.urandom(32))
+            (X, Y, Z, T), a, d = montgomery_u_to_edwards(u)
+            x, y = fdiv(X, Z), fdiv(Y, Z)
+            self.assertEqual((a * x * x + y * y - 1 - d * x * x % p * y * y) % p, 0)
+            self.assertEqual(X * Y % p, T * Z % p)
+            self.assertEqual(fdiv(1 + y, 1 - y), u)
+            curves.add((a, d))
+        self.assertEqual(curves, {(-1, D), (TWIST_A, TWIST_D)})
+
+        for u in [0, p - 1]:
+            with self.assertRaises(ValueError):
+                montgomery_u_to_edwards(u)
+
+    def test_matches_ladder(self):
+        for w in [2, 4, 5]:
+            for k in range(1, 20):
+                self.assertEqual(edwards_mult(k, 9, w), montgomery_ladder(k, 9))
+            for _ in range(self.runs):
+                x = decode_x_coordinate(os.urandom(32)) # on the curve or on the twist
+                k = decode_scalar(os.urandom(32))
+                self.assertEqual(edwards_mult(k, x, w), montgomery_ladder(k, x))
+                k = int.from_bytes(os.urandom(32), "little") # unclamped, the ladder ignores bit 255
+                self.assertEqual(edwards_mult(k, x, w), montgomery_ladder(k, x))
+
+        # Small-order inputs fail like the ladder does
+        for x in [0, p - 1]:
+            with self.assertRaises(ValueError):
+                montgomery_ladder(8, x)
+            with self.assertRaises(ValueError):
+                edwards_mult(8, x)
+
+    def test_api_matches_ladder(self):
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(self.runs)]
+        pks = [os.urandom(32) for _ in range(self.runs)]
+        for sk, pk in zip(sks, pks):
+            self.assertEqual(self.x25519_edwards.x25519_base(sk), self.x25519_ladder.x25519_base(sk))
+            self.assertEqual(self.x25519_edwards.x25519(sk, pk), self.x25519_ladder.x25519(sk, pk))
+        self.assertEqual(self.x25519_edwards.x25519_batch(sks, pks), self.x25519_ladder.x25519_batch(sks, pks))
+        self.assertEqual(self.x25519_edwards.x25519_base_batch(sks), self.x25519_ladder.x25519_base_batch(sks))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from x25519.defaults import p
-from x25519.encoding import decode_little_endian, encode_x_coordinate, decode_x_coordinate, decode_scalar
+import os
+from x25519.encoding import decode_little_endian, encode_x_coordinate, decode_x_coordinate, decode_scalar, clamp_scalar
+from x25519.encoding import decode_x_coordinates, decode_scalars, clamp_scalars, encode_x_coordinates, encode_scalars
 
 class TestEncoding(unittest.TestCase):    
     def test_decode_x_coordinate_mask_msb(self):
@@ -44,5 +46,29 @@ class TestEncoding(unittest.TestCase):
         test_scalar[31] = 0x40
         self.assertEqual(decode_scalar(bytes(test_scalar)), decode_little_endian(bytes(test_scalar)))
 
+    def test_clamp_scalar(self):
+        # Clamping fixes exactly the three low bits and the two high bits of the last byte
+        clamped = clamp_scalar(b'\xff' * 32)
+        self.assertEqual(clamped, b'\xf8' + b'\xff' * 30 + b'\x7f')
+        self.assertEqual(clamp_scalar(bytes(32)), bytes(31) + b'\x40')
+        self.assertEqual(decode_little_endian(clamped), decode_scalar(b'\xff' * 32))
+
+    def test_bulk_codecs_match_single(self):
+        # Bulk functions over a packed arena must match the per-key functions, for any buffer type
+        keys = [os.urandom(32) for _ in range(5)] + [b'\xff' * 32]
+        arena = b"".join(keys)
+        for buf in [arena, bytearray(arena), memoryview(arena)]:
+            self.assertEqual(decode_x_coordinates(buf), [decode_x_coordinate(k) for k in keys])
+            self.assertEqual(decode_scalars(buf), [decode_scalar(k) for k in keys])
+            self.assertEqual(clamp_scalars(buf), b"".join(clamp_scalar(k) for k in keys))
+
+        xs = [decode_x_coordinate(k) for k in keys] + [p, p + 5]
+        self.assertEqual(encode_x_coordinates(xs), b"".join(encode_x_coordinate(x) for x in xs))
+        self.assertEqual(encode_scalars(decode_scalars(arena)), clamp_scalars(arena))
+
+        self.assertEqual(decode_scalars(b""), [])
+        with self.assertRaises(ValueError):
+            decode_x_coordinates(bytes(33))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
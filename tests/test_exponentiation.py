@@ -0,0 +1,36 @@
+import unittest
+from random import randrange
+from x25519.defaults import p
+from x25519.exponentiation import SQRT_M1, inv_sqrt, pow_inverse, pow_p38, pow_p58, sqrt_ratio
+
+class TestExponentiation(unittest.TestCase):
+    def setUp(self):
+        self.values = [1, 2, 9, p - 1, p + 3] + [randrange(1, p) for _ in range(10)]
+
+    def test_sqrt_m1(self):
+        self.assertEqual(SQRT_M1, pow(2, (p - 1) // 4, p))
+        self.assertEqual(SQRT_M1 * SQRT_M1 % p, p - 1)
+
+    def test_chains_match_pow(self):
+        # Each addition chain must agree with the generic modular exponentiation
+        for a in self.values:
+            self.assertEqual(pow_inverse(a), pow(a, p - 2, p))
+            self.assertEqual(pow_p58(a), pow(a, (p - 5) // 8, p))
+            self.assertEqual(pow_p38(a), pow(a, (p + 3) // 8, p))
+        self.assertEqual(pow_inverse(0), 0)
+
+    def test_sqrt_ratio(self):
+        for u in self.values:
+            for v in self.values[:5]:
+                is_square, r = sqrt_ratio(u, v)
+                # u/v is a square exactly when its Legendre symbol is 1
+                self.assertEqual(is_square, pow(u * pow(v, p - 2, p) % p, (p - 1) // 2, p) == 1)
+                if is_square:
+                    self.assertEqual(v * r * r % p, u % p)
+
+        is_square, r = inv_sqrt(4)
+        self.assertTrue(is_square)
+        self.assertEqual(4 * r * r % p, 1)
+
+if __name__ == "__main__":
+    unittest.main()
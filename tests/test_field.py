@@ -2,7 +2,7 @@ import unittest
 from random import random
 from typing import Callable
 from x25519.defaults import p
-from x25519.field import fadd, fmul, fsub, finv
+from x25519.field import fadd, fmul, fsub, finv, batch_inv
 
 class TestFieldOperations(unittest.TestCase):
     def test_fadd(self):
@@ -72,5 +72,15 @@ class TestFieldOperations(unittest.TestCase):
             c = int(random() * (p - 1)) + 1
             self._test_abelian_group_operator(a, b, c, fmul, 1, finv(a))
 
+    def test_batch_inv(self):
+        # Simultaneous inversion must agree with inverting each element separately
+        values = [int(random() * (p - 1)) + 1 for _ in range(10)] + [1, p - 1, p + 2]
+        self.assertEqual(batch_inv(values), [finv(a) for a in values])
+        self.assertEqual(batch_inv([]), [])
+
+        # Zero has no inverse, even when it is hidden in a batch
+        with self.assertRaises(ValueError):
+            batch_inv([3, 0, 5])
+
 if __name__ == "__main__":
     unittest.main()
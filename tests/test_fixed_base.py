@@ -0,0 +1,49 @@
+import os
+import unittest
+from x25519 import X25519, X25519Algorithm
+from x25519.defaults import BASE_X, L
+from x25519.encoding import decode_scalar
+from x25519.fixed_base import fixed_base_mult, signed_digits
+from x25519.methods import montgomery_ladder
+
+class TestFixedBase(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.runs = 20 # Number of iterations for random tests
+
+    def test_signed_digits(self):
+        # Recoding must be exact and every digit must be a valid table index (|e| <= 8)
+        for k in [0, 1, 8, 15, 16, L - 1, 2**253 - 1]:
+            digits = signed_digits(k)
+            self.assertEqual(sum(e * 16**i for i, e in enumerate(digits)), k)
+            self.assertTrue(all(-8 <= e <= 8 for e in digits))
+
+    def test_matches_ladder_small_scalars(self):
+        for k in [1, 2, 3, 8, 9, 16, 255]:
+            self.assertEqual(fixed_base_mult(k), montgomery_ladder(k, BASE_X))
+
+    def test_matches_ladder_random_scalars(self):
+        for _ in range(self.runs):
+            k = decode_scalar(os.urandom(32))
+            self.assertEqual(fixed_base_mult(k), montgomery_ladder(k, BASE_X))
+
+    def test_scalars_above_255_bits(self):
+        # The ladder ignores bit 255 and above, and so must the fixed-base path
+        for k in [2**255 + 40, 2**256 - 1, 2**300 + 9]:
+            self.assertEqual(fixed_base_mult(k), montgomery_ladder(k, BASE_X))
+        self.assertEqual(self.x25519_ladder.scalar_mult_base(2**255 + 40), self.x25519_ladder.scalar_mult(2**255 + 40, BASE_X))
+
+    def test_rfc7748_public_keys(self):
+        # Public keys from RFC 7748 Section 6.1 are derived through the fixed-base path
+        alice_sk = bytes.fromhex("77076d0a7318a57d3c16c17251b26645df4c2f87ebc0992ab177fba51db92c2a")
+        bob_sk = bytes.fromhex("5dab087e624a8a4b79e17f8b83800ee66f3bb1292618b6fd1c2f8b27ff88e0eb")
+        self.assertEqual(self.x25519_ladder.derive_public_key(alice_sk).hex(), "8520f0098930a754748b7ddcb43ef75a0dbf3a0d26381af4eba4a98eaa9b4e6a")
+        self.assertEqual(self.x25519_ladder.derive_public_key(bob_sk).hex(), "de9edb7d7b7dc1b4d35b61c2ece435373f8343c85b78674dadfc7e146f882b4f")
+
+    def test_multiple_of_group_order(self):
+        # k*B is the identity, which has no u-coordinate; the ladder raises ValueError here as well
+        with self.assertRaises(ValueError):
+            fixed_base_mult(L)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 from x25519.defaults import BASE_X, BASE_Y
 from x25519.point import Point, INF
-from x25519.group_law import point_addition, point_doubling
+from x25519.group_law import point_addition, point_doubling, PROJECTIVE_INF, to_projective, from_projective, projective_point_addition, projective_point_doubling
 
 """
 Unit tests for group law operations on Curve25519.
@@ -30,5 +30,25 @@ class TestGroupLaw(unittest.TestCase):
         Q = point_doubling(self.Pt) # Note: the constructor ensures validity itself so no need to explicitly call `is_valid()`
         self.assertIsNotNone(Q)
 
+    def test_projective_matches_affine(self):
+        # Projective formulas must agree with the affine ones after conversion back
+        P2 = point_doubling(self.Pt)
+        P3 = point_addition(P2, self.Pt)
+        self.assertEqual(from_projective(projective_point_doubling(to_projective(self.Pt))), P2)
+        self.assertEqual(from_projective(projective_point_addition(to_projective(P2), to_projective(self.Pt))), P3)
+
+        # Inputs with Z != 1 represent the same points
+        X, Y, Z = to_projective(P2)
+        P2_scaled = (X * 7, Y * 7, Z * 7)
+        self.assertEqual(from_projective(projective_point_addition(P2_scaled, to_projective(self.Pt))), P3)
+        self.assertEqual(from_projective(projective_point_addition(P2_scaled, P2_scaled)), point_doubling(P2))
+
+    def test_projective_identity_and_inverse(self):
+        P = to_projective(self.Pt)
+        self.assertEqual(projective_point_addition(P, PROJECTIVE_INF), P)
+        self.assertEqual(projective_point_addition(PROJECTIVE_INF, P), P)
+        self.assertEqual(from_projective(projective_point_addition(P, to_projective(Point(BASE_X, -BASE_Y)))), INF)
+        self.assertEqual(from_projective(PROJECTIVE_INF), INF)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import random
+import unittest
+from x25519 import X25519, Instrumentation
+from x25519.instrumentation import SUB_BUCKET_BITS, LatencyHistogram
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_bucket_ranges_contain_their_values(self):
+        rng = random.Random(0)
+        values = list(range(1024)) + [rng.getrandbits(rng.randint(10, 40)) for _ in range(2000)]
+        for value in values:
+            low, high = LatencyHistogram.bucket_range(LatencyHistogram.bucket_index(value))
+            self.assertLessEqual(low, value)
+            self.assertLessEqual(value, high)
+            # relative precision of one sub-bucket
+            self.assertLessEqual(high - low, max(value >> (SUB_BUCKET_BITS - 1), 0) + 1)
+
+    def test_bucket_index_is_monotonic(self):
+        indices = [LatencyHistogram.bucket_index(v) for v in range(1 << 14)]
+        self.assertEqual(indices, sorted(indices))
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.min, 1000)
+        self.assertEqual(histogram.max, 1000000)
+        for q, expected in ((50, 500000), (99, 990000), (99.9, 999000), (100, 1000000)):
+            self.assertAlmostEqual(histogram.percentile(q), expected, delta=expected / (1 << (SUB_BUCKET_BITS - 1)))
+        with self.assertRaises(ValueError):
+            histogram.percentile(101)
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().percentile(99), 0)
+        self.assertEqual(LatencyHistogram().snapshot()["count"], 0)
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.x25519 = X25519()
+        self.sk = self.x25519.generate_private_key()
+        self.pk = self.x25519.derive_public_key(self.x25519.generate_private_key())
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.x25519.instrumentation)
+        self.assertNotIn("x25519", vars(self.x25519))
+
+    def test_counts_calls(self):
+        instrumentation = self.x25519.enable_instrumentation()
+        self.x25519.generate_private_key()
+        self.x25519.x25519(self.sk, self.pk)
+        self.x25519.x25519(self.sk, self.pk)
+        self.x25519.derive_public_key(self.sk) # also records the x25519_base call it makes
+        snapshot = instrumentation.snapshot()
+        self.assertEqual({name: stats["calls"] for name, stats in snapshot.items()},
+                         {"generate_private_key": 1, "x25519": 2, "derive_public_key": 1, "x25519_base": 1})
+        stats = snapshot["x25519"]
+        self.assertEqual(stats["errors"], 0)
+        self.assertTrue(0 < stats["min_ns"] <= stats["p50_ns"] <= stats["p99_ns"] <= stats["p999_ns"] <= stats["max_ns"])
+
+    def test_results_unchanged(self):
+        expected = self.x25519.x25519(self.sk, self.pk)
+        self.x25519.enable_instrumentation()
+        self.assertEqual(self.x25519.x25519(self.sk, self.pk), expected)
+
+    def test_errors_are_recorded_and_raised(self):
+        instrumentation = self.x25519.enable_instrumentation()
+        with self.assertRaises(ValueError):
+            self.x25519.x25519(self.sk, bytes(31))
+        self.assertEqual(instrumentation.snapshot()["x25519"]["errors"], 1)
+
+    def test_span_callbacks(self):
+        spans = []
+        def callback(name, start_ns, end_ns, error):
+            spans.append((name, end_ns >= start_ns, error))
+
+        instrumentation = self.x25519.enable_instrumentation()
+        instrumentation.add_span_callback(callback)
+        self.x25519.x25519(self.sk, self.pk)
+        with self.assertRaises(ValueError):
+            self.x25519.x25519_base(bytes(1))
+        instrumentation.remove_span_callback(callback)
+        self.x25519.x25519(self.sk, self.pk)
+
+        self.assertEqual([(name, ordered) for name, ordered, _ in spans], [("x25519", True), ("x25519_base", True)])
+        self.assertIsNone(spans[0][2])
+        self.assertIsInstance(spans[1][2], ValueError)
+
+    def test_disable_restores_methods(self):
+        instrumentation = self.x25519.enable_instrumentation()
+        self.x25519.x25519_base(self.sk)
+        self.x25519.disable_instrumentation()
+        self.x25519.x25519_base(self.sk)
+        self.assertIsNone(self.x25519.instrumentation)
+        self.assertNotIn("x25519_base", vars(self.x25519))
+        self.assertEqual(instrumentation.snapshot()["x25519_base"]["calls"], 1)
+
+    def test_shared_between_instances(self):
+        instrumentation = Instrumentation()
+        other = X25519()
+        self.x25519.enable_instrumentation(instrumentation)
+        other.enable_instrumentation(instrumentation)
+        self.x25519.x25519_base(self.sk)
+        other.x25519_base(self.sk)
+        self.assertEqual(instrumentation.snapshot()["x25519_base"]["calls"], 2)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import mmap
+import unittest
+from x25519 import X25519, X25519Algorithm
+from x25519.encoding import encode_x_coordinate, encode_x_coordinate_into, encode_x_coordinates_into
+
+class TestInto(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.runs = 6 # Number of keys per batch
+        self.sks = [self.x25519_ladder.generate_private_key() for _ in range(self.runs)]
+        self.pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(self.runs)]
+
+    """
+    The *_into variants must write exactly what the corresponding calls return, and nothing else.
+    """
+    def test_x25519_into_matches_x25519(self):
+        out = bytearray(b"\xff" * 40)
+        self.x25519_ladder.x25519_into(self.sks[0], self.pks[0], out, 4)
+        self.assertEqual(bytes(out[4:36]), self.x25519_ladder.x25519(self.sks[0], self.pks[0]))
+        self.assertEqual(bytes(out[:4] + out[36:]), b"\xff" * 8)
+
+    def test_x25519_base_into_matches_x25519_base(self):
+        for algorithm in X25519Algorithm:
+            if algorithm == X25519Algorithm.VECTORIZED:
+                continue
+            out = bytearray(32)
+            X25519(algorithm).x25519_base_into(self.sks[0], out)
+            self.assertEqual(bytes(out), self.x25519_ladder.x25519_base(self.sks[0]))
+
+    def test_memoryview_inputs_and_outputs(self):
+        recv = b"".join(sk + pk for sk, pk in zip(self.sks, self.pks))
+        view = memoryview(recv)
+        send = bytearray(32 * self.runs)
+        for i in range(self.runs):
+            self.x25519_ladder.x25519_into(view[64 * i:64 * i + 32], view[64 * i + 32:64 * i + 64], memoryview(send)[32 * i:])
+        self.assertEqual(bytes(send), b"".join(self.x25519_ladder.x25519_batch(self.sks, self.pks)))
+
+    def test_batch_into_matches_batch(self):
+        for algorithm in (X25519Algorithm.LADDER, X25519Algorithm.DOUBLE_AND_ADD, X25519Algorithm.EDWARDS):
+            x25519 = X25519(algorithm)
+            out = bytearray(8 + 32 * self.runs)
+            x25519.x25519_batch_into(self.sks, self.pks, out, 8)
+            self.assertEqual(bytes(out[8:]), b"".join(self.x25519_ladder.x25519_batch(self.sks, self.pks)))
+
+            out = bytearray(32 * self.runs)
+            x25519.x25519_base_batch_into(self.sks, out)
+            self.assertEqual(bytes(out), b"".join(self.x25519_ladder.x25519_base_batch(self.sks)))
+
+    def test_stride_interleaves_results(self):
+        # e.g. length-prefixed frames: 4-byte header, then the 32-byte key
+        out = bytearray(36 * self.runs)
+        self.x25519_ladder.x25519_base_batch_into(self.sks, out, offset=4, stride=36)
+        for i, pk in enumerate(self.x25519_ladder.x25519_base_batch(self.sks)):
+            self.assertEqual(bytes(out[36 * i:36 * i + 4]), bytes(4))
+            self.assertEqual(bytes(out[36 * i + 4:36 * i + 36]), pk)
+
+    def test_mmap_output(self):
+        with mmap.mmap(-1, 32 * self.runs) as out:
+            self.x25519_ladder.x25519_batch_into(self.sks, self.pks, out)
+            self.assertEqual(out[:], b"".join(self.x25519_ladder.x25519_batch(self.sks, self.pks)))
+
+    def test_validation(self):
+        x25519_validating = X25519(validate=True)
+        with self.assertRaises(ValueError):
+            x25519_validating.x25519_into(self.sks[0], bytes(32), bytearray(32))
+        with self.assertRaises(ValueError):
+            x25519_validating.x25519_batch_into(self.sks[:2], [self.pks[0], bytes(32)], bytearray(64))
+
+    def test_invalid_buffers(self):
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_base_into(self.sks[0], bytes(32)) # read-only
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_base_into(self.sks[0], bytearray(32), 1) # too small
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_base_batch_into(self.sks, bytearray(32 * self.runs - 1))
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_base_batch_into(self.sks, bytearray(32 * self.runs), stride=16)
+        with self.assertRaises(ValueError):
+            self.x25519_ladder.x25519_into(self.sks[0][:31], self.pks[0], bytearray(32))
+
+    def test_encoders(self):
+        x = 2**255 - 1 # not reduced
+        out = bytearray(33)
+        encode_x_coordinate_into(x, out, 1)
+        self.assertEqual(bytes(out[1:]), encode_x_coordinate(x))
+        out = bytearray(96)
+        encode_x_coordinates_into([1, 2], out, 32, 32)
+        self.assertEqual(bytes(out), bytes(32) + encode_x_coordinate(1) + encode_x_coordinate(2))
+        encode_x_coordinates_into([], bytearray(0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import time
+import unittest
+from x25519 import X25519, KeypairPool
+
+class TestKeypairPool(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519()
+
+    def wait_for(self, condition, timeout: float = 10.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail("Timed out waiting for the keypair pool")
+            time.sleep(0.01)
+
+    def test_pairs_are_valid(self):
+        with KeypairPool(size=8, low_water=4, block_size=3) as pool:
+            self.wait_for(lambda: len(pool) == 8)
+            for _ in range(5):
+                sk, pk = pool.get()
+                self.assertEqual(sk[0] & 7, 0)
+                self.assertEqual(sk[31] & 0xC0, 0x40)
+                self.assertEqual(pk, self.x25519_ladder.derive_public_key(sk))
+            # Dropped below the low-water mark: refilled in the background
+            self.wait_for(lambda: len(pool) == 8)
+            self.assertEqual(pool.hits, 5)
+
+    def test_never_hands_out_a_pair_twice(self):
+        pairs = []
+        lock = threading.Lock()
+        with KeypairPool(size=16, low_water=8, block_size=8) as pool:
+            def worker():
+                for _ in range(25):
+                    pair = pool.get()
+                    with lock:
+                        pairs.append(pair)
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(pool.hits + pool.misses, 100)
+        self.assertEqual(len(set(pairs)), 100)
+
+    def test_empty_pool_generates_inline(self):
+        pool = KeypairPool(size=4, low_water=2, start=False)
+        sk, pk = pool.get()
+        self.assertEqual(pk, self.x25519_ladder.derive_public_key(sk))
+        self.assertEqual(pool.misses, 1)
+        pool.close()
+        self.assertEqual(len(pool), 0)
+        with self.assertRaises(ValueError):
+            pool.get()
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            KeypairPool(size=0, start=False)
+        with self.assertRaises(ValueError):
+            KeypairPool(size=4, low_water=5, start=False)
+        with self.assertRaises(ValueError):
+            KeypairPool(block_size=0, start=False)
+
+if __name__ == "__main__":
+    unittest.main()
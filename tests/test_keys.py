@@ -0,0 +1,45 @@
+import unittest
+from x25519 import X25519, X25519Algorithm, X25519PrivateKey, X25519PublicKey
+
+class TestKeys(unittest.TestCase):
+    def setUp(self):
+        self.alice_sk = bytes.fromhex("77076d0a7318a57d3c16c17251b26645df4c2f87ebc0992ab177fba51db92c2a")
+        self.bob_sk = bytes.fromhex("5dab087e624a8a4b79e17f8b83800ee66f3bb1292618b6fd1c2f8b27ff88e0eb")
+        self.alice_pk = bytes.fromhex("8520f0098930a754748b7ddcb43ef75a0dbf3a0d26381af4eba4a98eaa9b4e6a")
+        self.bob_pk = bytes.fromhex("de9edb7d7b7dc1b4d35b61c2ece435373f8343c85b78674dadfc7e146f882b4f")
+        self.shared_secret = bytes.fromhex("4a5d9d5ba4ce2de1728e3bf480350f25e07e21c947d19e3376f09b3c1e161742")
+
+    """
+    Test vectors from RFC 7748 Section 6.1 through the key objects
+    """
+    def test_rfc7748_dh(self):
+        for x25519_instance in [None, X25519(X25519Algorithm.DOUBLE_AND_ADD)]:
+            alice = X25519PrivateKey(self.alice_sk, x25519_instance)
+            bob = X25519PrivateKey(self.bob_sk, x25519_instance)
+            self.assertEqual(alice.public_key().public_bytes(), self.alice_pk)
+            self.assertEqual(bob.public_key(), X25519PublicKey(self.bob_pk))
+            self.assertEqual(alice.exchange(bob.public_key()), self.shared_secret)
+            self.assertEqual(bob.exchange(self.alice_pk), self.shared_secret)
+
+    def test_public_key_is_cached(self):
+        alice = X25519PrivateKey.generate()
+        self.assertIs(alice.public_key(), alice.public_key())
+        self.assertEqual(alice.public_key().public_bytes(), X25519().derive_public_key(alice.private_bytes()))
+
+    def test_slots(self):
+        # No per-instance __dict__
+        with self.assertRaises(AttributeError):
+            setattr(X25519PrivateKey(self.alice_sk), "extra", 1)
+        with self.assertRaises(AttributeError):
+            setattr(X25519PublicKey(self.alice_pk), "extra", 1)
+
+    def test_invalid_length(self):
+        with self.assertRaises(ValueError):
+            X25519PrivateKey(b'\x11' * 31)
+        with self.assertRaises(ValueError):
+            X25519PublicKey(b'\x11' * 33)
+        with self.assertRaises(ValueError):
+            X25519PrivateKey(self.alice_sk).exchange(b'\x11' * 31)
+
+if __name__ == "__main__":
+    unittest.main()
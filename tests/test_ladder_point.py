@@ -0,0 +1,56 @@
+import os
+import unittest
+from x25519 import X25519, X25519Algorithm, Point
+from x25519.defaults import BASE_X, BASE_Y, L, p
+from x25519.encoding import decode_scalar
+from x25519.field import field_op_counter
+from x25519.methods import double_and_add, montgomery_ladder, montgomery_ladder_point
+from x25519.point import INF
+
+class TestLadderPoint(unittest.TestCase):
+    def setUp(self):
+        self.Pt = Point(BASE_X, BASE_Y)
+        self.runs = 10 # Number of iterations for random tests
+
+    def random_point(self) -> Point:
+        while True:
+            try:
+                return Point(int.from_bytes(os.urandom(32), "little"))
+            except ValueError:
+                continue # on the twist, try again
+
+    def test_matches_double_and_add(self):
+        for k in range(0, 20):
+            self.assertEqual(montgomery_ladder_point(k, self.Pt), double_and_add(k, self.Pt) if k else INF)
+        for _ in range(self.runs):
+            # Random points need not lie in the prime-order subgroup
+            P = self.random_point()
+            k = decode_scalar(os.urandom(32))
+            Q = montgomery_ladder_point(k, P)
+            self.assertEqual(Q, double_and_add(k, P))
+            assert isinstance(Q, Point)
+            self.assertEqual(Q.x, montgomery_ladder(k, P.x))
+            self.assertTrue(Q.is_valid())
+
+    def test_special_cases(self):
+        self.assertEqual(montgomery_ladder_point(L, self.Pt), INF)
+        self.assertEqual(montgomery_ladder_point(L - 1, self.Pt), Point(BASE_X, p - BASE_Y)) # (k+1)*P at infinity
+        self.assertEqual(montgomery_ladder_point(3, Point(0)), Point(0)) # order 2
+        self.assertEqual(montgomery_ladder_point(2, Point(0)), INF)
+        with self.assertRaises(ValueError):
+            montgomery_ladder_point(1 << 255, self.Pt)
+
+    def test_no_square_root(self):
+        with field_op_counter() as c:
+            montgomery_ladder_point(decode_scalar(os.urandom(32)), self.Pt)
+        self.assertEqual(c.fsqrt, 0)
+        self.assertEqual(c.finv, 1)
+
+    def test_api(self):
+        k = decode_scalar(os.urandom(32))
+        expected = double_and_add(k, self.Pt)
+        for algorithm in [X25519Algorithm.LADDER, X25519Algorithm.EDWARDS, X25519Algorithm.DOUBLE_AND_ADD, X25519Algorithm.WNAF]:
+            self.assertEqual(X25519(algorithm).scalar_mult_point(k, self.Pt), expected)
+
+if __name__ == "__main__":
+    unittest.main()
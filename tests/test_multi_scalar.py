@@ -0,0 +1,50 @@
+import os
+import unittest
+from x25519 import X25519, Point
+from x25519.group_law import point_addition
+from x25519.methods import double_and_add
+from x25519.multi_scalar import multi_scalar_mult, pippenger_mult, pippenger_window, straus_mult
+from x25519.point import INF
+
+class TestMultiScalar(unittest.TestCase):
+    def setUp(self):
+        x25519_ladder = X25519()
+        self.points = [Point(int.from_bytes(x25519_ladder.x25519_base(os.urandom(32)), "little")) for _ in range(40)]
+        self.scalars = [int.from_bytes(os.urandom(32), "little") for _ in self.points]
+
+    def naive(self, scalars, points):
+        R = INF
+        for k, P in zip(scalars, points):
+            R = point_addition(R, double_and_add(k, P))
+        return R
+
+    def test_matches_naive(self):
+        for n in [1, 2, 7, 40]:
+            expected = self.naive(self.scalars[:n], self.points[:n])
+            self.assertEqual(straus_mult(self.scalars[:n], self.points[:n]), expected)
+            self.assertEqual(multi_scalar_mult(self.scalars[:n], self.points[:n]), expected)
+            for c in [2, 3, 5, 8]:
+                self.assertEqual(pippenger_mult(self.scalars[:n], self.points[:n], c), expected)
+
+    def test_small_and_signed_scalars(self):
+        P, Q = self.points[:2]
+        for k in range(0, 70):
+            expected = double_and_add(k, P) if k else INF
+            self.assertEqual(pippenger_mult([k], [P], 3), expected)
+            self.assertEqual(straus_mult([k], [P]), expected)
+        # k*P + (-k)*P is the point at infinity; negative scalars multiply the negated point
+        self.assertEqual(multi_scalar_mult([5, -5], [P, P]), INF)
+        self.assertEqual(pippenger_mult([7, -3], [P, Q]), point_addition(double_and_add(7, P), double_and_add(3, Point(Q.x, -Q.y))))
+        self.assertEqual(multi_scalar_mult([3, 0, 2], [P, Q, INF]), double_and_add(3, P))
+        self.assertEqual(multi_scalar_mult([], []), INF)
+
+    def test_crossover(self):
+        # Pippenger windows grow with the number of points
+        self.assertLessEqual(pippenger_window(16), pippenger_window(1024))
+        with self.assertRaises(ValueError):
+            multi_scalar_mult([1, 2], [self.points[0]])
+        with self.assertRaises(ValueError):
+            pippenger_mult([1], [self.points[0]], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import unittest
+from x25519.field import field_op_counter, fadd, fdiv, fmul, fsquare
+from x25519.methods import cswap, edwards_mult, montgomery_ladder, wnaf
+
+class TestFieldOpCounter(unittest.TestCase):
+    def test_counts_field_operations(self):
+        with field_op_counter() as c:
+            fadd(1, 2)
+            fmul(3, 4)
+            fsquare(5)
+            fdiv(6, 7) # one inversion plus one multiplication
+            cswap(1, 8, 9)
+        self.assertEqual(c.as_dict(), {"fadd": 1, "fsub": 0, "fmul": 2, "fsquare": 1, "finv": 1, "fsqrt": 0, "cswap": 1})
+
+    def test_ladder_cost_model(self):
+        # 255 steps of 5M + 4S + 1 multiplication by A24, two cswaps per step plus the final two, one inversion
+        with field_op_counter() as c:
+            montgomery_ladder(2**254 + 8, 9)
+        self.assertEqual(c.fmul, 255 * 6 + 1)
+        self.assertEqual(c.fsquare, 255 * 4)
+        self.assertEqual(c.cswap, 255 * 2 + 2)
+        self.assertEqual(c.finv, 1)
+
+    def test_edwards_cost_model(self):
+        # One doubling per wNAF digit and one cached addition per non-zero digit, on top of the odd-multiples
+        # table (one doubling, 3 additions, 4 conversions to cached form), the map (one square root) and the division
+        k = 2**254 + 8
+        digits = wnaf(k, 4)
+        doublings = len(digits) + 1
+        additions = sum(digit != 0 for digit in digits) + 3
+        with field_op_counter() as c:
+            edwards_mult(k, 9)
+        self.assertEqual(c.fsquare, doublings * 4 + 2)
+        self.assertEqual(c.fmul, doublings * 4 + additions * 9 + (3 + 4) * 1 + 10 + 1)
+        self.assertEqual(c.fsqrt, 1)
+        self.assertEqual(c.finv, 1)
+        self.assertEqual(c.cswap, 0)
+
+    def test_nested_scopes(self):
+        with field_op_counter() as outer:
+            fmul(1, 2)
+            with field_op_counter() as inner:
+                fmul(3, 4)
+        self.assertEqual(outer.fmul, 2)
+        self.assertEqual(inner.fmul, 1)
+
+    def test_disabled_outside_scope(self):
+        # Nothing is counted once the scope is left and the previous profiler is restored
+        previous = sys.getprofile()
+        with field_op_counter() as c:
+            pass
+        fmul(1, 2)
+        self.assertEqual(c.fmul, 0)
+        self.assertIs(sys.getprofile(), previous)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from x25519 import X25519, X25519Algorithm, ParallelX25519
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.sks = [self.x25519_ladder.generate_private_key() for _ in range(10)]
+        self.pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(10)]
+
+    """
+    Results must match the single-process API and come back in input order, whatever the chunking.
+    """
+    def test_process_pool_matches_single(self):
+        with ParallelX25519(workers=2, chunk_size=3) as parallel:
+            self.assertEqual(parallel.x25519_base_batch(self.sks), [self.x25519_ladder.x25519_base(sk) for sk in self.sks])
+            self.assertEqual(parallel.x25519_batch(self.sks, self.pks), [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)])
+
+    def test_custom_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = ParallelX25519(chunk_size=4, executor=executor)
+            self.assertEqual(parallel.x25519_base_batch(self.sks), [self.x25519_ladder.x25519_base(sk) for sk in self.sks])
+            parallel.close() # Must not shut down an executor it does not own
+            self.assertEqual(parallel.x25519_base_batch([]), [])
+
+    def test_invalid_input(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parallel = ParallelX25519(executor=executor)
+            with self.assertRaises(ValueError):
+                parallel.x25519_batch(self.sks, self.pks[:1])
+            with self.assertRaises(ValueError):
+                parallel.x25519_base_batch([b'\x11' * 31])
+        with self.assertRaises(ValueError):
+            ParallelX25519(chunk_size=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import copy
+import pickle
+import unittest
+from x25519.defaults import BASE_X, BASE_Y, p
+from x25519.group_law import point_addition, point_doubling
+from x25519.point import Point
+
+class TestPoint(unittest.TestCase):
+    def setUp(self):
+        self.Pt = Point(BASE_X, BASE_Y)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            Point(BASE_X, BASE_Y + 1)
+        with self.assertRaises(ValueError):
+            Point(2) # on the twist
+        self.assertIn(Point(BASE_X).y, (BASE_Y, p - BASE_Y))
+
+    def test_immutable_and_slotted(self):
+        self.assertFalse(hasattr(self.Pt, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.Pt.x = 1
+        with self.assertRaises(AttributeError):
+            self.Pt.z = 1
+
+    def test_unchecked_lazy_y(self):
+        Q = Point._unchecked(BASE_X)
+        self.assertIsNone(Q._y)
+        self.assertEqual(Q, Point(BASE_X)) # y is computed on first access
+        self.assertIsNotNone(Q._y)
+        self.assertEqual(hash(Q), hash(Point(BASE_X)))
+        with self.assertRaises(ValueError):
+            Point._unchecked(2).y
+
+    def test_pickle_and_copy(self):
+        lazy = Point._unchecked(BASE_X)
+        for P in (self.Pt, lazy):
+            for Q in (pickle.loads(pickle.dumps(P)), copy.copy(P), copy.deepcopy(P)):
+                self.assertIsInstance(Q, Point)
+                self.assertEqual((Q.x, Q._y), (P.x, P._y))
+        self.assertEqual(pickle.loads(pickle.dumps(lazy)), self.Pt)
+
+    def test_group_law_results(self):
+        # Results are built unchecked but must still be on the curve
+        P2 = point_doubling(self.Pt)
+        P3 = point_addition(P2, self.Pt)
+        assert isinstance(P2, Point) and isinstance(P3, Point)
+        self.assertTrue(P2.is_valid())
+        self.assertTrue(P3.is_valid())
+        self.assertEqual(P3, Point(P3.x, P3.y))
+
+if __name__ == "__main__":
+    unittest.main()
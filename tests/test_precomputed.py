@@ -0,0 +1,72 @@
+import os
+import unittest
+from x25519 import X25519, PrecomputedKeyRegistry, PrecomputedPublicKey
+from x25519.encoding import decode_x_coordinate
+from x25519.methods import montgomery_ladder
+
+class TestPrecomputed(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519()
+        self.pk = self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key())
+        self.twist_pk = bytes.fromhex("e5210f12786811d3f4b7959d0538ae2c31dbe7106fc03c3efc4cd549c715a493") # RFC 7748 vector 2
+        self.runs = 10 # Number of iterations for random tests
+
+    def test_matches_ladder(self):
+        # Keys need not be in the prime-order subgroup: pick random on-curve u-coordinates as well
+        pks = [self.pk]
+        while len(pks) < 3:
+            try:
+                pks.append(PrecomputedPublicKey(os.urandom(32)).pk)
+            except ValueError:
+                continue
+        for pk in pks:
+            table = PrecomputedPublicKey(pk)
+            for _ in range(self.runs):
+                sk = self.x25519_ladder.generate_private_key()
+                self.assertEqual(table.x25519(sk), self.x25519_ladder.x25519(sk, pk))
+                k = int.from_bytes(os.urandom(32), "little") # unclamped, including bit 255
+                self.assertEqual(table.scalar_mult(k), montgomery_ladder(k, decode_x_coordinate(pk)))
+
+    def test_unsupported_keys(self):
+        for pk in [self.twist_pk, bytes(32)]:
+            with self.assertRaises(ValueError):
+                PrecomputedPublicKey(pk)
+        # u = 1 has order 4: the table can be built but, like the ladder, every clamped scalar gives the identity
+        with self.assertRaises(ValueError):
+            PrecomputedPublicKey((1).to_bytes(32, "little")).x25519(self.x25519_ladder.generate_private_key())
+
+    def test_registry_builds_after_threshold(self):
+        registry = PrecomputedKeyRegistry(build_after=2, max_tables=1)
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(4)]
+        for sk in sks:
+            self.assertEqual(registry.x25519(sk, self.pk), self.x25519_ladder.x25519(sk, self.pk))
+        self.assertEqual(registry.tables_built, 1)
+        self.assertEqual(registry.table_hits, 2) # the third use builds the table
+
+        # Keys on the twist fall back to the ladder, without evicting the table
+        for sk in sks:
+            self.assertEqual(registry.x25519(sk, self.twist_pk), self.x25519_ladder.x25519(sk, self.twist_pk))
+        self.assertEqual(registry.tables_built, 1)
+        self.assertEqual(len(registry), 1)
+        hits = registry.table_hits
+        registry.x25519(sks[0], self.pk)
+        self.assertEqual(registry.table_hits, hits + 1)
+
+        # Only max_tables tables are kept
+        other_pk = self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key())
+        for sk in sks:
+            registry.x25519(sk, other_pk)
+        self.assertEqual(len(registry), 1)
+        self.assertIsNotNone(registry.get(other_pk))
+
+    def test_registry_validation(self):
+        registry = PrecomputedKeyRegistry(X25519(validate=True), build_after=0)
+        sk = self.x25519_ladder.generate_private_key()
+        self.assertEqual(registry.x25519(sk, self.pk), self.x25519_ladder.x25519(sk, self.pk))
+        with self.assertRaises(ValueError):
+            registry.x25519(sk, bytes(32))
+        with self.assertRaises(ValueError):
+            PrecomputedKeyRegistry(max_tables=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ class TestRFCVectors(unittest.TestCase):
     def setUp(self):
         self.x25519_ladder = X25519(X25519Algorithm.LADDER)
         self.x25519_double_and_add = X25519(X25519Algorithm.DOUBLE_AND_ADD)
+        self.x25519_edwards = X25519(X25519Algorithm.EDWARDS)
 
     """
     Test vectors from RFC 7748 Section 5.2 -- single-shot tests
@@ -27,6 +28,9 @@ class TestRFCVectors(unittest.TestCase):
         out_double_and_add = self.x25519_double_and_add.x25519(k, u)
         self.assertEqual(out_double_and_add, expected)
 
+        out_edwards = self.x25519_edwards.x25519(k, u)
+        self.assertEqual(out_edwards, expected)
+
     def test_rfc_vector_2(self):
         k = bytes.fromhex(
             "4b66e9d4d1b4673c5ad22691957d6af5c11b6421e0ea01d42ca4169e7918ba0d"
@@ -44,6 +48,10 @@ class TestRFCVectors(unittest.TestCase):
         # This is expected to fail as the x point when decoded does not correspond to a valid point on the curve, so the compute_y method raises a ValueError
         with self.assertRaises(ValueError):
             self.x25519_double_and_add.x25519(k, u)
+
+        # The Edwards backend maps points of the twist to the twisted Edwards curve, so it handles this vector too
+        out_edwards = self.x25519_edwards.x25519(k, u)
+        self.assertEqual(out_edwards, expected)
     
     """
     Test vectors from RFC 7748 Section 5.2 -- iterative tests
@@ -105,6 +113,31 @@ class TestRFCVectors(unittest.TestCase):
         for i in expected_keys_list:
             self.assertEqual(result[i], bytes.fromhex(expected[i]))
 
+    def test_rfc_iterative_vector_edwards(self):
+        k = bytes.fromhex(
+            "0900000000000000000000000000000000000000000000000000000000000000"
+        )
+
+        u = bytes.fromhex(
+            "0900000000000000000000000000000000000000000000000000000000000000"
+        )
+
+        expected = {
+            1 : "422c8e7a6227d7bca1350b3e2bb7279f7897b87bb6854b783c60e80311ae3079",
+            1000 : "684cf59ba83309552800ef566f2f4d3c1c3887c49360e3875f2eb94d99532c51",
+        }
+
+        expected_keys_list = list(expected.keys())
+
+        result = {}
+
+        for i in range(1, expected_keys_list[-1] + 1):
+            k, u = self.x25519_edwards.x25519(k, u), k
+            if i in expected_keys_list:
+                result[i] = k
+
+        for i in expected_keys_list:
+            self.assertEqual(result[i], bytes.fromhex(expected[i]))
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from x25519 import X25519
+from x25519.server import OP_X25519, REQUEST_HEADER, RESPONSE_HEADER, STATUS_ERROR, X25519Client, X25519Server
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+class TestX25519Server(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519()
+        self.sks = [self.x25519_ladder.generate_private_key() for _ in range(12)]
+        self.pks = [self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key()) for _ in range(12)]
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "x25519.sock")
+        self.server = X25519Server(self.path, max_batch_size=8)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result()
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.tmpdir.cleanup()
+
+    def test_single_requests(self):
+        with X25519Client(self.path) as client:
+            self.assertEqual(client.x25519(self.sks[0], self.pks[0]), self.x25519_ladder.x25519(self.sks[0], self.pks[0]))
+            self.assertEqual(client.x25519_base(self.sks[0]), self.x25519_ladder.x25519_base(self.sks[0]))
+
+    def test_pipelined_batches(self):
+        with X25519Client(self.path) as client:
+            self.assertEqual(client.x25519_batch(self.sks, self.pks), [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)])
+            self.assertEqual(client.x25519_base_batch(self.sks), [self.x25519_ladder.x25519_base(sk) for sk in self.sks])
+        # 12 pipelined requests of each kind with at most 8 per batch
+        self.assertLessEqual(self.server.async_x25519.batches_run, 6)
+        self.assertEqual(self.server.requests_served, 24)
+
+    def test_concurrent_clients_share_the_pool(self):
+        results: list[list[bytes]] = [[] for _ in range(4)]
+        with X25519Client(self.path, pool_size=2) as client:
+            def work(i):
+                results[i] = client.x25519_batch(self.sks[3 * i:3 * i + 3], self.pks[3 * i:3 * i + 3])
+
+            threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        expected = [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)]
+        self.assertEqual([secret for batch in results for secret in batch], expected)
+
+    def test_failed_request_is_reported(self):
+        with X25519Client(self.path) as client:
+            with self.assertRaises(ValueError):
+                client.x25519(self.sks[0], bytes(32))
+            # The connection is still usable after an error response
+            self.assertEqual(client.x25519(self.sks[1], self.pks[1]), self.x25519_ladder.x25519(self.sks[1], self.pks[1]))
+
+    def test_invalid_input_lengths(self):
+        with X25519Client(self.path) as client:
+            with self.assertRaises(ValueError):
+                client.x25519(bytes(31), self.pks[0])
+            with self.assertRaises(ValueError):
+                client.x25519_batch(self.sks[:2], self.pks[:1])
+
+    def test_unknown_operation(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(REQUEST_HEADER.pack(99, 7))
+            request_id, status, length = RESPONSE_HEADER.unpack(sock.recv(RESPONSE_HEADER.size))
+            self.assertEqual((request_id, status), (7, STATUS_ERROR))
+            self.assertGreater(length, 0)
+
+    def test_out_of_order_ids(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(REQUEST_HEADER.pack(OP_X25519, 42) + self.sks[0] + self.pks[0])
+            request_id, status, length = RESPONSE_HEADER.unpack(sock.recv(RESPONSE_HEADER.size))
+            self.assertEqual((request_id, status, length), (42, 0, 32))
+
+    def test_pending_requests_are_capped_per_connection(self):
+        server = X25519Server(os.path.join(self.tmpdir.name, "capped.sock"), max_pending=3)
+        compute = server.async_x25519.x25519
+        in_flight = peak = 0
+
+        async def counting_x25519(sk: bytes, pk: bytes) -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await compute(sk, pk)
+            finally:
+                in_flight -= 1
+
+        asyncio.run_coroutine_threadsafe(server.start(), self.loop).result()
+        try:
+            with mock.patch.object(server.async_x25519, "x25519", counting_x25519), X25519Client(server.path) as client:
+                self.assertEqual(client.x25519_batch(self.sks, self.pks), [self.x25519_ladder.x25519(sk, pk) for sk, pk in zip(self.sks, self.pks)])
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), self.loop).result()
+        self.assertEqual(peak, 3)
+        with self.assertRaises(ValueError):
+            X25519Server(self.path, max_pending=0)
+
+    def test_batches_larger_than_the_socket_buffers(self):
+        # Far more requests than max_pending and than the socket buffers hold: the client must read responses while
+        # it sends. The computation is replaced by an echo to keep the test fast.
+        server = X25519Server(os.path.join(self.tmpdir.name, "large.sock"), max_pending=4)
+
+        async def echo(sk: bytes) -> bytes:
+            return bytes(sk)
+
+        sks = [i.to_bytes(32, "little") for i in range(30000)]
+        asyncio.run_coroutine_threadsafe(server.start(), self.loop).result()
+        try:
+            with mock.patch.object(server.async_x25519, "x25519_base", echo), X25519Client(server.path, timeout=10, window=4) as client:
+                self.assertEqual(client.x25519_base_batch(sks), sks)
+        finally:
+            asyncio.run_coroutine_threadsafe(server.close(), self.loop).result()
+        with self.assertRaises(ValueError):
+            X25519Client(self.path, window=0)
+
+    def test_socket_permissions(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_refuses_to_replace_other_files(self):
+        path = os.path.join(self.tmpdir.name, "not-a-socket")
+        with open(path, "wb") as f:
+            f.write(b"data")
+        with self.assertRaises(ValueError):
+            asyncio.run_coroutine_threadsafe(X25519Server(path).start(), self.loop).result()
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"data")
+
+    def test_close_only_removes_its_own_socket(self):
+        # The path was taken over by another file after the server started: close() must leave it alone
+        os.unlink(self.path)
+        with open(self.path, "wb") as f:
+            f.write(b"data")
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result()
+        self.assertTrue(os.path.isfile(self.path))
+        os.unlink(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
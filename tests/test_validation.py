@@ -0,0 +1,70 @@
+import os
+import unittest
+from x25519 import X25519, X25519PrivateKey
+from x25519.defaults import p
+from x25519.encoding import decode_x_coordinate
+from x25519.methods import montgomery_ladder_projective
+from x25519.point import Point
+from x25519.validation import LOW_ORDER_ENCODINGS, LOW_ORDER_U, is_all_zero, is_low_order, is_on_curve, validate_public_key, validate_public_keys, validate_shared_secret
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.x25519_validating = X25519(validate=True)
+        self.sk = self.x25519_validating.generate_private_key()
+        self.pk = self.x25519_validating.derive_public_key(self.x25519_validating.generate_private_key())
+
+    def test_low_order_points(self):
+        # Every listed u has small order: multiplying by the cofactor 8 gives the point at infinity (Z = 0)
+        for u in LOW_ORDER_U:
+            self.assertEqual(montgomery_ladder_projective(8, u)[1], 0)
+        # Every encoding in the set decodes to one of them, including non-canonical ones (>= p or with the top bit set)
+        self.assertEqual({decode_x_coordinate(e) for e in LOW_ORDER_ENCODINGS}, set(LOW_ORDER_U))
+        self.assertTrue(is_low_order((p + 1).to_bytes(32, "little")))
+        self.assertTrue(is_low_order(bytes(31) + b'\x80'))
+        self.assertFalse(is_low_order(self.pk))
+
+    def test_on_curve(self):
+        self.assertTrue(is_on_curve(self.pk))
+        # u = 2 is not on the curve (x^3 + A*x^2 + x is not a square) so it lies on the twist
+        with self.assertRaises(ValueError):
+            Point(2)
+        self.assertFalse(is_on_curve((2).to_bytes(32, "little")))
+        for _ in range(10):
+            x = os.urandom(32)
+            try:
+                Point(decode_x_coordinate(x))
+                self.assertTrue(is_on_curve(x))
+            except ValueError:
+                self.assertFalse(is_on_curve(x))
+
+    def test_standalone_checks(self):
+        self.assertTrue(is_all_zero(bytes(32)))
+        self.assertFalse(is_all_zero(bytes(31) + b'\x01'))
+        with self.assertRaises(ValueError):
+            validate_shared_secret(bytes(32))
+        with self.assertRaises(ValueError):
+            validate_public_key(bytes(32))
+        with self.assertRaises(ValueError):
+            validate_public_key((2).to_bytes(32, "little"), check_on_curve=True)
+        validate_public_key((2).to_bytes(32, "little"))
+        validate_public_key(self.pk, check_on_curve=True)
+
+    def test_batch_validation(self):
+        arena = self.pk + bytes(32) + (1).to_bytes(32, "little") + (2).to_bytes(32, "little")
+        self.assertEqual(validate_public_keys(arena), [True, False, False, True])
+        self.assertEqual(validate_public_keys(arena, check_on_curve=True), [True, False, False, False])
+        with self.assertRaises(ValueError):
+            validate_public_keys(bytes(31))
+
+    def test_api_rejects_low_order_keys(self):
+        for encoding in LOW_ORDER_ENCODINGS:
+            with self.assertRaises(ValueError):
+                self.x25519_validating.x25519(self.sk, encoding)
+            with self.assertRaises(ValueError):
+                self.x25519_validating.x25519_batch([self.sk], [encoding])
+            with self.assertRaises(ValueError):
+                X25519PrivateKey(self.sk, self.x25519_validating).exchange(encoding)
+        self.assertEqual(self.x25519_validating.x25519(self.sk, self.pk), X25519().x25519(self.sk, self.pk))
+
+if __name__ == "__main__":
+    unittest.main()
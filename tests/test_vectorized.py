@@ -0,0 +1,44 @@
+import os
+import unittest
+from x25519 import X25519, X25519Algorithm
+from x25519.encoding import decode_scalar, decode_x_coordinate
+from x25519.methods import montgomery_ladder
+from x25519.vectorized import np, montgomery_ladder_vectorized, to_limbs, from_limbs
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+    def setUp(self):
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.x25519_vectorized = X25519(X25519Algorithm.VECTORIZED)
+        self.runs = 16 # Number of lanes for random tests
+
+    def test_limb_conversion(self):
+        values = [0, 1, 2**255 - 20, int.from_bytes(os.urandom(32), "little") >> 1]
+        self.assertEqual(from_limbs(to_limbs(values)), values)
+
+    def test_matches_ladder(self):
+        # Every lane must be bit-exact with the scalar ladder, including extreme scalars and x-coordinates
+        ks = [decode_scalar(os.urandom(32)) for _ in range(self.runs)] + [2**255 - 1, 2**254]
+        xs = [decode_x_coordinate(os.urandom(32)) for _ in range(self.runs)] + [2**255 - 21, 9]
+        self.assertEqual(montgomery_ladder_vectorized(ks, xs), [montgomery_ladder(k, x) for k, x in zip(ks, xs)])
+        self.assertEqual(montgomery_ladder_vectorized([], []), [])
+
+    def test_rfc7748_vectors(self):
+        k = bytes.fromhex("a546e36bf0527c9d3b16154b82465edd62144c0ac1fc5a18506a2244ba449ac4")
+        u = bytes.fromhex("e6db6867583030db3594c1a424b15f7c726624ec26b3353b10a903a6d0ab1c4c")
+        expected = bytes.fromhex("c3da55379de9c6908e94ea4df28d084f32eccf03491c71f754b4075577a28552")
+        self.assertEqual(self.x25519_vectorized.x25519(k, u), expected)
+
+        k = bytes.fromhex("4b66e9d4d1b4673c5ad22691957d6af5c11b6421e0ea01d42ca4169e7918ba0d")
+        u = bytes.fromhex("e5210f12786811d3f4b7959d0538ae2c31dbe7106fc03c3efc4cd549c715a493")
+        expected = bytes.fromhex("95cbde9476e8907d7aade45cb4b873f88b595a68799fa152e6f8f7647aac7957")
+        self.assertEqual(self.x25519_vectorized.x25519_batch([k], [u]), [expected])
+
+    def test_batch_api(self):
+        sks = [self.x25519_ladder.generate_private_key() for _ in range(self.runs)]
+        pks = self.x25519_ladder.x25519_base_batch(sks)
+        self.assertEqual(self.x25519_vectorized.x25519_base_batch(sks), pks)
+        self.assertEqual(self.x25519_vectorized.x25519_batch(sks, pks[::-1]), self.x25519_ladder.x25519_batch(sks, pks[::-1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import unittest
+from x25519 import X25519, X25519Algorithm, Point
+from x25519.defaults import BASE_X, BASE_Y
+from x25519.encoding import decode_scalar
+from x25519.methods import double_and_add, wnaf, wnaf_mult
+from x25519.point import INF
+
+class TestWNAF(unittest.TestCase):
+    def setUp(self):
+        self.Pt = Point(BASE_X, BASE_Y)
+        self.x25519_ladder = X25519(X25519Algorithm.LADDER)
+        self.runs = 10 # Number of iterations for random tests
+
+    def test_wnaf_digits(self):
+        # Digits must reconstruct k, be odd and bounded, and be separated by at least w-1 zeros
+        for w in [2, 3, 4, 5, 6]:
+            for k in [1, 7, 255, 2**254 + 12345, decode_scalar(os.urandom(32))]:
+                digits = wnaf(k, w)
+                self.assertEqual(sum(d << i for i, d in enumerate(digits)), k)
+                nonzero = [i for i, d in enumerate(digits) if d != 0]
+                self.assertTrue(all(digits[i] % 2 == 1 and abs(digits[i]) < 1 << (w - 1) for i in nonzero))
+                self.assertTrue(all(j - i >= w for i, j in zip(nonzero, nonzero[1:])))
+
+        with self.assertRaises(ValueError):
+            wnaf(5, 1)
+
+    def test_matches_double_and_add(self):
+        for w in [2, 4, 5]:
+            for k in [0, 1, 2, 3, 5, 16]:
+                self.assertEqual(wnaf_mult(k, self.Pt, w), double_and_add(k, self.Pt) if k else INF)
+            for _ in range(self.runs):
+                k = decode_scalar(os.urandom(32))
+                self.assertEqual(wnaf_mult(k, self.Pt, w), double_and_add(k, self.Pt))
+
+    def test_api_matches_ladder(self):
+        for w in [3, 4, 6]:
+            x25519_wnaf = X25519(X25519Algorithm.WNAF, wnaf_width=w)
+            for _ in range(self.runs):
+                sk = self.x25519_ladder.generate_private_key()
+                pk = self.x25519_ladder.derive_public_key(self.x25519_ladder.generate_private_key())
+                self.assertEqual(x25519_wnaf.x25519_base(sk), self.x25519_ladder.x25519_base(sk))
+                self.assertEqual(x25519_wnaf.x25519(sk, pk), self.x25519_ladder.x25519(sk, pk))
+
+        with self.assertRaises(ValueError):
+            X25519(X25519Algorithm.WNAF, wnaf_width=1)
+
+if __name__ == "__main__":
+    unittest.main()
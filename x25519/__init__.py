@@ -1,9 +1,25 @@
 from .x25519 import X25519, X25519Algorithm
+from .parallel import ParallelX25519
+from .async_api import AsyncX25519
+from .keypair_pool import KeypairPool
+from .cache import SharedSecretCache
+from .precomputed import PrecomputedKeyRegistry, PrecomputedPublicKey
+from .instrumentation import Instrumentation
+from .keys import X25519PrivateKey, X25519PublicKey
 from .point import Point, PointAtInfinity
 
 __all__ = [
     "X25519",
     "X25519Algorithm",
+    "ParallelX25519",
+    "AsyncX25519",
+    "KeypairPool",
+    "SharedSecretCache",
+    "PrecomputedPublicKey",
+    "PrecomputedKeyRegistry",
+    "Instrumentation",
+    "X25519PrivateKey",
+    "X25519PublicKey",
     "Point",
     "PointAtInfinity",
-]
\ No newline at end of file
+]
@@ -0,0 +1,129 @@
+import asyncio
+from concurrent.futures import Executor
+from .parallel import _worker_instance
+from .x25519 import X25519, X25519Algorithm
+
+def _compute_batch(algorithm: X25519Algorithm, sks: list[bytes], pks: list[bytes] | None) -> list[bytes | Exception]:
+    """
+    Executor entry point for one micro-batch (pks is None for base point multiplications).
+    If the batch fails as a whole (e.g. one peer key leads to a division by zero), every request is retried
+    on its own so that only the offending requests fail.
+    """
+    instance = _worker_instance(algorithm)
+    try:
+        if pks is None:
+            return list(instance.x25519_base_batch(sks))
+        return list(instance.x25519_batch(sks, pks))
+    except ValueError:
+        results: list[bytes | Exception] = []
+        for i, sk in enumerate(sks):
+            try:
+                results.append(instance.x25519_base(sk) if pks is None else instance.x25519(sk, pks[i]))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+class AsyncX25519:
+    def __init__(self, algorithm: X25519Algorithm = X25519Algorithm.LADDER, executor: Executor | None = None, max_in_flight: int = 4, max_batch_size: int = 64, batch_delay: float = 0.0):
+        """
+        asyncio front-end to X25519 that never runs a ladder on the event loop.
+        Concurrent requests are coalesced into micro-batches (flushed after batch_delay seconds, or as soon as
+        max_batch_size requests are queued), each batch runs in the executor, and at most max_in_flight batches
+        are computed at the same time.
+
+        :param algorithm: The method to use for scalar multiplication.
+        :param executor: Executor for the computations (defaults to the event loop's default executor).
+                         A ProcessPoolExecutor also works and avoids contending for the GIL with the loop.
+        :param max_in_flight: Maximum number of batches computed concurrently.
+        :param max_batch_size: Maximum number of requests per batch.
+        :param batch_delay: How long (in seconds) to wait for more requests before flushing a batch.
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"Maximum number of in-flight batches must be positive. Provided: {max_in_flight}")
+        if max_batch_size < 1:
+            raise ValueError(f"Maximum batch size must be positive. Provided: {max_batch_size}")
+
+        self.algorithm = algorithm
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.batch_delay = batch_delay
+        self.batches_run = 0
+
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._pending: dict[bool, list[tuple[bytes, bytes | None, asyncio.Future]]] = {True: [], False: []}
+        self._flush_scheduled: dict[bool, bool] = {True: False, False: False}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def x25519(self, sk: bytes, pk: bytes) -> bytes:
+        """
+        Perform X25519 scalar multiplication with the given public key.
+
+        :param sk: The private key as bytes.
+        :param pk: The public key as bytes.
+        :return: The resulting shared secret as bytes.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        if len(pk) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+        return await self._submit(sk, pk)
+
+    async def x25519_base(self, sk: bytes) -> bytes:
+        """
+        Perform X25519 scalar multiplication with the base point.
+
+        :param sk: The private key as bytes.
+        :return: The resulting public key as bytes.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        return await self._submit(sk, None)
+
+    async def generate_keypair(self) -> tuple[bytes, bytes]:
+        """
+        Generate a new (private key, public key) pair.
+        """
+        sk = X25519.generate_private_key()
+        return sk, await self.x25519_base(sk)
+
+    def _submit(self, sk: bytes, pk: bytes | None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        base = pk is None
+        pending = self._pending[base]
+        pending.append((sk, pk, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(base)
+        elif not self._flush_scheduled[base]:
+            self._flush_scheduled[base] = True
+            loop.call_later(self.batch_delay, self._flush, base)
+        return future
+
+    def _flush(self, base: bool):
+        self._flush_scheduled[base] = False
+        pending = self._pending[base]
+        while pending:
+            batch = pending[:self.max_batch_size]
+            del pending[:self.max_batch_size]
+            task = asyncio.get_running_loop().create_task(self._run_batch(base, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, base: bool, batch: list[tuple[bytes, bytes | None, asyncio.Future]]):
+        sks = [bytes(sk) for sk, _, _ in batch]
+        pks = None if base else [bytes(pk) for _, pk, _ in batch if pk is not None]
+        try:
+            async with self._semaphore:
+                self.batches_run += 1
+                results = await asyncio.get_running_loop().run_in_executor(self.executor, _compute_batch, self.algorithm, sks, pks)
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done(): # cancelled by the caller
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,12 @@
+from .runner import Benchmark, compare, load_report, run_benchmark, run_suite, save_report
+from .cases import all_benchmarks
+
+__all__ = [
+    "Benchmark",
+    "all_benchmarks",
+    "compare",
+    "load_report",
+    "run_benchmark",
+    "run_suite",
+    "save_report",
+]
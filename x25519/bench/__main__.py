@@ -0,0 +1,38 @@
+import argparse
+import sys
+from .cases import all_benchmarks
+from .runner import compare, load_report, run_suite, save_report
+
+def _print_result(name: str, result: dict):
+    print(f"{name:<44} {result['ops_per_sec']:>14.1f} {result['sample_p50_s'] * 1e6:>16.2f} {result['sample_p99_s'] * 1e6:>16.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m x25519.bench", description="Benchmark the x25519 library")
+    parser.add_argument('--filter', default="", help='Only run benchmarks whose name contains this substring')
+    parser.add_argument('--list', action='store_true', help='List the available benchmarks and exit')
+    parser.add_argument('--repeat', type=int, default=20, help='Number of timed samples per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.02, help='Minimum duration of one sample in seconds')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--baseline', help='Compare against a JSON report saved earlier with --output')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed throughput drop versus the baseline (fraction, default 0.1)')
+    args = parser.parse_args()
+
+    benchmarks = [bench for bench in all_benchmarks() if args.filter in bench.name]
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        sys.exit(0)
+
+    print(f"{'benchmark':<44} {'ops/sec':>14} {'sample p50 (us)':>16} {'sample p99 (us)':>16}")
+    report = run_suite(benchmarks, repeat=args.repeat, min_time=args.min_time, progress=_print_result)
+
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before:.1f} -> {after:.1f} ops/sec ({after / before - 1:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
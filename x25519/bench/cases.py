@@ -0,0 +1,105 @@
+from os import urandom
+from ..defaults import BASE_X, BASE_Y
+from ..encoding import clamp_scalar, clamp_scalars, decode_little_endian, decode_scalar, decode_scalars, decode_x_coordinate, decode_x_coordinates, encode_x_coordinate, encode_x_coordinates, encode_x_coordinates_into
+from ..defaults import p
+from ..exponentiation import SQRT_M1, inv_sqrt, pow_inverse, pow_p38
+from ..field import batch_inv, fadd, fdiv, finv, fmul, fsqrt, fsquare, fsub
+from ..fixed_base import fixed_base_mult
+from ..methods import double_and_add, edwards_mult, montgomery_ladder, montgomery_ladder_point, wnaf_mult
+from ..multi_scalar import multi_scalar_mult
+from ..point import Point
+from ..vectorized import montgomery_ladder_vectorized, np
+from ..x25519 import X25519, X25519Algorithm
+from .runner import Benchmark
+
+BATCH_SIZE = 64
+
+def field_benchmarks() -> list[Benchmark]:
+    a = decode_x_coordinate(urandom(32))
+    b = decode_x_coordinate(urandom(32))
+    square = fsquare(a)
+    values = [decode_x_coordinate(urandom(32)) or 1 for _ in range(BATCH_SIZE)]
+    return [
+        Benchmark("field.fadd", lambda: fadd(a, b)),
+        Benchmark("field.fsub", lambda: fsub(a, b)),
+        Benchmark("field.fmul", lambda: fmul(a, b)),
+        Benchmark("field.fsquare", lambda: fsquare(a)),
+        Benchmark("field.finv", lambda: finv(a)),
+        Benchmark("field.fdiv", lambda: fdiv(a, b)),
+        Benchmark("field.fsqrt", lambda: fsqrt(square)),
+        Benchmark("field.batch_inv", lambda: batch_inv(values), ops=BATCH_SIZE),
+    ]
+
+def exponentiation_benchmarks() -> list[Benchmark]:
+    # Addition chains next to the generic pow they replace
+    a = decode_x_coordinate(urandom(32))
+    return [
+        Benchmark("exponentiation.inverse_pow", lambda: pow(a, p - 2, p)),
+        Benchmark("exponentiation.inverse_chain", lambda: pow_inverse(a)),
+        Benchmark("exponentiation.sqrt_candidate_pow", lambda: pow(a, (p + 3) // 8, p)),
+        Benchmark("exponentiation.sqrt_candidate_chain", lambda: pow_p38(a)),
+        Benchmark("exponentiation.sqrt_m1_pow", lambda: pow(2, (p - 1) // 4, p)),
+        Benchmark("exponentiation.sqrt_m1_constant", lambda: SQRT_M1),
+        Benchmark("exponentiation.inv_sqrt", lambda: inv_sqrt(a)),
+    ]
+
+def methods_benchmarks() -> list[Benchmark]:
+    k = decode_scalar(urandom(32))
+    x = decode_x_coordinate(X25519().x25519_base(urandom(32)))
+    Pt = Point(BASE_X, BASE_Y)
+    benchmarks = [
+        Benchmark("methods.montgomery_ladder", lambda: montgomery_ladder(k, x)),
+        Benchmark("methods.montgomery_ladder_point", lambda: montgomery_ladder_point(k, Pt)),
+        Benchmark("methods.double_and_add", lambda: double_and_add(k, Pt)),
+        Benchmark("methods.wnaf_mult", lambda: wnaf_mult(k, Pt)),
+        Benchmark("methods.edwards_mult", lambda: edwards_mult(k, x)),
+        Benchmark("fixed_base.fixed_base_mult", lambda: fixed_base_mult(k)),
+    ]
+    scalars = [decode_scalar(urandom(32)) for _ in range(BATCH_SIZE)]
+    points = [Pt] * BATCH_SIZE
+    benchmarks.append(Benchmark("multi_scalar.multi_scalar_mult", lambda: multi_scalar_mult(scalars, points), ops=BATCH_SIZE))
+    if np is not None:
+        ks = [decode_scalar(urandom(32)) for _ in range(BATCH_SIZE)]
+        xs = [x] * BATCH_SIZE
+        benchmarks.append(Benchmark("vectorized.montgomery_ladder_vectorized", lambda: montgomery_ladder_vectorized(ks, xs), ops=BATCH_SIZE))
+    return benchmarks
+
+def encoding_benchmarks() -> list[Benchmark]:
+    b = urandom(32)
+    x = decode_x_coordinate(b)
+    arena = urandom(32 * BATCH_SIZE)
+    xs = decode_x_coordinates(arena)
+    out = bytearray(32 * BATCH_SIZE)
+    return [
+        Benchmark("encoding.decode_little_endian", lambda: decode_little_endian(b)),
+        Benchmark("encoding.decode_x_coordinate", lambda: decode_x_coordinate(b)),
+        Benchmark("encoding.encode_x_coordinate", lambda: encode_x_coordinate(x)),
+        Benchmark("encoding.clamp_scalar", lambda: clamp_scalar(b)),
+        Benchmark("encoding.decode_scalar", lambda: decode_scalar(b)),
+        Benchmark("encoding.decode_x_coordinates", lambda: decode_x_coordinates(arena), ops=BATCH_SIZE),
+        Benchmark("encoding.decode_scalars", lambda: decode_scalars(arena), ops=BATCH_SIZE),
+        Benchmark("encoding.clamp_scalars", lambda: clamp_scalars(arena), ops=BATCH_SIZE),
+        Benchmark("encoding.encode_x_coordinates", lambda: encode_x_coordinates(xs), ops=BATCH_SIZE),
+        Benchmark("encoding.encode_x_coordinates_into", lambda: encode_x_coordinates_into(xs, out), ops=BATCH_SIZE),
+    ]
+
+def api_benchmarks() -> list[Benchmark]:
+    x25519_ladder = X25519(X25519Algorithm.LADDER)
+    x25519_ladder.x25519_base(urandom(32)) # builds the fixed-base table outside of the timed region
+    sk = x25519_ladder.generate_private_key()
+    pk = x25519_ladder.derive_public_key(x25519_ladder.generate_private_key())
+    sks = [x25519_ladder.generate_private_key() for _ in range(BATCH_SIZE)]
+    pks = [pk] * BATCH_SIZE
+    out = bytearray(32 * BATCH_SIZE)
+    return [
+        Benchmark("api.generate_private_key", X25519.generate_private_key),
+        Benchmark("api.derive_public_key", lambda: x25519_ladder.derive_public_key(sk)),
+        Benchmark("api.x25519_base", lambda: x25519_ladder.x25519_base(sk)),
+        Benchmark("api.x25519", lambda: x25519_ladder.x25519(sk, pk)),
+        Benchmark("api.x25519_batch", lambda: x25519_ladder.x25519_batch(sks, pks), ops=BATCH_SIZE),
+        Benchmark("api.x25519_base_batch", lambda: x25519_ladder.x25519_base_batch(sks), ops=BATCH_SIZE),
+        Benchmark("api.x25519_base_batch_into", lambda: x25519_ladder.x25519_base_batch_into(sks, out), ops=BATCH_SIZE),
+    ]
+
+def all_benchmarks() -> list[Benchmark]:
+    return field_benchmarks() + exponentiation_benchmarks() + methods_benchmarks() + encoding_benchmarks() + api_benchmarks()
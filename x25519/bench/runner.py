@@ -0,0 +1,103 @@
+import json
+import platform
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Callable
+
+@dataclass
+class Benchmark:
+    """
+    A named operation to time. `ops` is the number of logical operations one call of `func` performs
+    (e.g. the batch size for batched APIs), so that ops/sec stays comparable across cases.
+    """
+    name: str
+    func: Callable[[], object]
+    ops: int = 1
+
+def _calibrate(func: Callable[[], object], min_time: float) -> int:
+    """
+    Find a number of calls per sample such that one sample takes at least min_time seconds.
+    """
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        if perf_counter() - start >= min_time or number >= 1 << 20:
+            return number
+        number *= 2
+
+def run_benchmark(bench: Benchmark, repeat: int = 20, min_time: float = 0.02) -> dict:
+    """
+    Time a benchmark over `repeat` samples and summarise the per-operation latency.
+    Each sample averages many calls, so the sample_p*_s percentiles describe the spread of those averages across
+    samples, not the tail latency of individual calls.
+    """
+    func = bench.func
+    number = _calibrate(func, min_time)
+
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter() - start) / (number * bench.ops))
+
+    percentiles = quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {
+        "ops_per_sec": 1 / mean(samples),
+        "mean_s": mean(samples),
+        "min_s": min(samples),
+        "sample_p50_s": percentiles[49],
+        "sample_p90_s": percentiles[89],
+        "sample_p99_s": percentiles[98],
+        "samples": repeat,
+        "calls_per_sample": number,
+        "ops_per_call": bench.ops,
+    }
+
+def run_suite(benchmarks: list[Benchmark], repeat: int = 20, min_time: float = 0.02, progress: Callable[[str, dict], None] | None = None) -> dict:
+    """
+    Run all benchmarks and return a JSON-serialisable report.
+    """
+    results = {}
+    for bench in benchmarks:
+        results[bench.name] = run_benchmark(bench, repeat, min_time)
+        if progress is not None:
+            progress(bench.name, results[bench.name])
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def compare(current: dict, baseline: dict, threshold: float = 0.1) -> list[tuple[str, float, float]]:
+    """
+    Compare two reports and list the regressions: benchmarks present in both whose throughput dropped
+    by more than `threshold` (a fraction, e.g. 0.1 for 10%).
+
+    Returns:
+        list[tuple[str, float, float]]: (name, baseline ops/sec, current ops/sec) for every regression.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append((name, base["ops_per_sec"], result["ops_per_sec"]))
+    return regressions
+
+def load_report(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+def save_report(report: dict, path: str):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,140 @@
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from os import urandom
+from typing import Callable
+from .x25519 import X25519
+
+# Cache entries are keyed by (fingerprint of the private key, peer public key). The fingerprint is a keyed BLAKE2b
+# hash with a random per-cache key, so the private key itself is never stored and fingerprints are useless outside
+# the process. Secrets are kept in bytearrays so that they can be overwritten with zeros when they leave the cache.
+FINGERPRINT_SIZE = 16
+
+class SharedSecretCache:
+    def __init__(self, backend: X25519 | None = None, max_entries: int = 4096, ttl: float | None = 3600.0, max_bytes: int | None = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Bounded cache of X25519 shared secrets for repeated (private key, peer public key) pairs, meant for
+        static-static handshakes. Least recently used entries are evicted first.
+
+        :param backend: The X25519 instance computing the misses (defaults to X25519()).
+        :param max_entries: Maximum number of cached secrets.
+        :param ttl: Lifetime of an entry in seconds (None for no expiry).
+        :param max_bytes: Maximum estimated memory used by the entries (None for no limit).
+        :param clock: Time source for the TTL.
+        """
+        if max_entries < 1:
+            raise ValueError(f"Maximum number of entries must be positive. Provided: {max_entries}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"TTL must be positive. Provided: {ttl}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"Maximum size must be positive. Provided: {max_bytes}")
+
+        self.backend = backend if backend is not None else X25519()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.size_bytes = 0
+
+        self._key = urandom(32)
+        self._entries: OrderedDict[tuple[bytes, bytes], tuple[bytearray, float | None, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fingerprint(self, sk: bytes) -> bytes:
+        """
+        Keyed fingerprint of a private key, used in place of the key itself.
+        """
+        return hashlib.blake2b(sk, digest_size=FINGERPRINT_SIZE, key=self._key).digest()
+
+    def x25519(self, sk: bytes, pk: bytes) -> bytes:
+        """
+        Same as X25519.x25519, answered from the cache when the pair was seen recently.
+
+        :param sk: The private key as bytes.
+        :param pk: The public key as bytes.
+        :return: The resulting shared secret as bytes.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        if len(pk) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+
+        key = (self.fingerprint(sk), bytes(pk))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                secret, expires, _ = entry
+                if expires is None or self.clock() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return bytes(secret)
+                self.expirations += 1
+                self._remove(key)
+            self.misses += 1
+
+        # Computed outside the lock; a concurrent miss on the same pair just stores the same secret twice
+        secret = self.backend.x25519(sk, pk)
+        self._store(key, secret)
+        return secret
+
+    def invalidate(self, pk: bytes):
+        """
+        Drop (and wipe) every cached secret computed with the given peer public key, e.g. after a key rotation.
+        """
+        pk = bytes(pk)
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == pk]:
+                self._remove(key)
+
+    def clear(self):
+        """
+        Drop (and wipe) every cached secret.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_size(key: tuple[bytes, bytes], secret: bytearray) -> int:
+        """
+        Estimated memory of one entry: its key and value objects (the OrderedDict slot itself is not counted).
+        """
+        return sys.getsizeof(key) + sys.getsizeof(key[0]) + sys.getsizeof(key[1]) + sys.getsizeof(secret) + sys.getsizeof((secret, None, 0))
+
+    def _store(self, key: tuple[bytes, bytes], secret: bytes):
+        stored = bytearray(secret)
+        size = self._entry_size(key, stored)
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (stored, expires, size)
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.size_bytes > self.max_bytes):
+                self.evictions += 1
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple[bytes, bytes]):
+        secret, _, size = self._entries.pop(key)
+        secret[:] = bytes(len(secret)) # overwrite the secret before releasing it
+        self.size_bytes -= size
@@ -0,0 +1,170 @@
+import argparse
+import mmap
+import os
+import stat
+import sys
+from collections.abc import Sequence
+from typing import BinaryIO, Iterator
+from .encoding import BytesLike, clamp_scalars
+from .parallel import ParallelX25519
+from .x25519 import X25519, X25519Algorithm
+
+# Keys are streamed as fixed-size 32-byte records: files are memory-mapped and read one chunk of records at a time,
+# so memory use depends on the chunk size only, never on the size of the input.
+RECORD_SIZE = 32
+
+class RecordReader:
+    def __init__(self, path: str):
+        """
+        Reader of packed 32-byte records from a regular file (memory-mapped), or streamed from stdin ("-") or any
+        other kind of file (pipes, FIFOs, process substitutions).
+        """
+        self.path = path
+        self._file = None
+        self._stream: BinaryIO | None = None
+        self._mmap = None
+        self._size = 0
+
+        if path == "-":
+            self._stream = sys.stdin.buffer
+            return
+
+        self._file = open(path, "rb")
+        st = os.fstat(self._file.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            # The size of a pipe says nothing about how much will come through it
+            self._stream = self._file
+            return
+
+        self._size = st.st_size
+        if self._size % RECORD_SIZE != 0:
+            self.close()
+            raise ValueError(f"{path}: size must be a multiple of {RECORD_SIZE} bytes. Provided size: {self._size}")
+        if self._size > 0:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """
+        Yield the records chunk_size at a time, each chunk as one packed buffer.
+        """
+        step = chunk_size * RECORD_SIZE
+        if self._stream is not None:
+            while chunk := self._stream.read(step):
+                if len(chunk) % RECORD_SIZE != 0:
+                    raise ValueError(f"{self.path}: input ends with an incomplete {len(chunk) % RECORD_SIZE}-byte record")
+                yield chunk
+        elif self._mmap is not None:
+            for offset in range(0, self._size, step):
+                yield self._mmap[offset:offset + step]
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _records(chunk: bytes) -> list[memoryview]:
+    view = memoryview(chunk)
+    return [view[i:i + RECORD_SIZE] for i in range(0, len(view), RECORD_SIZE)]
+
+def _open_output(path: str) -> BinaryIO:
+    return sys.stdout.buffer if path == "-" else open(path, "wb")
+
+def _write(out: BinaryIO, records: Sequence[BytesLike], hex_output: bool):
+    if hex_output:
+        out.write(b"".join(record.hex().encode() + b"\n" for record in records))
+    else:
+        out.write(b"".join(records))
+
+def _engine(args: argparse.Namespace) -> X25519 | ParallelX25519:
+    algorithm = X25519Algorithm(args.algorithm)
+    if args.workers > 1:
+        return ParallelX25519(algorithm, workers=args.workers, chunk_size=max(1, args.chunk_size // args.workers))
+    return X25519(algorithm)
+
+def keygen(args: argparse.Namespace, out: BinaryIO):
+    remaining = args.count
+    while remaining > 0:
+        n = min(remaining, args.chunk_size)
+        packed = clamp_scalars(os.urandom(n * RECORD_SIZE)) # one large urandom draw per chunk
+        _write(out, _records(packed), args.hex)
+        remaining -= n
+
+def pubkey(args: argparse.Namespace, out: BinaryIO):
+    engine = _engine(args)
+    try:
+        with RecordReader(args.private_keys) as sks:
+            for chunk in sks.chunks(args.chunk_size):
+                _write(out, engine.x25519_base_batch(_records(chunk)), args.hex)
+    finally:
+        if isinstance(engine, ParallelX25519):
+            engine.close()
+
+def agree(args: argparse.Namespace, out: BinaryIO):
+    engine = _engine(args)
+    try:
+        with RecordReader(args.private_keys) as sks, RecordReader(args.public_keys) as pks:
+            sk_chunks = sks.chunks(args.chunk_size)
+            pk_chunks = pks.chunks(args.chunk_size)
+            for sk_chunk in sk_chunks:
+                pk_chunk = next(pk_chunks, b"")
+                if len(pk_chunk) != len(sk_chunk):
+                    raise ValueError("Private and public key inputs must contain the same number of records.")
+                _write(out, engine.x25519_batch(_records(sk_chunk), _records(pk_chunk)), args.hex)
+            if next(pk_chunks, None) is not None:
+                raise ValueError("Private and public key inputs must contain the same number of records.")
+    finally:
+        if isinstance(engine, ParallelX25519):
+            engine.close()
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m x25519", description="Bulk X25519 key processing over packed 32-byte records")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-o', '--output', default="-", help='Output file for the packed 32-byte records ("-" for stdout)')
+    common.add_argument('--hex', action='store_true', help='Write one hex-encoded record per line instead of packed bytes')
+    common.add_argument('--chunk-size', type=int, default=1024, help='Number of records processed per chunk')
+
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument('--algorithm', choices=[a.value for a in X25519Algorithm], default=X25519Algorithm.LADDER.value, help='Scalar multiplication algorithm')
+    engine.add_argument('--workers', type=int, default=1, help='Number of worker processes (1 runs in this process)')
+
+    p_keygen = subparsers.add_parser("keygen", parents=[common], help="Generate random private keys")
+    p_keygen.add_argument('--count', type=int, required=True, help='Number of private keys to generate')
+    p_keygen.set_defaults(func=keygen)
+
+    p_pubkey = subparsers.add_parser("pubkey", parents=[common, engine], help="Derive the public key of every private key")
+    p_pubkey.add_argument('private_keys', nargs="?", default="-", help='File of packed private keys ("-" for stdin)')
+    p_pubkey.set_defaults(func=pubkey)
+
+    p_agree = subparsers.add_parser("agree", parents=[common, engine], help="Compute the shared secret of every (private key, public key) pair")
+    p_agree.add_argument('private_keys', help='File of packed private keys ("-" for stdin)')
+    p_agree.add_argument('public_keys', help='File of packed public keys, one per private key ("-" for stdin)')
+    p_agree.set_defaults(func=agree)
+
+    return parser
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error(f"Chunk size must be positive. Provided: {args.chunk_size}")
+
+    out = _open_output(args.output)
+    try:
+        args.func(args, out)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        out.flush()
+        if out is not sys.stdout.buffer:
+            out.close()
+    return 0
@@ -10,4 +10,11 @@ A24 = (A - 2) // 4
 
 # Base point coordinates
 BASE_X = 9
-BASE_Y = 14781619447589544791020593568409986887264606134616475288964881837755586237401
\ No newline at end of file
+BASE_Y = 14781619447589544791020593568409986887264606134616475288964881837755586237401
+
+# Twisted Edwards curve (edwards25519) birationally equivalent to Curve25519
+# equation: -x^2 + y^2 = 1 + D*x^2*y^2 over the same field
+D = (-121665 * pow(121666, p - 2, p)) % p
+
+# Order of the prime-order subgroup generated by the base point
+L = 2**252 + 27742317777372353535851937790883648493
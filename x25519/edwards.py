@@ -0,0 +1,196 @@
+from .defaults import A, BASE_X, BASE_Y, D, p
+from .exponentiation import sqrt_ratio
+from .field import batch_inv, fadd, fdiv, fmul, fsqrt, fsub, register_op_cost
+
+# Points on edwards25519 are kept in extended coordinates (X:Y:Z:T) with x = X/Z, y = Y/Z and x*y = T/Z
+# (Hisil-Wong-Carter-Dawson). The addition formulas below are complete for a = -1, so there are no
+# exceptional cases to handle (no point at infinity, no P == Q special case).
+ExtendedPoint = tuple[int, int, int, int]
+
+# Affine point (x, y) stored as (y + x, y - x, 2*d*x*y), which saves work in mixed additions
+PrecomputedPoint = tuple[int, int, int]
+
+D2 = (2 * D) % p
+
+# The quadratic twist of Curve25519 (2*v^2 = u^3 + A*u^2 + u, where X25519 also accepts inputs) maps in the same way to
+# the twisted Edwards curve -2*x^2 + y^2 = 1 + 2*d*x^2*y^2. Its a = -2 is not a square, so the formulas are not
+# complete there, but the exceptional cases only involve points of small order.
+TWIST_A = -2
+TWIST_D = D2
+
+IDENTITY: ExtendedPoint = (0, 1, 1, 0)
+
+def _sqrt_minus_a_minus_2() -> int:
+    """
+    Square root of -(A + 2) = -486664 used by the birational map, choosing the root that sends the
+    Montgomery base point to the standard (even x) edwards25519 base point.
+    """
+    root = fsqrt(-(A + 2) % p)
+    x = fdiv(fmul(root, BASE_X), BASE_Y)
+    return root if x & 1 == 0 else p - root
+
+SQRT_M486664 = _sqrt_minus_a_minus_2()
+
+def montgomery_to_edwards(u: int, v: int) -> ExtendedPoint:
+    """
+    Map a Montgomery point (u, v) to edwards25519 using the birational map from RFC 7748:
+    (x, y) = (sqrt(-486664)*u/v, (u-1)/(u+1))
+    """
+    x = fdiv(fmul(SQRT_M486664, u), v)
+    y = fdiv(fsub(u, 1), fadd(u, 1))
+    return (x, y, 1, fmul(x, y))
+
+def montgomery_u_to_edwards(u: int) -> tuple[ExtendedPoint, int, int]:
+    """
+    Map a Montgomery u-coordinate to an extended point, recovering v with one square root (either root works,
+    as u(k*P) does not depend on the sign of v). Points of the twist land on the twisted curve above.
+    No inversion is needed: with x = X0/Z0 and y = Y0/Z0, the extended point is (X0*Z0 : Y0*Z0 : Z0^2 : X0*Y0).
+    Args:
+        u (int): The u-coordinate.
+
+    Returns:
+        tuple[ExtendedPoint, int, int]: The point and the (a, d) parameters of the curve it lies on.
+    """
+    u %= p
+    if u == 0 or u == p - 1:
+        # (0, 0) and (-1, v) have order 2 and 4 and are exceptional points of the map; the ladder raises a
+        # ValueError for them as well (its final division is 0/0 or 1/0 for every clamped scalar)
+        raise ValueError("The provided u-coordinate is a point of small order.")
+
+    rhs = (u * u % p * u + A * u * u + u) % p
+    is_square, v = sqrt_ratio(rhs, 1)
+    a, d = -1, D
+    if not is_square:
+        _, v = sqrt_ratio(rhs, 2)
+        v, a, d = 2 * v % p, TWIST_A, TWIST_D
+
+    X0 = SQRT_M486664 * u % p * (u + 1) % p
+    Y0 = (u - 1) * v % p
+    Z0 = v * (u + 1) % p
+    return (X0 * Z0 % p, Y0 * Z0 % p, Z0 * Z0 % p, X0 * Y0 % p), a, d
+
+# Inlined operations besides sqrt_ratio (on the twist, the second sqrt_ratio and one doubling come on top)
+register_op_cost(montgomery_u_to_edwards, fadd=4, fsub=1, fmul=10, fsquare=2)
+
+def edwards_to_montgomery_projective(P: ExtendedPoint) -> tuple[int, int]:
+    """
+    Projective (U:W) = (Z+Y : Z-Y) form of the Montgomery u-coordinate, without the division.
+    """
+    _, Y, Z, _ = P
+    return fadd(Z, Y), fsub(Z, Y)
+
+def edwards_add(P: ExtendedPoint, Q: ExtendedPoint) -> ExtendedPoint:
+    """
+    Add two points in extended coordinates (add-2008-hwcd-3, as in RFC 8032 Section 5.1.4).
+    """
+    X1, Y1, Z1, T1 = P
+    X2, Y2, Z2, T2 = Q
+    a = (Y1 - X1) * (Y2 - X2) % p
+    b = (Y1 + X1) * (Y2 + X2) % p
+    c = T1 * D2 * T2 % p
+    d = 2 * Z1 * Z2 % p
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f % p, g * h % p, f * g % p, e * h % p)
+
+def edwards_madd(P: ExtendedPoint, Q: PrecomputedPoint) -> ExtendedPoint:
+    """
+    Add an extended point and a precomputed affine point (mixed addition, saves one multiplication).
+    """
+    X1, Y1, Z1, T1 = P
+    ypx, ymx, xy2d = Q
+    a = (Y1 - X1) * ymx % p
+    b = (Y1 + X1) * ypx % p
+    c = T1 * xy2d % p
+    d = 2 * Z1
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f % p, g * h % p, f * g % p, e * h % p)
+
+def edwards_double(P: ExtendedPoint) -> ExtendedPoint:
+    """
+    Double a point in extended coordinates (dbl-2008-hwcd, as in RFC 8032 Section 5.1.4).
+    """
+    X1, Y1, Z1, _ = P
+    a = X1 * X1 % p
+    b = Y1 * Y1 % p
+    c = 2 * Z1 * Z1 % p
+    h = a + b
+    e = h - (X1 + Y1) * (X1 + Y1) % p
+    g = a - b
+    f = c + g
+    return (e * f % p, g * h % p, f * g % p, e * h % p)
+
+# Field operations inlined in the formulas above (multiplications by the constant 2 count as additions)
+register_op_cost(edwards_add, fadd=5, fsub=4, fmul=9)
+register_op_cost(edwards_madd, fadd=4, fsub=3, fmul=7)
+register_op_cost(edwards_double, fadd=4, fsub=2, fmul=4, fsquare=4)
+
+# The same formulas for any twisted Edwards curve a*x^2 + y^2 = 1 + d*x^2*y^2, used by the X25519 backend on both
+# edwards25519 (a = -1) and the curve the twist maps to (a = -2). Repeated addends are cached as (X, Y, Z, d*T, X+Y),
+# and negated as (-X, Y, Z, -d*T, Y-X).
+CachedPoint = tuple[int, int, int, int, int]
+
+def twisted_edwards_double(P: ExtendedPoint, a: int) -> ExtendedPoint:
+    """
+    Double a point on a*x^2 + y^2 = 1 + d*x^2*y^2 in extended coordinates (dbl-2008-hwcd).
+    """
+    X1, Y1, Z1, _ = P
+    A = X1 * X1 % p
+    B = Y1 * Y1 % p
+    C = 2 * Z1 * Z1 % p
+    D = a * A
+    E = (X1 + Y1) * (X1 + Y1) % p - A - B
+    G = D + B
+    F = G - C
+    H = D - B
+    return (E * F % p, G * H % p, F * G % p, E * H % p)
+
+def twisted_edwards_add(P: ExtendedPoint, Q: ExtendedPoint, a: int, d: int) -> ExtendedPoint:
+    """
+    Add two points on a*x^2 + y^2 = 1 + d*x^2*y^2 in extended coordinates (add-2008-hwcd, unified).
+    """
+    return twisted_edwards_add_cached(P, to_cached(Q, d), a)
+
+def twisted_edwards_add_cached(P: ExtendedPoint, Q: CachedPoint, a: int) -> ExtendedPoint:
+    """
+    Add an extended point and a cached point (see to_cached) on a*x^2 + y^2 = 1 + d*x^2*y^2.
+    """
+    X1, Y1, Z1, T1 = P
+    X2, Y2, Z2, dT2, S2 = Q
+    A = X1 * X2 % p
+    B = Y1 * Y2 % p
+    C = T1 * dT2 % p
+    D = Z1 * Z2 % p
+    E = (X1 + Y1) * S2 % p - A - B
+    F = D - C
+    G = D + C
+    H = B - a * A
+    return (E * F % p, G * H % p, F * G % p, E * H % p)
+
+def to_cached(P: ExtendedPoint, d: int) -> CachedPoint:
+    X, Y, Z, T = P
+    return (X, Y, Z, d * T % p, X + Y)
+
+def cached_neg(Q: CachedPoint) -> CachedPoint:
+    X, Y, Z, dT, _ = Q
+    return (-X, Y, Z, -dT, Y - X)
+
+# Multiplications by 2 and by the small constant a count as additions
+register_op_cost(twisted_edwards_double, fadd=4, fsub=4, fmul=4, fsquare=4)
+register_op_cost(twisted_edwards_add_cached, fadd=3, fsub=4, fmul=9)
+register_op_cost(to_cached, fadd=1, fmul=1)
+
+def to_precomputed_batch(points: list[ExtendedPoint]) -> list[PrecomputedPoint]:
+    """
+    Normalise extended points to affine and store them in the (y+x, y-x, 2dxy) form, sharing a single inversion
+    (see batch_inv).
+    """
+    z_invs = batch_inv([Z for _, _, Z, _ in points])
+    out = []
+    for (X, Y, _, _), z_inv in zip(points, z_invs):
+        x = X * z_inv % p
+        y = Y * z_inv % p
+        out.append(((y + x) % p, (y - x) % p, D2 * x % p * y % p))
+    return out
+
+# Montgomery base point (BASE_X, BASE_Y) mapped to edwards25519
+EDWARDS_BASE = montgomery_to_edwards(BASE_X, BASE_Y)
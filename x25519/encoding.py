@@ -1,33 +1,33 @@
 from .defaults import p
 
+# Bit masks used to clear the most significant bit of x-coordinates and to clamp scalars (see clamp_scalar)
+X_COORDINATE_MASK = (1 << 255) - 1
+SCALAR_CLEAR_MASK = ((1 << 255) - 1) & ~7
+SCALAR_SET_BIT = 1 << 254
+
+# Keys may be passed as any of these (e.g. memoryview slices of a larger buffer); they are only read with int.from_bytes
+BytesLike = bytes | bytearray | memoryview
+
 def decode_little_endian(b: bytes) -> int:
     """
     Decode a little-endian byte sequence to an integer.
     """
-    return sum((b[i] << (8 * i)) for i in range(len(b)))
+    return int.from_bytes(b, "little")
 
-def decode_x_coordinate(b: bytes) -> int:
+def decode_x_coordinate(b: BytesLike) -> int:
     """
     Decode a 32-byte little-endian byte sequence to an x-coordinate integer.
     """
     assert len(b) == 32, "Input must be 32 bytes long."
     
     # Clear the highest bit of the last byte
-    b = b[:-1] + bytes([b[-1] & 0x7F])
-
-    return decode_little_endian(b) % p
+    return (int.from_bytes(b, "little") & X_COORDINATE_MASK) % p
 
 def encode_x_coordinate(x: int) -> bytes:
     """
     Encode an x-coordinate integer to a 32-byte little-endian byte sequence.
     """
-    x %= p
-    
-    b = bytearray(32)
-    for i in range(32):
-        b[i] = (x >> (8 * i)) & 0xFF
-    
-    return bytes(b)
+    return (x % p).to_bytes(32, "little")
 
 def clamp_scalar(k: bytes) -> bytes:
     """
@@ -38,20 +38,84 @@ def clamp_scalar(k: bytes) -> bytes:
     """
     assert len(k) == 32, "Input must be 32 bytes long."
 
-    k_arr = bytearray(k)
-    k_arr[0] &= 248          
-    k_arr[31] &= 127        
-    k_arr[31] |= 64         
-    
-    return bytes(k_arr)
+    return ((int.from_bytes(k, "little") & SCALAR_CLEAR_MASK) | SCALAR_SET_BIT).to_bytes(32, "little")
 
-def decode_scalar(k: bytes) -> int:
+def decode_scalar(k: BytesLike) -> int:
     """
     Decode a 32-byte little-endian byte sequence to a clamped scalar integer.
     I did clamping first before decoding as per RFC 7748; it's the other way around in lecture notes.
-    However, the result is the same either way.
+    However, the result is the same either way (here both happen on the integer directly).
     """
     assert len(k) == 32, "Input must be 32 bytes long."
     
-    k_clamped = clamp_scalar(k)
-    return decode_little_endian(k_clamped)
+    return (int.from_bytes(k, "little") & SCALAR_CLEAR_MASK) | SCALAR_SET_BIT
+
+# Bulk codecs over packed key arenas: N keys stored back to back in one contiguous buffer of N*32 bytes
+# (bytes, bytearray, memoryview, mmap, ...). Keys are read through memoryview slices, so no per-key bytes
+# objects are created on the decoding side.
+
+def _arena_view(buf) -> memoryview:
+    view = memoryview(buf).cast("B")
+    if len(view) % 32 != 0:
+        raise ValueError(f"Key arena length must be a multiple of 32 bytes. Provided length: {len(view)}")
+    return view
+
+def decode_x_coordinates(buf) -> list[int]:
+    """
+    Decode every 32-byte x-coordinate of a packed arena (as decode_x_coordinate does for one).
+    """
+    view = _arena_view(buf)
+    return [(int.from_bytes(view[i:i + 32], "little") & X_COORDINATE_MASK) % p for i in range(0, len(view), 32)]
+
+def decode_scalars(buf) -> list[int]:
+    """
+    Decode and clamp every 32-byte scalar of a packed arena (as decode_scalar does for one).
+    """
+    view = _arena_view(buf)
+    return [(int.from_bytes(view[i:i + 32], "little") & SCALAR_CLEAR_MASK) | SCALAR_SET_BIT for i in range(0, len(view), 32)]
+
+def clamp_scalars(buf) -> bytes:
+    """
+    Clamp every 32-byte scalar of a packed arena, returning a new packed arena.
+    """
+    return encode_scalars(decode_scalars(buf))
+
+def encode_scalars(ks: list[int]) -> bytes:
+    """
+    Encode scalars (each below 2^256) into one packed arena of 32-byte little-endian values.
+    """
+    return b"".join(k.to_bytes(32, "little") for k in ks)
+
+def encode_x_coordinates(xs: list[int]) -> bytes:
+    """
+    Encode x-coordinates into one packed arena (as encode_x_coordinate does for one).
+    """
+    return b"".join((x % p).to_bytes(32, "little") for x in xs)
+
+# Encoders writing into caller-provided buffers (bytearray, memoryview, mmap, ...), e.g. straight into a send buffer.
+# Each value is written at offset + i * stride, so results can also be interleaved with other fields.
+
+def _output_view(out, offset: int, count: int, stride: int = 32) -> memoryview:
+    view = memoryview(out).cast("B")
+    if view.readonly:
+        raise ValueError("Output buffer must be writable.")
+    if stride < 32:
+        raise ValueError(f"Stride must be at least 32 bytes. Provided: {stride}")
+    if offset < 0 or (count > 0 and offset + (count - 1) * stride + 32 > len(view)):
+        raise ValueError(f"Output buffer of {len(view)} bytes is too small for {count} values at offset {offset} with stride {stride}.")
+    return view
+
+def encode_x_coordinate_into(x: int, out, offset: int = 0):
+    """
+    Encode an x-coordinate into out[offset:offset + 32] (as encode_x_coordinate does into a new bytes object).
+    """
+    _output_view(out, offset, 1)[offset:offset + 32] = (x % p).to_bytes(32, "little")
+
+def encode_x_coordinates_into(xs: list[int], out, offset: int = 0, stride: int = 32):
+    """
+    Encode x-coordinates into out, the i-th one at offset + i * stride.
+    """
+    view = _output_view(out, offset, len(xs), stride)
+    for x in xs:
+        view[offset:offset + 32] = (x % p).to_bytes(32, "little")
+        offset += stride
@@ -0,0 +1,90 @@
+from .defaults import p
+
+# Fixed addition chains for the exponents needed by p = 2^255 - 19 (as in ref10 / RFC 8032 implementations).
+# All of them share the computation of a^(2^250 - 1) (11 multiplications and 250 squarings overall), and the
+# long runs of squarings use the cheap reduction 2^255 = 19 (mod p) instead of a full division by p.
+
+# sqrt(-1) mod p = 2^((p-1)/4), precomputed once instead of on every call that needs it
+SQRT_M1 = 19681161376707505956807079304988542015446066515923890162744021073123829784752
+
+_MASK_255 = (1 << 255) - 1
+
+def _square_n(x: int, n: int) -> int:
+    """
+    Square x n times. Results are congruent to the exact value modulo p but not fully reduced
+    (two folds of the high bits keep them below 2^256).
+    """
+    for _ in range(n):
+        x = x * x
+        x = (x & _MASK_255) + 19 * (x >> 255)
+        x = (x & _MASK_255) + 19 * (x >> 255)
+    return x
+
+def _pow_2_250_1(a: int) -> tuple[int, int]:
+    """
+    Compute (a^(2^250 - 1), a^11), the common prefix of all chains below.
+    """
+    a2 = _square_n(a, 1)
+    a9 = _square_n(a2, 2) * a % p
+    a11 = a9 * a2 % p
+    t = _square_n(a11, 1) * a9 % p           # a^(2^5 - 1)
+    t5 = t
+    t = _square_n(t, 5) * t5 % p             # a^(2^10 - 1)
+    t10 = t
+    t = _square_n(t, 10) * t10 % p           # a^(2^20 - 1)
+    t = _square_n(t, 20) * t % p             # a^(2^40 - 1)
+    t = _square_n(t, 10) * t10 % p           # a^(2^50 - 1)
+    t50 = t
+    t = _square_n(t, 50) * t50 % p           # a^(2^100 - 1)
+    t = _square_n(t, 100) * t % p            # a^(2^200 - 1)
+    t = _square_n(t, 50) * t50 % p           # a^(2^250 - 1)
+    return t, a11
+
+def pow_inverse(a: int) -> int:
+    """
+    Compute a^(p-2) = a^(2^255 - 21), i.e. the inverse of a (0 for a = 0).
+    """
+    t, a11 = _pow_2_250_1(a % p)
+    return _square_n(t, 5) * a11 % p         # a^(2^255 - 32 + 11)
+
+def pow_p58(a: int) -> int:
+    """
+    Compute a^((p-5)/8) = a^(2^252 - 3).
+    """
+    a %= p
+    t, _ = _pow_2_250_1(a)
+    return _square_n(t, 2) * a % p           # a^(2^252 - 4 + 1)
+
+def pow_p38(a: int) -> int:
+    """
+    Compute a^((p+3)/8) = a * a^((p-5)/8), the square root candidate of RFC 8032 Section 5.1.3.
+    """
+    return pow_p58(a) * a % p
+
+def sqrt_ratio(u: int, v: int) -> tuple[bool, int]:
+    """
+    Compute sqrt(u/v) with a single exponentiation and no separate inversion (RFC 8032 Section 5.1.3):
+    r = u*v^3 * (u*v^7)^((p-5)/8), then r or r*sqrt(-1) is the root if u/v is a square.
+    Args:
+        u (int): The numerator.
+        v (int): The denominator (non-zero).
+
+    Returns:
+        tuple[bool, int]: Whether u/v is a square, and the root r (valid only if it is).
+    """
+    u %= p
+    v %= p
+    v3 = v * v % p * v % p
+    r = u * v3 % p * pow_p58(u * v3 % p * v3 % p * v % p) % p
+    check = v * r % p * r % p
+    if check == u:
+        return True, r
+    if check == (-u) % p:
+        return True, r * SQRT_M1 % p
+    return False, r
+
+def inv_sqrt(a: int) -> tuple[bool, int]:
+    """
+    Compute 1/sqrt(a) (see sqrt_ratio).
+    """
+    return sqrt_ratio(1, a)
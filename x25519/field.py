@@ -1,4 +1,11 @@
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from collections.abc import Generator
+from types import CodeType, FunctionType
 from .defaults import p
+from .exponentiation import SQRT_M1, pow_inverse, pow_p38, sqrt_ratio
 
 def fadd(a: int, b: int) -> int:
     """
@@ -22,16 +29,44 @@ def fsquare(a: int) -> int:
     """
     Square a field element modulo p.
     """
-    return fmul(a, a)
+    return (a * a) % p
 
 def finv(a: int) -> int:
     """
     Compute inverse by Fermat’s little theorem
     a^(p-1) = a.a^(p-2) ≡ 1 (mod p) 
+    The power is computed with the fixed addition chain for p-2 (see exponentiation.py).
     """
-    if a == 0:
+    if a % p == 0:
         raise ValueError("Cannot compute inverse of zero.")
-    return pow(a, p - 2, p)
+    return pow_inverse(a)
+
+def batch_inv(values: list[int]) -> list[int]:
+    """
+    Invert many field elements at once using Montgomery's simultaneous inversion trick:
+    one inversion plus 3(n-1) multiplications instead of n inversions.
+    """
+    n = len(values)
+    if n == 0:
+        return []
+
+    # prefix[i] = values[0] * ... * values[i]
+    prefix = [0] * n
+    acc = 1
+    for i, a in enumerate(values):
+        if a % p == 0:
+            raise ValueError("Cannot compute inverse of zero.")
+        acc = fmul(acc, a)
+        prefix[i] = acc
+
+    inv = finv(acc)
+    result = [0] * n
+    for i in range(n - 1, 0, -1):
+        result[i] = fmul(inv, prefix[i - 1])
+        inv = fmul(inv, values[i])
+    result[0] = inv
+
+    return result
 
 def fdiv(a: int, b: int) -> int:
     """
@@ -48,12 +83,82 @@ def fsqrt(a: int) -> int:
     if a == 0:
         return 0
     
-    candidate_root_1 = pow(a, (p + 3) // 8, p)
+    candidate_root_1 = pow_p38(a)
     if fsquare(candidate_root_1) % p == a:
         return candidate_root_1
     
-    candidate_root_2 = fmul(candidate_root_1, pow(2, (p - 1) // 4, p))
+    candidate_root_2 = fmul(candidate_root_1, SQRT_M1)
     if fsquare(candidate_root_2) % p == a:
         return candidate_root_2
     
-    raise ValueError("No square root exists for the given element in the field.")
\ No newline at end of file
+    raise ValueError("No square root exists for the given element in the field.")
+
+# Opt-in operation counting for profiling.
+# Counting uses a (per-thread) profile hook that is only installed inside a field_op_counter() scope, so the
+# arithmetic above has no overhead at all when counting is disabled. Every function registered with
+# register_op_cost adds its cost each time it is called. Kernels that inline their field arithmetic (such as the
+# Montgomery ladder) register the fixed number of operations a single call performs instead.
+
+@dataclass
+class FieldOpCounter:
+    fadd: int = 0
+    fsub: int = 0
+    fmul: int = 0
+    fsquare: int = 0
+    finv: int = 0
+    fsqrt: int = 0
+    cswap: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+_op_costs: dict[CodeType, tuple[tuple[str, int], ...]] = {}
+_counting = threading.local()
+
+def register_op_cost(func: FunctionType, **counts: int):
+    """
+    Declare how many field operations one call of func performs (e.g. register_op_cost(fmul, fmul=1)).
+    """
+    _op_costs[func.__code__] = tuple(counts.items())
+
+def _count_ops(frame, event, arg):
+    if event == "call":
+        cost = _op_costs.get(frame.f_code)
+        if cost is not None:
+            for counter in _counting.counters:
+                for name, count in cost:
+                    setattr(counter, name, getattr(counter, name) + count)
+
+@contextmanager
+def field_op_counter() -> Generator[FieldOpCounter]:
+    """
+    Count field operations performed in the current thread within the scope:
+
+        with field_op_counter() as c:
+            montgomery_ladder(k, x)
+        print(c.fmul, c.fsquare, c.finv)
+
+    Scopes can be nested (outer counters include the inner ones). Any other profiler installed with
+    sys.setprofile is suspended for the duration of the scope.
+    """
+    counters = getattr(_counting, "counters", None)
+    if counters is None:
+        counters = _counting.counters = []
+
+    counter = FieldOpCounter()
+    previous = sys.getprofile()
+    counters.append(counter)
+    sys.setprofile(_count_ops)
+    try:
+        yield counter
+    finally:
+        sys.setprofile(previous)
+        counters.pop()
+
+register_op_cost(fadd, fadd=1)
+register_op_cost(fsub, fsub=1)
+register_op_cost(fmul, fmul=1)
+register_op_cost(fsquare, fsquare=1)
+register_op_cost(finv, finv=1)
+register_op_cost(fsqrt, fsqrt=1)
+register_op_cost(sqrt_ratio, fsqrt=1)
@@ -0,0 +1,95 @@
+from functools import cache
+from .defaults import L
+from .edwards import EDWARDS_BASE, IDENTITY, ExtendedPoint, PrecomputedPoint, edwards_add, edwards_double, edwards_madd, edwards_to_montgomery_projective, to_precomputed_batch
+from .field import fdiv
+
+# Signed radix-16 fixed-base multiplication (as in the ref10 implementation of Ed25519).
+# The scalar is reduced modulo the subgroup order L (< 2^253), written as 64 signed digits e_i in [-8, 8)
+# and k*B = sum_i e_i * 16^i * B is evaluated directly from a table holding j * 16^i * B for j = 1..8.
+# No doublings are needed at all: one scalar multiplication costs at most 64 mixed additions.
+WINDOW_BITS = 4
+WINDOWS = 64
+TABLE_WIDTH = 1 << (WINDOW_BITS - 1)
+
+Table = tuple[tuple[PrecomputedPoint, ...], ...]
+
+def build_table(P: ExtendedPoint, windows: int = WINDOWS) -> Table:
+    """
+    Build the table with entries table[i][j-1] = j * 16^i * P for i in [0, windows) and j in [1, 8].
+    All entries are normalised to affine with a single shared inversion.
+    """
+    multiples = []
+    row_base = P
+    for _ in range(windows):
+        multiple = row_base
+        for _ in range(TABLE_WIDTH):
+            multiples.append(multiple)
+            multiple = edwards_add(multiple, row_base)
+
+        for _ in range(WINDOW_BITS):
+            row_base = edwards_double(row_base)
+
+    entries = to_precomputed_batch(multiples)
+    return tuple(tuple(entries[i:i + TABLE_WIDTH]) for i in range(0, len(entries), TABLE_WIDTH))
+
+@cache
+def base_table() -> Table:
+    """
+    Build (once) the table of the base point B, with entries table[i][j-1] = j * 16^i * B for i in [0, 64) and j in [1, 8].
+    """
+    return build_table(EDWARDS_BASE)
+
+def signed_digits(k: int, windows: int = WINDOWS) -> list[int]:
+    """
+    Recode a scalar k < 2^(4*windows - 3) (k < 2^253 by default) into signed radix-16 digits e_i in [-8, 8]
+    with k = sum_i e_i * 16^i.
+    """
+    digits = []
+    carry = 0
+    for _ in range(windows):
+        d = (k & 15) + carry
+        k >>= 4
+        carry = (d + 8) >> 4
+        digits.append(d - (carry << 4))
+    return digits
+
+def table_mult_projective(table: Table, k: int) -> tuple[int, int]:
+    """
+    Multiply the point of a table from build_table by k < 2^(4*len(table) - 3), without any doubling.
+
+    Returns:
+        tuple[int, int]: Projective (X:Z) representation of the x-coordinate of k*P.
+    """
+    R = IDENTITY
+    for i, e in enumerate(signed_digits(k, len(table))):
+        if e > 0:
+            R = edwards_madd(R, table[i][e - 1])
+        elif e < 0:
+            ypx, ymx, xy2d = table[i][-e - 1]
+            R = edwards_madd(R, (ymx, ypx, -xy2d)) # -(x, y) = (-x, y) swaps y+x and y-x
+    return edwards_to_montgomery_projective(R)
+
+def fixed_base_mult_projective(k: int) -> tuple[int, int]:
+    """
+    Same as fixed_base_mult but without the final division.
+
+    Returns:
+        tuple[int, int]: Projective (X:Z) representation of the x-coordinate of k*B.
+    """
+    return table_mult_projective(base_table(), (k & ((1 << 255) - 1)) % L) # the ladder uses the low 255 bits
+
+def fixed_base_mult(k: int) -> int:
+    """
+    Compute the u-coordinate of k*B for the base point B using the precomputed table.
+    Output is identical to montgomery_ladder(k, BASE_X).
+    Args:
+        k (int): The scalar multiplier.
+
+    Like the ladder, only the low 255 bits of k are used; the base point generates the subgroup of order L, so the
+    result can then be reduced modulo L.
+
+    Returns:
+        int: The x-coordinate of the resulting point after multiplication.
+    """
+    u, w = fixed_base_mult_projective(k)
+    return fdiv(u, w)
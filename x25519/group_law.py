@@ -1,7 +1,13 @@
-from .defaults import A
-from .field import fadd, fmul, fsquare, fsub, fdiv
+from .defaults import A, p
+from .field import fadd, fmul, fsquare, fsub, fdiv, finv
 from .point import Point, PointAtInfinity, INF, is_infinity
 
+# Projective coordinates (X:Y:Z) represent the affine point (X/Z, Y/Z); the point at infinity is (0:1:0).
+# They let additions and doublings be chained without any inversion until the very end.
+ProjectivePoint = tuple[int, int, int]
+
+PROJECTIVE_INF: ProjectivePoint = (0, 1, 0)
+
 def point_addition(P: Point | PointAtInfinity, Q: Point | PointAtInfinity) -> Point | PointAtInfinity:
     """
     Add two points P and Q on the Curve25519.
@@ -38,7 +44,7 @@ def point_addition(P: Point | PointAtInfinity, Q: Point | PointAtInfinity) -> Po
     # Computing y3 = lambda*(x1 - x3) - y1
     y3 = fsub(fmul(slope, fsub(x1, x3)), y1)
 
-    return Point(x3, y3)
+    return Point._unchecked(x3, y3)
 
 def point_doubling(P: Point | PointAtInfinity) -> Point | PointAtInfinity:
     """
@@ -71,4 +77,99 @@ def point_doubling(P: Point | PointAtInfinity) -> Point | PointAtInfinity:
     # Computing y3 = lambda*(x - x3) - y
     y3 = fsub(fmul(slope, fsub(x, x3)), y)
 
-    return Point(x3, y3)
\ No newline at end of file
+    return Point._unchecked(x3, y3)
+
+def to_projective(P: Point | PointAtInfinity) -> ProjectivePoint:
+    """
+    Convert an affine point to projective coordinates (X:Y:1).
+    """
+    if is_infinity(P):
+        return PROJECTIVE_INF
+
+    assert isinstance(P, Point), "P must be a Point after infinity check"
+    return (P.x, P.y, 1)
+
+def from_projective(P: ProjectivePoint) -> Point | PointAtInfinity:
+    """
+    Convert a projective point back to an affine point (one inversion).
+    """
+    X, Y, Z = P
+    if Z % p == 0:
+        return INF
+
+    z_inv = finv(Z)
+    return Point._unchecked(fmul(X, z_inv), fmul(Y, z_inv))
+
+def projective_point_addition(P: ProjectivePoint, Q: ProjectivePoint) -> ProjectivePoint:
+    """
+    Add two points P and Q on the Curve25519 in projective coordinates (no inversion).
+    Args:
+        P (ProjectivePoint): First point.
+        Q (ProjectivePoint): Second point.
+
+    With u = Y2*Z1 - Y1*Z2, v = X2*Z1 - X1*Z2 (so that lambda = u/v) and w = Z1*Z2:
+    R = u^2*w - v^2*(A*w + X1*Z2 + X2*Z1), X3 = v*R, Y3 = u*(v^2*X1*Z2 - R) - v^3*Y1*Z2, Z3 = v^3*w
+
+    Returns:
+        ProjectivePoint: The resulting point P + Q.
+    """
+    X1, Y1, Z1 = P
+    X2, Y2, Z2 = Q
+
+    if Z1 % p == 0:
+        return Q
+    elif Z2 % p == 0:
+        return P
+
+    X1Z2 = fmul(X1, Z2)
+    X2Z1 = fmul(X2, Z1)
+    Y1Z2 = fmul(Y1, Z2)
+    u = fsub(fmul(Y2, Z1), Y1Z2)
+    v = fsub(X2Z1, X1Z2)
+
+    if v == 0 and u == 0:
+        return projective_point_doubling(P)
+    elif v == 0:
+        return PROJECTIVE_INF
+
+    w = fmul(Z1, Z2)
+    vv = fsquare(v)
+    vvv = fmul(vv, v)
+    R = fsub(fmul(fsquare(u), w), fmul(vv, fadd(fmul(A, w), fadd(X1Z2, X2Z1))))
+
+    X3 = fmul(v, R)
+    Y3 = fsub(fmul(u, fsub(fmul(vv, X1Z2), R)), fmul(vvv, Y1Z2))
+    Z3 = fmul(vvv, w)
+
+    return (X3, Y3, Z3)
+
+def projective_point_doubling(P: ProjectivePoint) -> ProjectivePoint:
+    """
+    Double a point P on the Curve25519 in projective coordinates (no inversion).
+    Args:
+        P (ProjectivePoint): The point to double.
+
+    With n = 3*X^2 + 2*A*X*Z + Z^2 and d = 2*Y*Z (so that lambda = n/d):
+    R = n^2*Z - d^2*(A*Z + 2*X), X3 = d*R, Y3 = n*(d^2*X - R) - d^3*Y, Z3 = d^3*Z
+
+    Returns:
+        ProjectivePoint: The resulting point 2P.
+    """
+    X, Y, Z = P
+
+    if Z % p == 0 or Y % p == 0:
+        return PROJECTIVE_INF
+
+    XX = fsquare(X)
+    XZ = fmul(X, Z)
+    n = fadd(fadd(fmul(3, XX), fmul(2 * A, XZ)), fsquare(Z))
+    d = fmul(2, fmul(Y, Z))
+    dd = fsquare(d)
+    ddd = fmul(dd, d)
+    R = fsub(fmul(fsquare(n), Z), fmul(dd, fadd(fmul(A, Z), fadd(X, X))))
+
+    X3 = fmul(d, R)
+    Y3 = fsub(fmul(n, fsub(fmul(dd, X), R)), fmul(ddd, Y))
+    Z3 = fmul(ddd, Z)
+
+    return (X3, Y3, Z3)
@@ -0,0 +1,151 @@
+import functools
+import math
+import threading
+from time import perf_counter_ns
+from typing import Callable
+
+# HDR-style latency histogram: values (in nanoseconds) are bucketed log-linearly, with 2^(SUB_BUCKET_BITS-1)
+# equal-width buckets per power of two, so every recorded value is known to within 1 / 2^(SUB_BUCKET_BITS-1)
+# (under 1%) whatever its magnitude, in constant memory. Buckets are stored sparsely.
+SUB_BUCKET_BITS = 8
+
+# Span callbacks receive (method name, start time in ns, end time in ns, exception raised or None).
+# Start and end come from time.perf_counter_ns.
+SpanCallback = Callable[[str, int, int, BaseException | None], None]
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    @staticmethod
+    def bucket_index(value: int) -> int:
+        """
+        Bucket of a non-negative value: values below 2^SUB_BUCKET_BITS have their own bucket; above that, the
+        value is shifted down to its SUB_BUCKET_BITS most significant bits.
+        """
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def bucket_range(index: int) -> tuple[int, int]:
+        """
+        Smallest and largest value of a bucket (inverse of bucket_index).
+        """
+        shift = max((index >> (SUB_BUCKET_BITS - 1)) - 1, 0)
+        mantissa = index - (shift << (SUB_BUCKET_BITS - 1))
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int):
+        index = self.bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q: float) -> int:
+        """
+        Value below which q percent of the recorded values fall (the largest value of the bucket that holds that
+        rank, capped at the maximum), or 0 if nothing was recorded.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100. Provided: {q}")
+        if self.count == 0:
+            return 0
+
+        rank = max(math.ceil(q / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_range(index)[1], self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ns": self.total / self.count if self.count else 0.0,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+            "p999_ns": self.percentile(99.9),
+        }
+
+class Instrumentation:
+    def __init__(self):
+        """
+        Per-method call counts, error counts and latency histograms, plus tracing callbacks.
+        Attach it to an X25519 instance with X25519.enable_instrumentation; one Instrumentation can be shared by
+        several instances (and threads).
+        """
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.errors: dict[str, int] = {}
+        self._callbacks: list[SpanCallback] = []
+        self._lock = threading.Lock()
+
+    def add_span_callback(self, callback: SpanCallback):
+        """
+        Call callback(name, start_ns, end_ns, error) after every instrumented call, e.g. to emit a tracing span.
+        Callbacks run in the calling thread, after the measurement; exceptions they raise propagate to the caller.
+        """
+        with self._lock:
+            self._callbacks = self._callbacks + [callback]
+
+    def remove_span_callback(self, callback: SpanCallback):
+        with self._lock:
+            self._callbacks = [cb for cb in self._callbacks if cb is not callback]
+
+    def record(self, name: str, start_ns: int, end_ns: int, error: BaseException | None = None):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(end_ns - start_ns)
+            if error is not None:
+                self.errors[name] = self.errors.get(name, 0) + 1
+            callbacks = self._callbacks
+
+        for callback in callbacks:
+            callback(name, start_ns, end_ns, error)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap func so that each call is timed and recorded under name.
+        """
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                self.record(name, start, perf_counter_ns(), e)
+                raise
+            self.record(name, start, perf_counter_ns())
+            return result
+
+        return instrumented
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Current statistics per method: calls, errors, mean, min, max and p50/p99/p999 latency in nanoseconds.
+        """
+        with self._lock:
+            stats = {}
+            for name, histogram in self.histograms.items():
+                snapshot = histogram.snapshot()
+                stats[name] = {"calls": snapshot.pop("count"), "errors": self.errors.get(name, 0), **snapshot}
+            return stats
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {}
+            self.errors = {}
@@ -0,0 +1,122 @@
+import threading
+from collections import deque
+from os import urandom
+from .encoding import clamp_scalars
+from .x25519 import X25519, X25519Algorithm
+
+KEY_SIZE = 32
+
+class KeypairPool:
+    def __init__(self, algorithm: X25519Algorithm = X25519Algorithm.LADDER, size: int = 256, low_water: int = 64, block_size: int = 64, start: bool = True):
+        """
+        Pool of pre-generated ephemeral (private key, public key) pairs, filled by a background thread.
+        The thread sleeps until the pool drops below low_water pairs, then refills it to size, block_size pairs at a
+        time: each block takes its randomness from a single urandom call and its public keys from one
+        x25519_base_batch call (i.e. one shared field inversion with the ladder).
+        Every pair is removed from the pool when it is handed out, so no pair is ever returned twice.
+
+        :param algorithm: The method to use for scalar multiplication.
+        :param size: Maximum number of pairs kept in the pool.
+        :param low_water: Refill as soon as fewer pairs than this are left.
+        :param block_size: Number of pairs generated per block.
+        :param start: Start the background thread right away (otherwise call start()).
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be positive. Provided: {size}")
+        if not 1 <= low_water <= size:
+            raise ValueError(f"Low-water mark must be between 1 and the pool size. Provided: {low_water}")
+        if block_size < 1:
+            raise ValueError(f"Block size must be positive. Provided: {block_size}")
+
+        self.x25519 = X25519(algorithm)
+        self.size = size
+        self.low_water = low_water
+        self.block_size = block_size
+        self.hits = 0
+        self.misses = 0
+
+        self._pairs: deque[tuple[bytes, bytes]] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._refilling = True # fill the pool up as soon as the thread starts
+        self._thread: threading.Thread | None = None
+        if start:
+            self.start()
+
+    def start(self):
+        """
+        Start the background refill thread.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError("Keypair pool is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refill_loop, name="x25519-keypair-pool", daemon=True)
+                self._thread.start()
+
+    def generate_block(self, n: int) -> list[tuple[bytes, bytes]]:
+        """
+        Generate n fresh (private key, public key) pairs from one urandom call.
+        """
+        packed = clamp_scalars(urandom(n * KEY_SIZE))
+        sks = [packed[i:i + KEY_SIZE] for i in range(0, len(packed), KEY_SIZE)]
+        return list(zip(sks, self.x25519.x25519_base_batch(sks)))
+
+    def get(self) -> tuple[bytes, bytes]:
+        """
+        Take a pair out of the pool. When the pool has run dry (a burst outpaced the refill thread),
+        a pair is generated in the calling thread instead of waiting.
+
+        :return: A (private key, public key) pair that is never handed out again.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError("Keypair pool is closed.")
+            pair = self._pairs.popleft() if self._pairs else None
+            if len(self._pairs) < self.low_water and not self._refilling:
+                self._refilling = True
+                self._condition.notify()
+            if pair is not None:
+                self.hits += 1
+                return pair
+            self.misses += 1
+        return self.generate_block(1)[0]
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def _refill_loop(self):
+        while True:
+            with self._condition:
+                while not self._closed and not self._refilling:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                n = min(self.block_size, self.size - len(self._pairs))
+
+            # Generated outside the lock so that get() never waits for a block
+            block = self.generate_block(n) if n > 0 else []
+
+            with self._condition:
+                if self._closed:
+                    return
+                self._pairs.extend(block[:self.size - len(self._pairs)])
+                if len(self._pairs) >= self.size:
+                    self._refilling = False
+
+    def close(self):
+        """
+        Stop the refill thread and drop every pair that was not handed out.
+        """
+        with self._condition:
+            self._closed = True
+            self._pairs.clear()
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def __enter__(self) -> "KeypairPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
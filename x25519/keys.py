@@ -0,0 +1,98 @@
+from .encoding import decode_scalar, decode_x_coordinate
+from .validation import is_low_order, validate_shared_secret
+from .x25519 import X25519
+
+# Shared default instance (ladder algorithm) for keys created without an explicit X25519 instance
+_default_x25519 = X25519()
+
+class X25519PublicKey:
+    __slots__ = ("_bytes", "_x")
+
+    def __init__(self, data: bytes):
+        """
+        An X25519 public key, decoded once.
+
+        :param data: The public key as 32 bytes.
+        """
+        if len(data) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(data)}")
+        self._bytes = bytes(data)
+        self._x = decode_x_coordinate(self._bytes)
+
+    @property
+    def x(self) -> int:
+        """
+        The decoded x-coordinate.
+        """
+        return self._x
+
+    def public_bytes(self) -> bytes:
+        return self._bytes
+
+    def is_low_order(self) -> bool:
+        return is_low_order(self._bytes)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, X25519PublicKey) and self._bytes == other._bytes
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __repr__(self) -> str:
+        return f"X25519PublicKey({self._bytes.hex()})"
+
+class X25519PrivateKey:
+    __slots__ = ("_bytes", "_scalar", "_x25519", "_public_key")
+
+    def __init__(self, data: bytes, x25519: X25519 | None = None):
+        """
+        An X25519 private key: the scalar is validated, clamped and decoded once, and the public key is
+        derived on first use and then cached.
+
+        :param data: The private key as 32 bytes.
+        :param x25519: The X25519 instance (algorithm) to use (defaults to the ladder).
+        """
+        if len(data) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(data)}")
+        self._bytes = bytes(data)
+        self._scalar = decode_scalar(self._bytes)
+        self._x25519 = x25519 if x25519 is not None else _default_x25519
+        self._public_key: X25519PublicKey | None = None
+
+    @classmethod
+    def generate(cls, x25519: X25519 | None = None) -> "X25519PrivateKey":
+        """
+        Generate a new private key.
+        """
+        return cls(X25519.generate_private_key(), x25519)
+
+    def private_bytes(self) -> bytes:
+        return self._bytes
+
+    def public_key(self) -> X25519PublicKey:
+        """
+        The corresponding public key (computed once).
+        """
+        if self._public_key is None:
+            self._public_key = X25519PublicKey(self._x25519.scalar_mult_base(self._scalar))
+        return self._public_key
+
+    def exchange(self, peer: X25519PublicKey | bytes) -> bytes:
+        """
+        Compute the shared secret with a peer public key, reusing the decoded scalar.
+
+        :param peer: The peer public key (an X25519PublicKey, or 32 bytes).
+        :return: The resulting shared secret as bytes.
+        """
+        if not isinstance(peer, X25519PublicKey):
+            peer = X25519PublicKey(peer)
+        if self._x25519.validate and peer.is_low_order():
+            raise ValueError("Public key is a point of small order.")
+
+        secret = self._x25519.scalar_mult(self._scalar, peer.x)
+        if self._x25519.validate:
+            validate_shared_secret(secret)
+        return secret
+
+    def __repr__(self) -> str:
+        return "X25519PrivateKey(<hidden>)"
@@ -1,7 +1,8 @@
-from .group_law import point_addition, point_doubling
-from .defaults import A24, p
-from .field import fadd, fdiv, fmul, fsub, fsquare
-from .point import Point, PointAtInfinity
+from .group_law import ProjectivePoint, PROJECTIVE_INF, from_projective, projective_point_addition, projective_point_doubling, to_projective
+from .defaults import A, A24, p
+from .edwards import IDENTITY, cached_neg, edwards_to_montgomery_projective, montgomery_u_to_edwards, to_cached, twisted_edwards_add, twisted_edwards_add_cached, twisted_edwards_double
+from .field import fdiv, finv, register_op_cost
+from .point import INF, Point, PointAtInfinity
 
 def cswap(swap: int, a: int, b: int) -> tuple[int, int]:
     """
@@ -9,19 +10,20 @@ def cswap(swap: int, a: int, b: int) -> tuple[int, int]:
     Its made to be constant-time to avoid side-channel attacks as described in RFC 7748.
     Args:
         swap (int): 0 or 1 indicating whether to swap.
-        a (int): First integer.
-        b (int): Second integer.
+        a (int): First integer (non-negative, e.g. a reduced field element).
+        b (int): Second integer (non-negative, e.g. a reduced field element).
 
     Regardless of the value of swap, the function takes the same amount of time to execute.
+    The mask -swap is either 0 or all ones, so dummy is either 0 or a XOR b (no modular reductions needed).
 
     Returns:
         tuple[int, int]: The (possibly swapped) integers.
     """
 
-    dummy = swap * (a - b) % p
-    a = (a - dummy) % p
-    b = (b + dummy) % p
-    return a, b
+    dummy = -swap & (a ^ b)
+    return a ^ dummy, b ^ dummy
+
+register_op_cost(cswap, cswap=1)
 
 def montgomery_ladder(k: int, x: int) -> int:
     """
@@ -35,12 +37,44 @@ def montgomery_ladder(k: int, x: int) -> int:
     Returns:
         int: The x-coordinate of the resulting point after multiplication.
     """
+    x_2, z_2 = montgomery_ladder_projective(k, x)
+    return fdiv(x_2, z_2)
+
+def montgomery_ladder_projective(k: int, x: int) -> tuple[int, int]:
+    """
+    Montgomery ladder without the final division.
+    Args:
+        k (int): The scalar multiplier.
+        x (int): The x-coordinate of the point to be multiplied.
+
+    Useful when many results are converted at once (see batch_inv in field.py).
+
+    Returns:
+        tuple[int, int]: Projective (X:Z) representation of the x-coordinate of k*p.
+    """
+    x_2, z_2, _, _ = montgomery_ladder_state(k, x)
+    return x_2, z_2
+
+def montgomery_ladder_state(k: int, x: int) -> tuple[int, int, int, int]:
+    """
+    Montgomery ladder returning both registers.
+    Args:
+        k (int): The scalar multiplier.
+        x (int): The x-coordinate of the point to be multiplied.
+
+    Returns:
+        tuple[int, int, int, int]: Projective x-coordinates (X2:Z2) of k*p and (X3:Z3) of (k+1)*p.
+    """
     # Projective coordinates representation: (X:Z) represents the coordinate X/Z (just to delay divisions till the end)
+    # This is the hot loop of the library, so the field arithmetic and cswap are inlined and kept in local variables.
+    # Reductions are deferred where the operands stay small: sums/differences of reduced values (at most 256 bits,
+    # possibly negative) go straight into the next multiplication, and only products are reduced modulo p.
+    # x_2, z_2, x_3, z_3 are always reduced (non-negative) at the swap, as the XOR-based swap requires.
 
-    x_1 = x
+    x_1 = x % p
     x_2 = 1
     z_2 = 0
-    x_3 = x
+    x_3 = x_1
     z_3 = 1
     swap = 0
 
@@ -48,34 +82,82 @@ def montgomery_ladder(k: int, x: int) -> int:
         k_t = (k >> t) & 1
         swap ^= k_t # Checks if the previous bit was different from the current bit. If so, we need to swap.
 
-        # Conditional swap based on swap bit
-        x_2, x_3 = cswap(swap, x_2, x_3)
-        z_2, z_3 = cswap(swap, z_2, z_3)
+        # Conditional swap based on swap bit (see cswap)
+        mask = -swap
+        dummy = mask & (x_2 ^ x_3)
+        x_2 ^= dummy
+        x_3 ^= dummy
+        dummy = mask & (z_2 ^ z_3)
+        z_2 ^= dummy
+        z_3 ^= dummy
         swap = k_t
 
         # Fixed addition and doubling patterns regardless of k_t
-        A = fadd(x_2, z_2)
-        AA = fsquare(A)
-        B = fsub(x_2, z_2)
-        BB = fsquare(B)
-        E = fsub(AA, BB)
-        C = fadd(x_3, z_3)
-        D = fsub(x_3, z_3)
-        DA = fmul(D, A)
-        CB = fmul(C, B)
+        A = x_2 + z_2
+        AA = A * A % p
+        B = x_2 - z_2
+        BB = B * B % p
+        E = AA - BB
+        DA = (x_3 - z_3) * A % p
+        CB = (x_3 + z_3) * B % p
 
         # Updating x_2, z_2, x_3, z_3
-        x_3 = fsquare(fadd(DA, CB))
-        z_3 = fmul(x_1, fsquare(fsub(DA, CB)))
-        x_2 = fmul(AA, BB)
-        z_2 = fmul(E, fadd(AA, fmul(A24, E)))
-    
+        x_3 = DA + CB
+        x_3 = x_3 * x_3 % p
+        z_3 = DA - CB
+        z_3 = z_3 * z_3 % p * x_1 % p
+        x_2 = AA * BB % p
+        z_2 = E * (AA + A24 * E) % p
+
     x_2, x_3 = cswap(swap, x_2, x_3)
     z_2, z_3 = cswap(swap, z_2, z_3)
 
-    result = fdiv(x_2, z_2)
+    return x_2, z_2, x_3, z_3
 
-    return result
+# Inlined operations of the 255 ladder steps (5M + 4S + 1 multiplication by A24 each, see RFC 7748);
+# the two final cswap calls are counted separately.
+register_op_cost(montgomery_ladder_state, fadd=255 * 4, fsub=255 * 4, fmul=255 * 6, fsquare=255 * 4, cswap=255 * 2)
+
+def montgomery_ladder_point(k: int, Pt: Point) -> Point | PointAtInfinity:
+    """
+    Perform scalar multiplication on the Curve25519 using the Montgomery ladder, returning the full point k*P.
+    Args:
+        k (int): The scalar multiplier (0 <= k < 2^255, as the ladder processes 255 bits).
+        Pt (Point): The point to be multiplied.
+
+    The ladder ends with the x-coordinates of Q = k*P and Q + P; together with P itself they determine the
+    y-coordinate of Q without any square root (Okeya-Sakurai, in the projective form of Costello-Smith, Alg. 5):
+    y_Q = ((x*x_Q + 1)*(x + x_Q + 2A) - 2A - (x - x_Q)^2 * x_{Q+P}) / (2*y)
+    The whole result costs a single inversion.
+
+    Returns:
+        Point | PointAtInfinity: The resulting point after multiplication.
+    """
+    if not 0 <= k < 1 << 255:
+        raise ValueError(f"Scalar must be in [0, 2^255). Provided: {k}")
+
+    x, y = Pt.x, Pt.y
+    if y == 0: # P = (0, 0) has order 2
+        return Pt if k & 1 else INF
+
+    X_Q, Z_Q, X_R, Z_R = montgomery_ladder_state(k, x)
+    if Z_Q == 0:
+        return INF
+    if Z_R == 0: # Q + P is the point at infinity, so Q = -P
+        return Point._unchecked(x, p - y)
+
+    v1 = x * Z_Q % p
+    v3 = (X_Q - v1) * (X_Q - v1) % p * X_R % p
+    v2 = X_Q + v1 + 2 * A * Z_Q
+    v4 = x * X_Q + Z_Q
+    v2 = (v2 * v4 - 2 * A * Z_Q * Z_Q) % p * Z_R % p
+    Y = v2 - v3
+    v1 = 2 * y * Z_Q % p * Z_R % p
+    X = v1 * X_Q
+    Z = v1 * Z_Q % p
+
+    z_inv = finv(Z)
+    return Point._unchecked(X * z_inv % p, Y * z_inv % p)
 
 def double_and_add(k: int, Pt: Point) -> Point | PointAtInfinity:
     """
@@ -84,13 +166,119 @@ def double_and_add(k: int, Pt: Point) -> Point | PointAtInfinity:
         k (int): The scalar multiplier.
         Pt (Point): The point to be multiplied.
 
+    The intermediate points are kept in projective coordinates, so there is a single inversion at the end.
+
     Returns:
         Point | PointAtInfinity: The resulting point after multiplication.
     """
+    return from_projective(_double_and_add_projective(k, to_projective(Pt)))
 
-    if k == 1:
+def _double_and_add_projective(k: int, Pt: ProjectivePoint) -> ProjectivePoint:
+    if k == 0:
+        return PROJECTIVE_INF
+    elif k == 1:
         return Pt
     elif k & 1 == 0: # k is even: we double the point
-        return point_doubling(double_and_add(k // 2, Pt))
+        return projective_point_doubling(_double_and_add_projective(k // 2, Pt))
     else: # k is odd: we first double and then add the original point
-        return point_addition(point_doubling(double_and_add((k - 1) // 2, Pt)), Pt)
\ No newline at end of file
+        return projective_point_addition(projective_point_doubling(_double_and_add_projective((k - 1) // 2, Pt)), Pt)
+
+def wnaf(k: int, w: int) -> list[int]:
+    """
+    Width-w non-adjacent form of k, least significant digit first.
+    Every non-zero digit is odd with |digit| < 2^(w-1), and any w consecutive digits contain at most one non-zero digit.
+    """
+    if w < 2:
+        raise ValueError(f"Window width must be at least 2. Provided: {w}")
+
+    digits = []
+    while k > 0:
+        if k & 1:
+            digit = k & ((1 << w) - 1)
+            if digit >= 1 << (w - 1):
+                digit -= 1 << w
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+def wnaf_mult(k: int, Pt: Point, w: int = 4) -> Point | PointAtInfinity:
+    """
+    Perform scalar multiplication on the Curve25519 using an iterative width-w NAF.
+    Args:
+        k (int): The scalar multiplier.
+        Pt (Point): The point to be multiplied.
+        w (int): The window width; the table holds the 2^(w-2) odd multiples P, 3P, ..., (2^(w-1)-1)P.
+
+    About one addition per w+1 bits (instead of one per set bit), no recursion, and projective coordinates
+    throughout so there is a single inversion at the end.
+
+    Returns:
+        Point | PointAtInfinity: The resulting point after multiplication.
+    """
+    digits = wnaf(k, w)
+
+    P = to_projective(Pt)
+    P2 = projective_point_doubling(P)
+    table = [P]
+    for _ in range((1 << (w - 2)) - 1):
+        table.append(projective_point_addition(table[-1], P2))
+
+    Q = PROJECTIVE_INF
+    for digit in reversed(digits):
+        Q = projective_point_doubling(Q)
+        if digit > 0:
+            Q = projective_point_addition(Q, table[digit >> 1])
+        elif digit < 0:
+            X, Y, Z = table[-digit >> 1]
+            Q = projective_point_addition(Q, (X, -Y % p, Z))
+
+    return from_projective(Q)
+
+def edwards_mult_projective(k: int, x: int, w: int = 4) -> tuple[int, int]:
+    """
+    Same as edwards_mult but without the final division.
+
+    Returns:
+        tuple[int, int]: Projective (X:Z) representation of the x-coordinate of k*p.
+    """
+    P, a, d = montgomery_u_to_edwards(x)
+    digits = wnaf(k & ((1 << 255) - 1), w) # the ladder only looks at the low 255 bits of k
+
+    # Odd multiples P, 3P, ..., (2^(w-1)-1)P and their negations, in cached form
+    P2 = twisted_edwards_double(P, a)
+    multiples = [P]
+    for _ in range((1 << (w - 2)) - 1):
+        multiples.append(twisted_edwards_add(multiples[-1], P2, a, d))
+    table = [to_cached(Q, d) for Q in multiples]
+    neg_table = [cached_neg(Q) for Q in table]
+
+    Q = IDENTITY
+    for digit in reversed(digits):
+        Q = twisted_edwards_double(Q, a)
+        if digit > 0:
+            Q = twisted_edwards_add_cached(Q, table[digit >> 1], a)
+        elif digit < 0:
+            Q = twisted_edwards_add_cached(Q, neg_table[-digit >> 1], a)
+
+    return edwards_to_montgomery_projective(Q)
+
+def edwards_mult(k: int, x: int, w: int = 4) -> int:
+    """
+    Perform scalar multiplication on the Curve25519 through the birational map to edwards25519.
+    Args:
+        k (int): The scalar multiplier.
+        x (int): The x-coordinate of the point to be multiplied.
+        w (int): The wNAF window width.
+
+    The point is mapped to extended coordinates (v is recovered with one square root), multiplied with a width-w NAF
+    using the unified Edwards formulas, and mapped back to u = (Z+Y)/(Z-Y). The output is identical to the ladder,
+    including for u-coordinates on the twist.
+
+    Returns:
+        int: The x-coordinate of the resulting point after multiplication.
+    """
+    u, w_ = edwards_mult_projective(k, x, w)
+    return fdiv(u, w_)
@@ -0,0 +1,177 @@
+from collections.abc import Sequence
+from .defaults import p
+from .group_law import ProjectivePoint, PROJECTIVE_INF, from_projective, projective_point_addition, projective_point_doubling, to_projective
+from .methods import wnaf
+from .point import INF, Point, PointAtInfinity, is_infinity
+
+# Multi-scalar multiplication sum_i k_i * P_i with a single shared chain of doublings.
+# Straus interleaves the width-w NAFs of all scalars (n tables of odd multiples, about n * bits / (w+1) additions);
+# Pippenger sorts the points into 2^(c-1) buckets per signed c-bit window, so each window costs about
+# n + 2^c additions whatever the scalars. Pippenger wins once n is large enough to amortise the buckets.
+STRAUS_WIDTH = 4
+
+# Relative cost of adding an input point (Z = 1) into a bucket, measured against a general projective addition:
+# multiplications by Z = 1 are almost free with Python integers.
+MIXED_ADD_COST = 0.6
+
+def _neg(P: ProjectivePoint) -> ProjectivePoint:
+    X, Y, Z = P
+    return (X, -Y % p, Z)
+
+def _prepare(scalars: Sequence[int], points: Sequence[Point | PointAtInfinity]) -> list[tuple[int, ProjectivePoint]]:
+    """
+    Check the inputs, make every scalar non-negative (k*P = (-k)*(-P)) and drop the terms that are zero.
+    """
+    if len(scalars) != len(points):
+        raise ValueError(f"Number of scalars and points must match. Provided: {len(scalars)} and {len(points)}")
+
+    terms = []
+    for k, Pt in zip(scalars, points):
+        if k == 0 or is_infinity(Pt):
+            continue
+        P = to_projective(Pt)
+        terms.append((k, P) if k > 0 else (-k, _neg(P)))
+    return terms
+
+def _straus_cost(n: int, bits: int, w: int = STRAUS_WIDTH) -> int:
+    """
+    Estimated number of point additions of straus_mult (the doublings are shared by both methods).
+    """
+    return n * ((1 << (w - 2)) + bits // (w + 1))
+
+def _pippenger_cost(n: int, bits: int, c: int) -> float:
+    """
+    Estimated number of point additions of pippenger_mult with c-bit windows. In each window, the first point of
+    every bucket and the first step of the running sums only copy a point.
+    """
+    windows = (bits + 1) // c + 1
+    half = 1 << (c - 1)
+    return windows * (MIXED_ADD_COST * max(n - half, 0) + 2 * half)
+
+def pippenger_window(n: int, bits: int = 255) -> int:
+    """
+    Window width in bits that minimises the estimated cost of pippenger_mult for n terms.
+    """
+    return min(range(2, 17), key=lambda c: _pippenger_cost(n, bits, c))
+
+def straus_mult(scalars: Sequence[int], points: Sequence[Point | PointAtInfinity], w: int = STRAUS_WIDTH) -> Point | PointAtInfinity:
+    """
+    Compute sum_i k_i * P_i with Straus' method (interleaved width-w NAFs).
+    Args:
+        scalars (Sequence[int]): The scalar multipliers.
+        points (Sequence[Point | PointAtInfinity]): The points (points[i] is multiplied by scalars[i]).
+        w (int): The window width of every wNAF.
+
+    Returns:
+        Point | PointAtInfinity: The resulting point.
+    """
+    terms = _prepare(scalars, points)
+    if not terms:
+        return INF
+
+    digit_lists = []
+    tables = []
+    for k, P in terms:
+        digit_lists.append(wnaf(k, w))
+        P2 = projective_point_doubling(P)
+        table = [P]
+        for _ in range((1 << (w - 2)) - 1):
+            table.append(projective_point_addition(table[-1], P2))
+        tables.append(table)
+
+    Q = PROJECTIVE_INF
+    for i in range(max(len(digits) for digits in digit_lists) - 1, -1, -1):
+        Q = projective_point_doubling(Q)
+        for digits, table in zip(digit_lists, tables):
+            if i >= len(digits) or digits[i] == 0:
+                continue
+            digit = digits[i]
+            Q = projective_point_addition(Q, table[digit >> 1] if digit > 0 else _neg(table[-digit >> 1]))
+
+    return from_projective(Q)
+
+def pippenger_mult(scalars: Sequence[int], points: Sequence[Point | PointAtInfinity], c: int | None = None) -> Point | PointAtInfinity:
+    """
+    Compute sum_i k_i * P_i with Pippenger's bucket method.
+    Args:
+        scalars (Sequence[int]): The scalar multipliers.
+        points (Sequence[Point | PointAtInfinity]): The points (points[i] is multiplied by scalars[i]).
+        c (int | None): The window width in bits (defaults to pippenger_window for the number of terms).
+
+    The scalars are recoded into signed c-bit digits in [-2^(c-1), 2^(c-1)), so each window needs 2^(c-1) buckets;
+    a point with digit -d goes into bucket d negated. Bucket j is weighted by j with a running sum
+    (2 additions per bucket) instead of a scalar multiplication.
+
+    Returns:
+        Point | PointAtInfinity: The resulting point.
+    """
+    terms = _prepare(scalars, points)
+    if not terms:
+        return INF
+
+    bits = max(k.bit_length() for k, _ in terms)
+    if c is None:
+        c = pippenger_window(len(terms), bits)
+    if c < 2:
+        raise ValueError(f"Window width must be at least 2. Provided: {c}")
+
+    # Signed digits, least significant window first. The windows cover at least bits + 2 bits, so the top window
+    # is below 2^(c-2) and absorbs the last carry.
+    windows = (bits + 1) // c + 1
+    half = 1 << (c - 1)
+    digit_lists = []
+    for k, _ in terms:
+        digits = []
+        carry = 0
+        for _ in range(windows):
+            d = (k & ((1 << c) - 1)) + carry
+            k >>= c
+            carry = (d + half) >> c
+            digits.append(d - (carry << c))
+        digit_lists.append(digits)
+
+    Q = PROJECTIVE_INF
+    for i in range(windows - 1, -1, -1):
+        for _ in range(c):
+            Q = projective_point_doubling(Q)
+
+        buckets = [PROJECTIVE_INF] * (half + 1)
+        for digits, (_, P) in zip(digit_lists, terms):
+            d = digits[i]
+            if d > 0:
+                buckets[d] = projective_point_addition(buckets[d], P)
+            elif d < 0:
+                buckets[-d] = projective_point_addition(buckets[-d], _neg(P))
+
+        # sum_j j * buckets[j] = sum_j (buckets[j] + ... + buckets[half])
+        running = PROJECTIVE_INF
+        window_sum = PROJECTIVE_INF
+        for j in range(half, 0, -1):
+            running = projective_point_addition(running, buckets[j])
+            window_sum = projective_point_addition(window_sum, running)
+        Q = projective_point_addition(Q, window_sum)
+
+    return from_projective(Q)
+
+def multi_scalar_mult(scalars: Sequence[int], points: Sequence[Point | PointAtInfinity]) -> Point | PointAtInfinity:
+    """
+    Compute sum_i k_i * P_i, choosing between Straus and Pippenger from their estimated costs for the number of terms
+    and the scalar size (Straus for a handful of points, Pippenger from a few dozen points on).
+    Args:
+        scalars (Sequence[int]): The scalar multipliers (negative scalars multiply the negated point).
+        points (Sequence[Point | PointAtInfinity]): The points (points[i] is multiplied by scalars[i]).
+
+    Returns:
+        Point | PointAtInfinity: The resulting point.
+    """
+    if len(scalars) != len(points):
+        raise ValueError(f"Number of scalars and points must match. Provided: {len(scalars)} and {len(points)}")
+
+    n = len(scalars)
+    bits = max((abs(k).bit_length() for k in scalars), default=0)
+    if n == 0 or bits == 0:
+        return INF
+
+    if _straus_cost(n, bits) <= _pippenger_cost(n, bits, pippenger_window(n, bits)):
+        return straus_mult(scalars, points)
+    return pippenger_mult(scalars, points)
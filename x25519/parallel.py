@@ -0,0 +1,102 @@
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from os import cpu_count
+from .encoding import BytesLike
+from .x25519 import X25519, X25519Algorithm
+
+KEY_SIZE = 32
+
+# One X25519 instance per worker process and algorithm (the fixed-base table is then built once per worker)
+_worker_instances: dict[X25519Algorithm, X25519] = {}
+
+def _worker_instance(algorithm: X25519Algorithm) -> X25519:
+    instance = _worker_instances.get(algorithm)
+    if instance is None:
+        instance = X25519(algorithm)
+        _worker_instances[algorithm] = instance
+    return instance
+
+def _split(packed: bytes) -> list[bytes]:
+    return [packed[i:i + KEY_SIZE] for i in range(0, len(packed), KEY_SIZE)]
+
+def _x25519_chunk(algorithm: X25519Algorithm, packed_sks: bytes, packed_pks: bytes) -> bytes:
+    """
+    Worker entry point: shared secrets for one chunk of packed (sk, pk) pairs, returned packed.
+    """
+    return b"".join(_worker_instance(algorithm).x25519_batch(_split(packed_sks), _split(packed_pks)))
+
+def _x25519_base_chunk(algorithm: X25519Algorithm, packed_sks: bytes) -> bytes:
+    """
+    Worker entry point: public keys for one chunk of packed private keys, returned packed.
+    """
+    return b"".join(_worker_instance(algorithm).x25519_base_batch(_split(packed_sks)))
+
+class ParallelX25519:
+    def __init__(self, algorithm: X25519Algorithm = X25519Algorithm.LADDER, workers: int | None = None, chunk_size: int = 256, executor: Executor | None = None):
+        """
+        Bulk X25519 that shards batches across a pool of worker processes.
+        Each chunk of keys is shipped to a worker as one packed bytes buffer (chunk_size * 32 bytes)
+        rather than as individually pickled keys, and results come back packed in the same way.
+
+        :param algorithm: The method to use for scalar multiplication in the workers.
+        :param workers: Number of worker processes (defaults to the number of CPUs).
+        :param chunk_size: Number of keys per task sent to a worker.
+        :param executor: An existing executor to use instead of creating a process pool (not shut down by close()).
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive. Provided: {chunk_size}")
+
+        self.algorithm = algorithm
+        self.workers = workers or cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._owns_executor = executor is None
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=self.workers)
+
+    def _pack(self, keys: Sequence[BytesLike], name: str) -> list[bytes]:
+        """
+        Validate key lengths and pack the keys into one contiguous buffer per chunk.
+        """
+        for key in keys:
+            if len(key) != KEY_SIZE:
+                raise ValueError(f"{name} must be 32 bytes long. Provided length: {len(key)}")
+        return [b"".join(keys[i:i + self.chunk_size]) for i in range(0, len(keys), self.chunk_size)]
+
+    def x25519_batch(self, sks: Sequence[BytesLike], pks: Sequence[BytesLike]) -> list[bytes]:
+        """
+        Perform X25519 for many (private key, public key) pairs in parallel.
+
+        :param sks: The private keys (bytes-like objects).
+        :param pks: The public keys (bytes-like objects, pks[i] is used with sks[i]).
+        :return: The resulting shared secrets as bytes, in input order.
+        """
+        if len(sks) != len(pks):
+            raise ValueError(f"Number of private keys and public keys must match. Provided: {len(sks)} and {len(pks)}")
+
+        sk_chunks = self._pack(sks, "Private key")
+        pk_chunks = self._pack(pks, "Public key")
+        results = self.executor.map(_x25519_chunk, [self.algorithm] * len(sk_chunks), sk_chunks, pk_chunks)
+        return [key for packed in results for key in _split(packed)]
+
+    def x25519_base_batch(self, sks: Sequence[BytesLike]) -> list[bytes]:
+        """
+        Perform X25519 scalar multiplication with the base point for many private keys in parallel.
+
+        :param sks: The private keys (bytes-like objects).
+        :return: The resulting public keys as bytes, in input order.
+        """
+        sk_chunks = self._pack(sks, "Private key")
+        results = self.executor.map(_x25519_base_chunk, [self.algorithm] * len(sk_chunks), sk_chunks)
+        return [key for packed in results for key in _split(packed)]
+
+    def close(self):
+        """
+        Shut down the worker pool (only if it was created by this instance).
+        """
+        if self._owns_executor:
+            self.executor.shutdown()
+
+    def __enter__(self) -> "ParallelX25519":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from typing import TypeGuard
 from .defaults import p, A
 from .field import fadd, fsqrt, fsquare, fmul
@@ -8,30 +7,73 @@ class PointAtInfinity:
 
 INF = PointAtInfinity()
 
-@dataclass
 class Point:
+    # Points are immutable and slotted (no per-instance __dict__). The public constructor validates its input;
+    # the group law builds its results, which are on the curve by construction, with Point._unchecked instead.
+    __slots__ = ("x", "_y")
+
     x: int
-    y: int
+    _y: int | None
 
     def __init__(self, x: int, y: int | None = None):
         """
         Initialize a point on the Curve25519.
-        
+
         :param x: The x-coordinate of the point.
         :param y: The y-coordinate of the point (optional).
         """
-        self.x = x % p
+        object.__setattr__(self, "x", x % p)
         if y is not None:
-            self.y = y % p
+            object.__setattr__(self, "_y", y % p)
             if not self.is_valid():
                 raise ValueError("The provided point is not a valid point on the curve.")
-            
+
         else:
-            y = self.calculate_y()  
+            # Checking that x is on the curve is the square root itself, so y comes for free here
+            y = self.calculate_y()
+            if y is None:
+                raise ValueError("The provided x-coordinate does not correspond to a valid point on the curve.")
+            object.__setattr__(self, "_y", y)
+
+    @classmethod
+    def _unchecked(cls, x: int, y: int | None = None) -> "Point":
+        """
+        Build a point from coordinates already known to be on the curve (reduced modulo p), skipping validation.
+        Without y, the square root is only computed if y is ever read.
+        """
+        P = object.__new__(cls)
+        object.__setattr__(P, "x", x)
+        object.__setattr__(P, "_y", y)
+        return P
+
+    @property
+    def y(self) -> int:
+        y = self._y
+        if y is None:
+            y = self.calculate_y()
             if y is None:
                 raise ValueError("The provided x-coordinate does not correspond to a valid point on the curve.")
-            self.y = y
-    
+            object.__setattr__(self, "_y", y)
+        return y
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("Point is immutable.")
+
+    def __reduce__(self):
+        # The default slots state restore goes through __setattr__; rebuild copies and unpickled points unchecked instead
+        return (Point._unchecked, (self.x, self._y))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __repr__(self) -> str:
+        return f"Point(x={self.x}, y={self._y if self._y is not None else '<lazy>'})"
+
     def is_valid(self) -> bool:
         """
         Check if the point lies on the curve defined by the equation:
@@ -40,7 +82,7 @@ class Point:
         lhs = fsquare(self.y)
         rhs = fadd(fadd(fmul(fsquare(self.x), self.x), fmul(A, fsquare(self.x))), self.x)
         return lhs == rhs
-    
+
     def calculate_y(self) -> int | None:
         """
         Given the x-coordinate, calculate the corresponding y-coordinate(s) on the curve.
@@ -54,15 +96,15 @@ class Point:
             y = fsqrt(rhs)
         except ValueError:
             return None
-        
+
         return y % p
-       
+
 def is_infinity(P: Point | PointAtInfinity) -> TypeGuard[PointAtInfinity]:
     """
     Check if the point P is the point at infinity.
     Args:
         P (Point | PointAtInfinity): The point to check.
-        
+
     Returns:
         bool: True if P is the point at infinity, False otherwise.
     """
@@ -0,0 +1,155 @@
+import threading
+from collections import OrderedDict
+from .defaults import L
+from .edwards import montgomery_to_edwards
+from .encoding import decode_scalar, decode_x_coordinate, encode_x_coordinate
+from .field import fdiv
+from .fixed_base import Table, build_table, table_mult_projective
+from .point import Point
+from .validation import validate_public_key, validate_shared_secret
+from .x25519 import X25519
+
+# Fixed-base tables (see fixed_base.py) for long-lived peer public keys. Unlike the base point, a peer point may have
+# a small-order component, so scalars are only reduced modulo the full group order 8*L (< 2^256), which takes
+# 65 windows instead of 64. Keys on the twist have no y-coordinate in F_p and cannot be precomputed.
+PEER_WINDOWS = 65
+GROUP_ORDER = 8 * L
+
+class PrecomputedPublicKey:
+    __slots__ = ("pk", "table")
+
+    def __init__(self, pk: bytes):
+        """
+        Precompute the multiples of a peer public key, so that multiplying it by a scalar costs at most 65 mixed
+        additions instead of a full ladder (building the table costs about as much as five ladders).
+
+        :param pk: The public key as bytes.
+        :raises ValueError: If the key is on the twist or is a point of small order the map to edwards25519 excludes.
+        """
+        if len(pk) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+
+        P = Point(decode_x_coordinate(pk)) # recovers y with calculate_y; either sign gives the same u(k*P)
+        self.pk = bytes(pk)
+        self.table: Table = build_table(montgomery_to_edwards(P.x, P.y), PEER_WINDOWS)
+
+    def scalar_mult_projective(self, k: int) -> tuple[int, int]:
+        """
+        Projective (X:Z) x-coordinate of k*P, identical to montgomery_ladder_projective(k, u) after division.
+        """
+        return table_mult_projective(self.table, (k & ((1 << 255) - 1)) % GROUP_ORDER) # the ladder uses the low 255 bits
+
+    def scalar_mult(self, k: int) -> int:
+        u, w = self.scalar_mult_projective(k)
+        return fdiv(u, w)
+
+    def x25519(self, sk: bytes) -> bytes:
+        """
+        Perform X25519 with this public key.
+
+        :param sk: The private key as bytes.
+        :return: The resulting shared secret as bytes.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        return encode_x_coordinate(self.scalar_mult(decode_scalar(sk)))
+
+class PrecomputedKeyRegistry:
+    def __init__(self, backend: X25519 | None = None, build_after: int = 16, max_tables: int = 64, max_tracked: int = 4096):
+        """
+        X25519 front-end that builds a PrecomputedPublicKey for the peer keys it sees most often.
+        A key gets a table once it has been used more than build_after times; until then (and for keys that
+        cannot be precomputed) the backend computes the shared secret as usual.
+
+        :param backend: The X25519 instance used for the other keys (defaults to X25519()); its validate flag applies to all keys.
+        :param build_after: Number of uses after which a table is built for a key.
+        :param max_tables: Maximum number of tables kept (each one holds 520 points, about 130 KB); least recently used are dropped first.
+        :param max_tracked: Maximum number of keys whose uses are counted, and separately of keys remembered as
+                            impossible to precompute (e.g. on the twist); least recently seen are forgotten first.
+        """
+        if build_after < 0:
+            raise ValueError(f"Build threshold must not be negative. Provided: {build_after}")
+        if max_tables < 1:
+            raise ValueError(f"Maximum number of tables must be positive. Provided: {max_tables}")
+        if max_tracked < 1:
+            raise ValueError(f"Maximum number of tracked keys must be positive. Provided: {max_tracked}")
+
+        self.backend = backend if backend is not None else X25519()
+        self.build_after = build_after
+        self.max_tables = max_tables
+        self.max_tracked = max_tracked
+
+        self.table_hits = 0
+        self.tables_built = 0
+
+        self._uses: OrderedDict[bytes, int] = OrderedDict()
+        self._tables: OrderedDict[bytes, PrecomputedPublicKey] = OrderedDict()
+        # Kept apart from the tables, so that keys without a table can never evict real tables
+        self._unsupported: OrderedDict[bytes, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pk: bytes) -> PrecomputedPublicKey | None:
+        """
+        Count one use of pk and return its table, building it if the key just crossed the threshold.
+        """
+        pk = bytes(pk)
+        with self._lock:
+            table = self._tables.get(pk)
+            if table is not None:
+                self._tables.move_to_end(pk)
+                return table
+            if pk in self._unsupported:
+                self._unsupported.move_to_end(pk)
+                return None
+
+            uses = self._uses.pop(pk, 0) + 1
+            if uses <= self.build_after:
+                self._uses[pk] = uses
+                if len(self._uses) > self.max_tracked:
+                    self._uses.popitem(last=False)
+                return None
+
+        # Built outside the lock; a concurrent build of the same key is harmless
+        try:
+            table = PrecomputedPublicKey(pk)
+        except ValueError:
+            with self._lock:
+                self._unsupported[pk] = None
+                if len(self._unsupported) > self.max_tracked:
+                    self._unsupported.popitem(last=False)
+            return None
+
+        with self._lock:
+            self._tables[pk] = table
+            self.tables_built += 1
+            if len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+        return table
+
+    def x25519(self, sk: bytes, pk: bytes) -> bytes:
+        """
+        Same as X25519.x25519, using the table of pk when it has one.
+
+        :param sk: The private key as bytes.
+        :param pk: The public key as bytes.
+        :return: The resulting shared secret as bytes.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        if len(pk) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+
+        table = self.get(pk)
+        if table is None:
+            return self.backend.x25519(sk, pk)
+
+        if self.backend.validate:
+            validate_public_key(pk)
+        self.table_hits += 1
+        secret = table.x25519(sk)
+        if self.backend.validate:
+            validate_shared_secret(secret)
+        return secret
+
+    def __len__(self) -> int:
+        return len(self._tables)
@@ -0,0 +1,345 @@
+import argparse
+import asyncio
+import os
+import queue
+import signal
+import socket
+import stat
+import struct
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from .async_api import AsyncX25519
+from .x25519 import X25519Algorithm
+
+# Local key-agreement daemon: clients send fixed-size binary requests over a Unix domain socket, requests from all
+# connections are coalesced into micro-batches by AsyncX25519 and computed in a worker pool, and every response
+# carries the id of its request (responses on one connection may come back in any order, so clients can pipeline).
+#
+# Request:  op (1 byte) | request id (4 bytes, big-endian) | sk (32 bytes) | pk (32 bytes, OP_X25519 only)
+# Response: request id (4 bytes) | status (1 byte) | length (2 bytes) | payload (the 32-byte result, or an error message)
+OP_X25519 = 1
+OP_X25519_BASE = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+REQUEST_HEADER = struct.Struct("!BI")
+RESPONSE_HEADER = struct.Struct("!IBH")
+KEY_SIZE = 32
+PAYLOAD_SIZES = {OP_X25519: 2 * KEY_SIZE, OP_X25519_BASE: KEY_SIZE}
+
+def _socket_inode(path: str) -> int | None:
+    """
+    Inode of the Unix socket at path, or None if there is no socket there (symbolic links are not followed).
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino if stat.S_ISSOCK(st.st_mode) else None
+
+class X25519Server:
+    def __init__(self, path: str, algorithm: X25519Algorithm = X25519Algorithm.LADDER, workers: int = 1, executor: Executor | None = None, max_in_flight: int | None = None, max_batch_size: int = 64, batch_delay: float = 0.001, max_pending: int = 256):
+        """
+        Key-agreement daemon listening on a Unix domain socket.
+
+        :param path: Path of the socket (created on start with mode 0600, removed on close).
+        :param algorithm: The method to use for scalar multiplication.
+        :param workers: Number of worker processes (1 computes in a thread of this process).
+        :param executor: Executor for the computations (overrides workers).
+        :param max_in_flight: Maximum number of batches computed concurrently (defaults to the number of workers).
+        :param max_batch_size: Maximum number of requests per batch.
+        :param batch_delay: How long (in seconds) to wait for more requests before flushing a batch.
+        :param max_pending: Maximum number of outstanding requests per connection; the next frame of a connection
+                            is not read until one of its requests has been answered.
+        """
+        if workers < 1:
+            raise ValueError(f"Number of workers must be positive. Provided: {workers}")
+        if max_pending < 1:
+            raise ValueError(f"Maximum number of pending requests must be positive. Provided: {max_pending}")
+
+        self.path = path
+        self.max_pending = max_pending
+        self._owns_executor = executor is None and workers > 1
+        self.executor = ProcessPoolExecutor(workers) if self._owns_executor else executor
+        self.async_x25519 = AsyncX25519(algorithm, self.executor, max_in_flight or workers, max_batch_size, batch_delay)
+        self.requests_served = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._inode: int | None = None # of the socket we created, so that close() only removes that one
+
+    async def start(self):
+        """
+        Start listening. A stale socket left at the path is replaced; any other kind of file is left alone.
+
+        :raises ValueError: If something other than a socket exists at the path.
+        """
+        if _socket_inode(self.path) is not None:
+            os.unlink(self.path)
+        elif os.path.lexists(self.path):
+            raise ValueError(f"{self.path} exists and is not a socket.")
+
+        # Private keys travel over the socket: create it owner-only rather than fixing its mode after the bind.
+        # The umask is process-wide, so it is only changed for the duration of the bind.
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self.path)
+        finally:
+            os.umask(umask)
+        os.chmod(self.path, 0o600)
+        self._inode = _socket_inode(self.path)
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._inode is not None and _socket_inode(self.path) == self._inode:
+            os.unlink(self.path)
+        self._inode = None
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        tasks: set[asyncio.Task] = set()
+        # Backpressure: a client that pipelines more than max_pending requests is simply not read from until
+        # answers go out, so its queued requests wait in the socket buffers rather than in this process
+        pending = asyncio.Semaphore(self.max_pending)
+
+        def done(task: asyncio.Task):
+            tasks.discard(task)
+            pending.release()
+
+        try:
+            while True:
+                await pending.acquire()
+                try:
+                    op, request_id = REQUEST_HEADER.unpack(await reader.readexactly(REQUEST_HEADER.size))
+                    size = PAYLOAD_SIZES.get(op)
+                    if size is None:
+                        self._respond(writer, request_id, STATUS_ERROR, f"Unknown operation: {op}".encode())
+                        break # the rest of the stream cannot be framed any more
+                    payload = await reader.readexactly(size)
+                except asyncio.IncompleteReadError:
+                    break
+
+                task = asyncio.create_task(self._serve_request(writer, op, request_id, payload))
+                tasks.add(task)
+                task.add_done_callback(done)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _serve_request(self, writer: asyncio.StreamWriter, op: int, request_id: int, payload: bytes):
+        try:
+            if op == OP_X25519:
+                result = await self.async_x25519.x25519(payload[:KEY_SIZE], payload[KEY_SIZE:])
+            else:
+                result = await self.async_x25519.x25519_base(payload)
+            self._respond(writer, request_id, STATUS_OK, result)
+        except ValueError as e:
+            self._respond(writer, request_id, STATUS_ERROR, str(e).encode())
+        self.requests_served += 1
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass # the client is gone; _handle_connection stops reading and closes the writer
+
+    @staticmethod
+    def _respond(writer: asyncio.StreamWriter, request_id: int, status: int, payload: bytes):
+        if not writer.is_closing():
+            writer.write(RESPONSE_HEADER.pack(request_id, status, len(payload)) + payload)
+
+def _recv_exactly(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("Connection closed by the server.")
+        buf += chunk
+    return bytes(buf)
+
+class X25519Client:
+    def __init__(self, path: str, pool_size: int = 4, timeout: float | None = 30.0, window: int = 128):
+        """
+        Blocking, thread-safe client of X25519Server with a pool of persistent connections.
+        Connections are opened on demand (at most pool_size at once) and reused; batches are pipelined on a single
+        connection so the server can batch them together.
+
+        :param path: Path of the server socket.
+        :param pool_size: Maximum number of open connections.
+        :param timeout: Socket timeout in seconds (None to wait forever).
+        :param window: Maximum number of requests in flight on a connection. It must not exceed the server's
+                       max_pending: the server stops reading beyond that, and both sides would then wait on each other.
+        """
+        if pool_size < 1:
+            raise ValueError(f"Pool size must be positive. Provided: {pool_size}")
+        if window < 1:
+            raise ValueError(f"Window must be positive. Provided: {window}")
+
+        self.path = path
+        self.timeout = timeout
+        self.window = window
+        # Each item is an open connection or None (a free slot to open one); last in, first out reuses open connections first
+        self._pool: queue.LifoQueue[socket.socket | None] = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(None)
+        self._closed = False
+
+    def x25519(self, sk: bytes, pk: bytes) -> bytes:
+        """
+        Perform X25519 scalar multiplication with the given public key on the server.
+
+        :param sk: The private key as bytes.
+        :param pk: The public key as bytes.
+        :return: The resulting shared secret as bytes.
+        """
+        return self.x25519_batch([sk], [pk])[0]
+
+    def x25519_base(self, sk: bytes) -> bytes:
+        """
+        Perform X25519 scalar multiplication with the base point on the server.
+
+        :param sk: The private key as bytes.
+        :return: The resulting public key as bytes.
+        """
+        return self._request([(OP_X25519_BASE, bytes(sk))])[0]
+
+    def x25519_batch(self, sks: list[bytes], pks: list[bytes]) -> list[bytes]:
+        """
+        Perform X25519 for many (private key, public key) pairs, pipelined on one connection.
+
+        :raises ValueError: If any request fails on the server (or the inputs are malformed).
+        """
+        if len(sks) != len(pks):
+            raise ValueError(f"Number of private keys and public keys must match. Provided: {len(sks)} and {len(pks)}")
+        return self._request([(OP_X25519, bytes(sk) + bytes(pk)) for sk, pk in zip(sks, pks)])
+
+    def x25519_base_batch(self, sks: list[bytes]) -> list[bytes]:
+        """
+        Perform X25519 with the base point for many private keys, pipelined on one connection.
+        """
+        return self._request([(OP_X25519_BASE, bytes(sk)) for sk in sks])
+
+    def _request(self, requests: list[tuple[int, bytes]]) -> list[bytes]:
+        for op, payload in requests:
+            if len(payload) != PAYLOAD_SIZES[op]:
+                raise ValueError(f"Keys must be 32 bytes long. Provided payload length: {len(payload)}")
+        if not requests:
+            return []
+
+        frames = [REQUEST_HEADER.pack(op, i) + payload for i, (op, payload) in enumerate(requests)]
+        sock = self._acquire()
+        try:
+            # Keep at most window requests in flight, topping the window up once half of it has been answered
+            sent = min(self.window, len(frames))
+            sock.sendall(b"".join(frames[:sent]))
+            results: list[bytes | None] = [None] * len(requests)
+            errors = []
+            for received in range(len(frames)):
+                if sent < len(frames) and sent - received <= self.window // 2:
+                    end = min(received + self.window, len(frames))
+                    sock.sendall(b"".join(frames[sent:end]))
+                    sent = end
+                request_id, status, length = RESPONSE_HEADER.unpack(_recv_exactly(sock, RESPONSE_HEADER.size))
+                payload = _recv_exactly(sock, length)
+                if status == STATUS_OK:
+                    results[request_id] = payload
+                else:
+                    errors.append(payload.decode(errors="replace"))
+        except BaseException:
+            sock.close() # the stream may be out of sync now
+            self._pool.put(None)
+            raise
+        self._release(sock)
+
+        if errors:
+            raise ValueError(errors[0])
+        return [result for result in results if result is not None]
+
+    def _acquire(self) -> socket.socket:
+        if self._closed:
+            raise ValueError("Client is closed.")
+        sock = self._pool.get() # blocks while pool_size connections are in use
+        if sock is not None:
+            return sock
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+        except BaseException:
+            self._pool.put(None)
+            raise
+        return sock
+
+    def _release(self, sock: socket.socket):
+        if self._closed:
+            sock.close()
+            self._pool.put(None)
+        else:
+            self._pool.put(sock)
+
+    def close(self):
+        """
+        Close the idle connections (connections in use are closed when their request completes).
+        """
+        self._closed = True
+        slots = 0
+        while True:
+            try:
+                sock = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if sock is not None:
+                sock.close()
+            slots += 1
+        for _ in range(slots):
+            self._pool.put(None)
+
+    def __enter__(self) -> "X25519Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m x25519.server", description="Local X25519 key-agreement daemon on a Unix domain socket")
+    parser.add_argument('--socket', required=True, help='Path of the Unix domain socket')
+    parser.add_argument('--algorithm', choices=[a.value for a in X25519Algorithm], default=X25519Algorithm.LADDER.value, help='Scalar multiplication algorithm')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Number of worker processes')
+    parser.add_argument('--max-batch-size', type=int, default=64, help='Maximum number of requests per batch')
+    parser.add_argument('--max-pending', type=int, default=256, help='Maximum number of outstanding requests per connection')
+    parser.add_argument('--batch-delay', type=float, default=0.001, help='Seconds to wait for more requests before flushing a batch')
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = X25519Server(args.socket, X25519Algorithm(args.algorithm), workers=args.workers, max_batch_size=args.max_batch_size, batch_delay=args.batch_delay, max_pending=args.max_pending)
+        await server.start()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        print(f"listening on {args.socket}", file=sys.stderr)
+        try:
+            await stop.wait()
+        finally:
+            await server.close()
+
+    asyncio.run(run())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
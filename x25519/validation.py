@@ -0,0 +1,94 @@
+from .defaults import A, p
+from .encoding import BytesLike, decode_x_coordinate
+from .exponentiation import pow_p58
+
+# u-coordinates of the points of small order (dividing 8) on Curve25519 and its twist: 0 (order 2),
+# 1 and -1 (order 4) and the two order-8 points. X25519 with any of them gives an all-zero (or undefined) output.
+LOW_ORDER_U = frozenset([
+    0,
+    1,
+    p - 1,
+    325606250916557431795983626356110631294008115727848805560023387167927233504,
+    39382357235489614581723060781553021112529911719440698176882885853963445705823,
+])
+
+def _low_order_encodings() -> frozenset[bytes]:
+    """
+    Every 32-byte encoding that decodes to a low-order u: the canonical one, the non-canonical one (u + p) when it
+    fits in 255 bits, and both of them with the ignored most significant bit set.
+    """
+    encodings = set()
+    for u in LOW_ORDER_U:
+        for r in (u, u + p):
+            if r < 1 << 255:
+                encodings.add(r.to_bytes(32, "little"))
+                encodings.add((r | 1 << 255).to_bytes(32, "little"))
+    return frozenset(encodings)
+
+LOW_ORDER_ENCODINGS = _low_order_encodings()
+
+def is_low_order(pk: BytesLike) -> bool:
+    """
+    Check (in O(1), without decoding) whether a public key encodes a point of small order.
+    """
+    return bytes(pk) in LOW_ORDER_ENCODINGS
+
+def is_on_curve(pk: BytesLike) -> bool:
+    """
+    Check whether a public key is the u-coordinate of a point on Curve25519 rather than on its twist,
+    i.e. whether u^3 + A*u^2 + u is a square (Euler's criterion, computed with the p-5/8 addition chain).
+    """
+    u = decode_x_coordinate(pk)
+    rhs = (u * u % p * u + A * u * u + u) % p
+    if rhs == 0:
+        return True
+    # rhs^((p-1)/2) = (rhs^((p-5)/8))^4 * rhs^2
+    t = pow_p58(rhs)
+    t = t * t % p
+    return t * t % p * rhs % p * rhs % p == 1
+
+def is_all_zero(secret: BytesLike) -> bool:
+    """
+    Check whether a shared secret is all zeros (the result of a low-order public key, see RFC 7748 Section 6.1).
+    Every byte is always examined.
+    """
+    acc = 0
+    for b in secret:
+        acc |= b
+    return acc == 0
+
+def validate_public_key(pk: BytesLike, check_on_curve: bool = False):
+    """
+    Reject public keys that must not be used for key agreement.
+
+    :param pk: The public key as bytes.
+    :param check_on_curve: Also reject u-coordinates on the twist (this costs one exponentiation).
+    :raises ValueError: If the key has the wrong length, has small order, or (optionally) is not on the curve.
+    """
+    if len(pk) != 32:
+        raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+    if is_low_order(pk):
+        raise ValueError("Public key is a point of small order.")
+    if check_on_curve and not is_on_curve(pk):
+        raise ValueError("Public key is not on the curve (it lies on the twist).")
+
+def validate_shared_secret(secret: BytesLike):
+    """
+    :raises ValueError: If the shared secret is all zeros.
+    """
+    if is_all_zero(secret):
+        raise ValueError("Shared secret is all zeros (low-order public key).")
+
+def validate_public_keys(buf, check_on_curve: bool = False) -> list[bool]:
+    """
+    Validate every 32-byte public key of a packed arena (see encoding.py), returning one flag per key.
+    """
+    view = memoryview(buf).cast("B")
+    if len(view) % 32 != 0:
+        raise ValueError(f"Key arena length must be a multiple of 32 bytes. Provided length: {len(view)}")
+
+    flags = []
+    for i in range(0, len(view), 32):
+        pk = view[i:i + 32].tobytes()
+        flags.append(pk not in LOW_ORDER_ENCODINGS and (not check_on_curve or is_on_curve(pk)))
+    return flags
@@ -0,0 +1,148 @@
+from .defaults import A24
+from .field import batch_inv, fmul
+
+try:
+    import numpy as np
+except ImportError: # numpy is an optional dependency, only needed for this backend
+    np = None
+
+# Field elements of many lanes are stored as a (10, N) int64 array of limbs in radix 2^25.5 (as in ref10):
+# limb i holds 26 bits for even i and 25 bits for odd i, i.e. a = sum_i a[i] * 2^ceil(25.5*i).
+# All lanes run the same Montgomery ladder step at once, so the per-key interpreter overhead becomes array work.
+LIMBS = 10
+LIMB_BITS = [26 if i % 2 == 0 else 25 for i in range(LIMBS)]
+LIMB_OFFSETS = [sum(LIMB_BITS[:i]) for i in range(LIMBS)]
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("The vectorized backend requires numpy (pip install numpy).")
+    return np
+
+def to_limbs(values: list[int]):
+    """
+    Convert a list of field elements into a (10, N) limb array.
+    """
+    np = _require_numpy()
+    out = np.empty((LIMBS, len(values)), dtype=np.int64)
+    for i, (bits, offset) in enumerate(zip(LIMB_BITS, LIMB_OFFSETS)):
+        mask = (1 << bits) - 1
+        out[i] = [(v >> offset) & mask for v in values]
+    return out
+
+def from_limbs(limbs) -> list[int]:
+    """
+    Convert a (10, N) limb array back into a list of (non-reduced) integers.
+    """
+    return [sum(int(limb) << offset for limb, offset in zip(column, LIMB_OFFSETS)) for column in limbs.T.tolist()]
+
+class _LimbArithmetic:
+    def __init__(self):
+        np = _require_numpy()
+        self.bits = np.array(LIMB_BITS, dtype=np.int64)[:, None]
+        self.masks = (np.int64(1) << self.bits) - 1
+        # carries out of limb i go into limb i+1; the carry out of limb 9 wraps into limb 0 multiplied by 19
+        self.wrap = np.array([19] + [1] * (LIMBS - 1), dtype=np.int64)[:, None]
+
+        # Product f[i] * g[j] lands in limb (i + j) mod 10; it picks up a factor 2 when i and j are both odd
+        # (two 25-bit limbs) and a factor 19 when it wraps around, since 2^255 = 19 (mod p).
+        # rows[i][k] selects the matching row of the stacked (g, 2g, 19g, 38g) array for j = k - i (mod 10).
+        self.rows = []
+        for i in range(LIMBS):
+            row = []
+            for k in range(LIMBS):
+                j = (k - i) % LIMBS
+                variant = (1 if i % 2 == 1 and j % 2 == 1 else 0) + (2 if i > k else 0)
+                row.append(variant * LIMBS + j)
+            self.rows.append(np.array(row))
+
+    def carry(self, h):
+        """
+        Two rounds of parallel carry propagation; brings limbs from < 2^63 back to roughly 26 bits.
+        """
+        np = _require_numpy()
+        for _ in range(2):
+            c = h >> self.bits
+            h = (h & self.masks) + np.roll(c, 1, axis=0) * self.wrap
+        return h
+
+    def mul(self, f, g):
+        # Inputs are sums/differences of two carried values (|limb| < 2^27.1), so the 10 products per limb
+        # (each at most 2^54.2 * 38) stay below 2^63 and cannot overflow int64.
+        np = _require_numpy()
+        G = np.concatenate((g, 2 * g, 19 * g, 38 * g))
+        h = f[0] * G[self.rows[0]]
+        for i in range(1, LIMBS):
+            h += f[i] * G[self.rows[i]]
+        return self.carry(h)
+
+    def mul_small(self, f, c: int):
+        return self.carry(f * c)
+
+def montgomery_ladder_vectorized(ks: list[int], xs: list[int]) -> list[int]:
+    """
+    Perform the Montgomery ladder on many lanes at once.
+    Args:
+        ks (list[int]): The scalar multipliers (each below 2^255).
+        xs (list[int]): The x-coordinates of the points to be multiplied (ks[i] is used with xs[i]).
+
+    Bit-exact with montgomery_ladder: the final divisions share one inversion (see batch_inv).
+
+    Returns:
+        list[int]: The x-coordinates of the resulting points, in input order.
+    """
+    np = _require_numpy()
+    if len(ks) != len(xs):
+        raise ValueError(f"Number of scalars and x-coordinates must match. Provided: {len(ks)} and {len(xs)}")
+    if len(ks) == 0:
+        return []
+
+    arith = _LimbArithmetic()
+    mul = arith.mul
+
+    n = len(ks)
+    packed = np.frombuffer(b"".join(k.to_bytes(32, "little") for k in ks), dtype=np.uint8).reshape(n, 32)
+    bits = np.ascontiguousarray(np.unpackbits(packed, axis=1, bitorder="little").T.astype(np.int64))
+
+    x_1 = to_limbs(xs)
+    x_2 = np.zeros((LIMBS, n), dtype=np.int64)
+    x_2[0] = 1
+    z_2 = np.zeros((LIMBS, n), dtype=np.int64)
+    x_3 = x_1.copy()
+    z_3 = x_2.copy()
+    swap = np.zeros(n, dtype=np.int64)
+
+    for t in range(254, -1, -1):
+        k_t = bits[t]
+        swap = swap ^ k_t
+
+        # Conditional swap as a masked select: mask is all ones in lanes that swap, zero elsewhere
+        mask = -swap
+        d = mask & (x_2 ^ x_3)
+        x_2, x_3 = x_2 ^ d, x_3 ^ d
+        d = mask & (z_2 ^ z_3)
+        z_2, z_3 = z_2 ^ d, z_3 ^ d
+        swap = k_t
+
+        A = x_2 + z_2
+        AA = mul(A, A)
+        B = x_2 - z_2
+        BB = mul(B, B)
+        E = AA - BB
+        C = x_3 + z_3
+        D = x_3 - z_3
+        DA = mul(D, A)
+        CB = mul(C, B)
+
+        DA_plus_CB = DA + CB
+        DA_minus_CB = DA - CB
+        x_3 = mul(DA_plus_CB, DA_plus_CB)
+        z_3 = mul(x_1, mul(DA_minus_CB, DA_minus_CB))
+        x_2 = mul(AA, BB)
+        z_2 = mul(E, AA + arith.mul_small(E, A24))
+
+    mask = -swap
+    x_2 = x_2 ^ (mask & (x_2 ^ x_3))
+    z_2 = z_2 ^ (mask & (z_2 ^ z_3))
+
+    z_invs = batch_inv(from_limbs(z_2))
+    return [fmul(x, z_inv) for x, z_inv in zip(from_limbs(x_2), z_invs)]
@@ -1,24 +1,73 @@
-from .encoding import clamp_scalar, decode_x_coordinate, decode_scalar, encode_x_coordinate
-from .methods import montgomery_ladder, double_and_add
+from .encoding import BytesLike, clamp_scalar, decode_x_coordinate, decode_scalar, encode_x_coordinate, encode_x_coordinate_into, encode_x_coordinates_into, _output_view
+from .methods import montgomery_ladder, montgomery_ladder_projective, montgomery_ladder_point, double_and_add, wnaf_mult, edwards_mult, edwards_mult_projective
+from .vectorized import montgomery_ladder_vectorized
+from .validation import validate_public_key, validate_shared_secret
+from .fixed_base import fixed_base_mult, fixed_base_mult_projective
+from .field import batch_inv, fmul
 from .defaults import BASE_X, BASE_Y
-from .point import Point, is_infinity
+from .point import Point, PointAtInfinity, is_infinity
+from .instrumentation import Instrumentation
+from collections.abc import Sequence
 from os import urandom
 from enum import Enum
 
 class X25519Algorithm(Enum):
     LADDER = "ladder"
     DOUBLE_AND_ADD = "double_and_add"
+    VECTORIZED = "vectorized"
+    WNAF = "wnaf"
+    EDWARDS = "edwards"
+
+# Methods timed by X25519.enable_instrumentation. Calls between them are recorded at every level
+# (derive_public_key also records the x25519_base call it makes).
+INSTRUMENTED_METHODS = ("x25519", "x25519_base", "derive_public_key", "generate_private_key")
 
 class X25519:
-    def __init__(self, algorithm: X25519Algorithm = X25519Algorithm.LADDER):
+    def __init__(self, algorithm: X25519Algorithm = X25519Algorithm.LADDER, wnaf_width: int = 4, validate: bool = False):
         """
         Initialize the X25519 class with the specified algorithm.
         
-        :param algorithm: The method to use for scalar multiplication (double_and_add or ladder).
+        :param algorithm: The method to use for scalar multiplication (double_and_add, ladder, vectorized, wnaf or edwards).
+                          The vectorized ladder needs numpy and only pays off for large batches.
+        :param wnaf_width: The window width used by the wnaf and edwards algorithms.
+        :param validate: Reject small-order public keys before any scalar multiplication, and all-zero shared secrets
+                         after it (see validation.py).
         """
+        if wnaf_width < 2:
+            raise ValueError(f"Window width must be at least 2. Provided: {wnaf_width}")
+
         self.algorithm = algorithm
+        self.wnaf_width = wnaf_width
+        self.validate = validate
         self.base_point = Point(BASE_X, BASE_Y)
         self.base_x_bytes = encode_x_coordinate(BASE_X)
+        self.instrumentation: Instrumentation | None = None
+
+    def enable_instrumentation(self, instrumentation: Instrumentation | None = None) -> Instrumentation:
+        """
+        Start recording call counts and latency histograms of the instrumented methods of this instance.
+        The methods are only wrapped while instrumentation is enabled, so a disabled instance has no overhead at all.
+
+        :param instrumentation: Where to record (defaults to a new Instrumentation); can be shared between instances.
+        :return: The Instrumentation in use, for snapshots and span callbacks.
+        """
+        self.disable_instrumentation()
+        if instrumentation is None:
+            instrumentation = Instrumentation()
+        for name in INSTRUMENTED_METHODS:
+            setattr(self, name, instrumentation.wrap(name, getattr(self, name)))
+        self.instrumentation = instrumentation
+        return instrumentation
+
+    def disable_instrumentation(self):
+        """
+        Stop recording and restore the plain methods (recorded statistics stay in the Instrumentation).
+        """
+        if self.instrumentation is None:
+            return
+        for name in INSTRUMENTED_METHODS:
+            del self.__dict__[name]
+        self.instrumentation = None
 
     def scalar_mult(self, k: int, x: int) -> bytes:
         """
@@ -28,18 +77,59 @@ class X25519:
         :param x: The x-coordinate to multiply.
         :return: The resulting x-coordinate as bytes.
         """
+        return encode_x_coordinate(self._scalar_mult_x(k, x))
+
+    def _scalar_mult_x(self, k: int, x: int) -> int:
         if self.algorithm == X25519Algorithm.LADDER:
             result = montgomery_ladder(k, x)
-        elif self.algorithm == X25519Algorithm.DOUBLE_AND_ADD:
-            result = double_and_add(k, Point(x))
+        elif self.algorithm in (X25519Algorithm.DOUBLE_AND_ADD, X25519Algorithm.WNAF):
+            if self.algorithm == X25519Algorithm.DOUBLE_AND_ADD:
+                result = double_and_add(k, Point(x))
+            else:
+                result = wnaf_mult(k, Point(x), self.wnaf_width)
             if is_infinity(result):
                 raise ValueError("Resulting point is at infinity.")
             assert isinstance(result, Point), "Result must be a Point after infinity check"
             result = result.x
+        elif self.algorithm == X25519Algorithm.VECTORIZED:
+            result = montgomery_ladder_vectorized([k], [x])[0]
+        elif self.algorithm == X25519Algorithm.EDWARDS:
+            result = edwards_mult(k, x, self.wnaf_width)
         else:
             raise ValueError(f"Unsupported algorithm: {self.algorithm}")
         
-        return encode_x_coordinate(result)
+        return result
+
+    def scalar_mult_base(self, k: int) -> bytes:
+        """
+        Perform scalar multiplication on the base point using the specified algorithm.
+        With the ladder and edwards algorithms, this uses the precomputed fixed-base table instead (same output, several times faster).
+        
+        :param k: The scalar multiplier.
+        :return: The resulting x-coordinate as bytes.
+        """
+        return encode_x_coordinate(self._scalar_mult_base_x(k))
+
+    def _scalar_mult_base_x(self, k: int) -> int:
+        if self.algorithm in (X25519Algorithm.LADDER, X25519Algorithm.EDWARDS):
+            return fixed_base_mult(k)
+        return self._scalar_mult_x(k, self.base_point.x)
+
+    def scalar_mult_point(self, k: int, Pt: Point) -> Point | PointAtInfinity:
+        """
+        Perform scalar multiplication on a full point, returning the full point k*P.
+        The ladder-based algorithms (ladder, vectorized, edwards) recover y from the ladder registers without
+        any square root; double_and_add and wnaf compute on (x, y) points directly.
+        
+        :param k: The scalar multiplier (0 <= k < 2^255 for the ladder).
+        :param Pt: The point to multiply.
+        :return: The resulting point.
+        """
+        if self.algorithm == X25519Algorithm.DOUBLE_AND_ADD:
+            return double_and_add(k, Pt)
+        if self.algorithm == X25519Algorithm.WNAF:
+            return wnaf_mult(k, Pt, self.wnaf_width)
+        return montgomery_ladder_point(k, Pt)
 
     def x25519_base(self, sk: bytes) -> bytes:
         """
@@ -50,8 +140,7 @@ class X25519:
         """
         if len(sk) != 32:
             raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
-        k = decode_scalar(sk)
-        return self.scalar_mult(k, self.base_point.x)
+        return self.scalar_mult_base(decode_scalar(sk))
     
     def x25519(self, sk: bytes, pk: bytes) -> bytes:
         """
@@ -66,10 +155,172 @@ class X25519:
         if len(pk) != 32:
             raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
         
+        if self.validate:
+            validate_public_key(pk)
+        
         k = decode_scalar(sk) # This includes clamping as well (see encoding.py)
         x = decode_x_coordinate(pk)
-        return self.scalar_mult(k, x)
+        result = self.scalar_mult(k, x)
+        if self.validate:
+            validate_shared_secret(result)
+        return result
     
+    def x25519_batch(self, sks: Sequence[BytesLike], pks: Sequence[BytesLike]) -> list[bytes]:
+        """
+        Perform X25519 for many (private key, public key) pairs at once.
+        With the ladder and edwards algorithms, the projective results share a single field inversion.
+        
+        :param sks: The private keys (bytes-like objects).
+        :param pks: The public keys (bytes-like objects, pks[i] is used with sks[i]).
+        :return: The resulting shared secrets as bytes, in input order.
+        """
+        if len(sks) != len(pks):
+            raise ValueError(f"Number of private keys and public keys must match. Provided: {len(sks)} and {len(pks)}")
+        for sk, pk in zip(sks, pks):
+            if len(sk) != 32:
+                raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+            if len(pk) != 32:
+                raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+            if self.validate:
+                validate_public_key(pk)
+
+        results = self._x25519_batch(sks, pks)
+        if self.validate:
+            for result in results:
+                validate_shared_secret(result)
+        return results
+
+    def _x25519_batch(self, sks: Sequence[BytesLike], pks: Sequence[BytesLike]) -> list[bytes]:
+        return [encode_x_coordinate(x) for x in self._x25519_batch_x(sks, pks)]
+
+    def _x25519_batch_x(self, sks: Sequence[BytesLike], pks: Sequence[BytesLike]) -> list[int]:
+        """
+        Affine x-coordinates of the shared secrets (inputs already checked).
+        """
+        if self.algorithm == X25519Algorithm.VECTORIZED:
+            return montgomery_ladder_vectorized([decode_scalar(sk) for sk in sks], [decode_x_coordinate(pk) for pk in pks])
+        if self.algorithm == X25519Algorithm.EDWARDS:
+            results = [edwards_mult_projective(decode_scalar(sk), decode_x_coordinate(pk), self.wnaf_width) for sk, pk in zip(sks, pks)]
+            return self._affine_batch(results)
+        if self.algorithm != X25519Algorithm.LADDER:
+            return [self._scalar_mult_x(decode_scalar(sk), decode_x_coordinate(pk)) for sk, pk in zip(sks, pks)]
+
+        results = [montgomery_ladder_projective(decode_scalar(sk), decode_x_coordinate(pk)) for sk, pk in zip(sks, pks)]
+        return self._affine_batch(results)
+
+    def x25519_base_batch(self, sks: Sequence[BytesLike]) -> list[bytes]:
+        """
+        Perform X25519 scalar multiplication with the base point for many private keys at once.
+        With the ladder and edwards algorithms, this uses the fixed-base table and a single shared field inversion.
+        
+        :param sks: The private keys (bytes-like objects).
+        :return: The resulting public keys as bytes, in input order.
+        """
+        for sk in sks:
+            if len(sk) != 32:
+                raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+
+        return [encode_x_coordinate(x) for x in self._x25519_base_batch_x(sks)]
+
+    def _x25519_base_batch_x(self, sks: Sequence[BytesLike]) -> list[int]:
+        if self.algorithm == X25519Algorithm.VECTORIZED:
+            return montgomery_ladder_vectorized([decode_scalar(sk) for sk in sks], [BASE_X] * len(sks))
+        if self.algorithm not in (X25519Algorithm.LADDER, X25519Algorithm.EDWARDS):
+            return [self._scalar_mult_base_x(decode_scalar(sk)) for sk in sks]
+
+        results = [fixed_base_mult_projective(decode_scalar(sk)) for sk in sks]
+        return self._affine_batch(results)
+
+    @staticmethod
+    def _affine_batch(results: list[tuple[int, int]]) -> list[int]:
+        """
+        Convert projective (X:Z) x-coordinates to affine x-coordinates with one inversion overall.
+        """
+        z_invs = batch_inv([z for _, z in results])
+        return [fmul(x, z_inv) for (x, _), z_inv in zip(results, z_invs)]
+
+    # The *_into variants write their results into a caller-provided writable buffer (bytearray, memoryview, mmap, ...)
+    # instead of returning new bytes objects, and accept any bytes-like keys (e.g. memoryview slices of a receive buffer).
+    # If they raise, the output buffer may already hold some of the results.
+
+    def x25519_into(self, sk: BytesLike, pk: BytesLike, out, offset: int = 0):
+        """
+        Same as x25519, writing the shared secret into out[offset:offset + 32].
+
+        :param sk: The private key (any 32-byte bytes-like object).
+        :param pk: The public key (any 32-byte bytes-like object).
+        :param out: The writable output buffer.
+        :param offset: Where to write the shared secret in out.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        if len(pk) != 32:
+            raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+        _output_view(out, offset, 1) # fail before the scalar multiplication, not after
+
+        if self.validate:
+            validate_public_key(pk)
+
+        encode_x_coordinate_into(self._scalar_mult_x(decode_scalar(sk), decode_x_coordinate(pk)), out, offset)
+        if self.validate:
+            validate_shared_secret(memoryview(out).cast("B")[offset:offset + 32])
+
+    def x25519_base_into(self, sk: BytesLike, out, offset: int = 0):
+        """
+        Same as x25519_base, writing the public key into out[offset:offset + 32].
+
+        :param sk: The private key (any 32-byte bytes-like object).
+        :param out: The writable output buffer.
+        :param offset: Where to write the public key in out.
+        """
+        if len(sk) != 32:
+            raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        _output_view(out, offset, 1)
+
+        encode_x_coordinate_into(self._scalar_mult_base_x(decode_scalar(sk)), out, offset)
+
+    def x25519_batch_into(self, sks: Sequence[BytesLike], pks: Sequence[BytesLike], out, offset: int = 0, stride: int = 32):
+        """
+        Same as x25519_batch, writing the i-th shared secret at out[offset + i * stride].
+
+        :param sks: The private keys (bytes-like objects).
+        :param pks: The public keys (bytes-like objects, pks[i] is used with sks[i]).
+        :param out: The writable output buffer.
+        :param offset: Where to write the first shared secret in out.
+        :param stride: Distance in bytes between consecutive shared secrets (32 for a packed arena).
+        """
+        if len(sks) != len(pks):
+            raise ValueError(f"Number of private keys and public keys must match. Provided: {len(sks)} and {len(pks)}")
+        for sk, pk in zip(sks, pks):
+            if len(sk) != 32:
+                raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+            if len(pk) != 32:
+                raise ValueError(f"Public key must be 32 bytes long. Provided length: {len(pk)}")
+            if self.validate:
+                validate_public_key(pk)
+        view = _output_view(out, offset, len(sks), stride)
+
+        encode_x_coordinates_into(self._x25519_batch_x(sks, pks), view, offset, stride)
+        if self.validate:
+            for i in range(offset, offset + len(sks) * stride, stride):
+                validate_shared_secret(view[i:i + 32])
+
+    def x25519_base_batch_into(self, sks: Sequence[BytesLike], out, offset: int = 0, stride: int = 32):
+        """
+        Same as x25519_base_batch, writing the i-th public key at out[offset + i * stride].
+
+        :param sks: The private keys (bytes-like objects).
+        :param out: The writable output buffer.
+        :param offset: Where to write the first public key in out.
+        :param stride: Distance in bytes between consecutive public keys (32 for a packed arena).
+        """
+        for sk in sks:
+            if len(sk) != 32:
+                raise ValueError(f"Private key must be 32 bytes long. Provided length: {len(sk)}")
+        view = _output_view(out, offset, len(sks), stride)
+
+        encode_x_coordinates_into(self._x25519_base_batch_x(sks), view, offset, stride)
+
     @staticmethod
     def generate_private_key() -> bytes:
         """